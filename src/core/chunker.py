@@ -1,5 +1,6 @@
 """Log chunking utilities for managing context windows and token limits."""
 
+import functools
 import math
 from typing import List, Dict, Any, Optional, Tuple
 import pandas as pd
@@ -38,7 +39,12 @@ class LogChunk:
         self.start_index = start_index
         self.end_index = end_index
         self.focus_entity = focus_entity
-        self.token_estimate = self._estimate_tokens()
+        self._text_cache: Dict[bool, str] = {}
+    
+    @functools.cached_property
+    def token_estimate(self) -> int:
+        """Estimated token count, computed on first access and then reused."""
+        return self._estimate_tokens()
     
     def _estimate_tokens(self) -> int:
         """
@@ -63,10 +69,14 @@ class LogChunk:
         Returns:
             Text representation of the chunk
         """
-        if include_headers:
-            return self.logs.to_string(index=False)
-        else:
-            return self.logs.to_string(index=False, header=False)
+        # Chunks are not modified after creation, so render each variant once
+        if include_headers not in self._text_cache:
+            if include_headers:
+                text = self.logs.to_string(index=False)
+            else:
+                text = self.logs.to_string(index=False, header=False)
+            self._text_cache[include_headers] = text
+        return self._text_cache[include_headers]
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -326,28 +336,21 @@ class LogChunker:
                 return []
             
             # Sort by timestamp
-            logs = logs.sort_values(timestamp_column)
+            logs = logs.sort_values(timestamp_column, kind="stable")
             
             chunks = []
             chunk_id = 0
             
-            # Create time windows
-            start_time = logs[timestamp_column].min()
-            end_time = logs[timestamp_column].max()
-            current_time = start_time
-            
-            window_delta = pd.Timedelta(minutes=window_minutes)
-            
-            while current_time <= end_time:
-                window_end = current_time + window_delta
-                
-                # Filter logs in this window
-                mask = (
-                    (logs[timestamp_column] >= current_time) &
-                    (logs[timestamp_column] < window_end)
+            # Bucket rows into fixed windows anchored at the first timestamp
+            windows = logs.groupby(
+                pd.Grouper(
+                    key=timestamp_column,
+                    freq=f"{window_minutes}min",
+                    origin="start"
                 )
-                window_logs = logs[mask]
-                
+            )
+            
+            for _, window_logs in windows:
                 if len(window_logs) > 0:
                     chunk = LogChunk(
                         logs=window_logs,
@@ -357,8 +360,6 @@ class LogChunker:
                     )
                     chunks.append(chunk)
                     chunk_id += 1
-                
-                current_time = window_end
             
             logger.info(
                 f"Created {len(chunks)} time-window chunks "
@@ -514,18 +515,27 @@ class LogChunker:
         if not chunks:
             return {"total_chunks": 0}
         
-        token_counts = [chunk.token_estimate for chunk in chunks]
-        entry_counts = [len(chunk) for chunk in chunks]
+        # Single pass over the chunk list
+        token_counts = []
+        total_entries = 0
+        chunks_with_entities = 0
+        for chunk in chunks:
+            token_counts.append(chunk.token_estimate)
+            total_entries += len(chunk)
+            if chunk.focus_entity:
+                chunks_with_entities += 1
+        
+        total_tokens = sum(token_counts)
         
         stats = {
             "total_chunks": len(chunks),
-            "total_entries": sum(entry_counts),
-            "total_tokens": sum(token_counts),
-            "avg_tokens_per_chunk": sum(token_counts) / len(chunks),
+            "total_entries": total_entries,
+            "total_tokens": total_tokens,
+            "avg_tokens_per_chunk": total_tokens / len(chunks),
             "max_tokens": max(token_counts),
             "min_tokens": min(token_counts),
-            "avg_entries_per_chunk": sum(entry_counts) / len(chunks),
-            "chunks_with_entities": sum(1 for c in chunks if c.focus_entity),
+            "avg_entries_per_chunk": total_entries / len(chunks),
+            "chunks_with_entities": chunks_with_entities,
         }
         
         return stats
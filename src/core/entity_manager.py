@@ -1,8 +1,11 @@
 """Entity management for extraction, normalization, and queue-based exploration."""
 
+import functools
+import heapq
+import itertools
 import re
 from typing import List, Dict, Set, Optional, Any, Tuple
-from collections import deque
+import numpy as np
 import pandas as pd
 
 from ..utils.logger import setup_logger
@@ -12,6 +15,12 @@ from ..utils.validators import sanitize_entity_name
 logger = setup_logger()
 
 
+@functools.lru_cache(maxsize=256)
+def _compile_entity_pattern(pattern: str) -> "re.Pattern":
+    """Compile an entity pattern from config once (case-insensitive)."""
+    return re.compile(pattern, re.IGNORECASE)
+
+
 class Entity:
     """
     Represents an entity extracted from logs.
@@ -41,10 +50,16 @@ class Entity:
         self.confidence = confidence
         self.related_entities = related_entities or []
         self.explored = False
+        self._seen: Set[int] = set(self.occurrences)
     
     def add_occurrence(self, index: int):
         """Add a log index where this entity appears."""
-        if index not in self.occurrences:
+        # Set lookup instead of scanning the list; resync if the list was
+        # modified from outside
+        if len(self._seen) != len(self.occurrences):
+            self._seen = set(self.occurrences)
+        if index not in self._seen:
+            self._seen.add(index)
             self.occurrences.append(index)
     
     def mark_explored(self):
@@ -90,7 +105,10 @@ class EntityQueue:
         Args:
             max_depth: Maximum exploration depth
         """
-        self.queue = deque()
+        # Heap of (-priority, depth, insertion_seq, entity): highest priority
+        # first, then shallowest, then first added
+        self.queue: List[Tuple[int, int, int, Entity]] = []
+        self._seq = itertools.count()
         self.processed: Set[Tuple[str, str]] = set()
         self.entities: Dict[Tuple[str, str], Entity] = {}
         self.max_depth = max_depth
@@ -114,8 +132,8 @@ class EntityQueue:
         """
         entity_key = (entity.entity_type, entity.entity_value)
         
-        # Skip if already processed
-        if entity_key in self.processed:
+        # Skip if already processed or already waiting in the queue
+        if entity_key in self.processed or entity_key in self.entities:
             return
         
         # Skip if too deep
@@ -124,7 +142,7 @@ class EntityQueue:
             return
         
         # Add to queue
-        self.queue.append((priority, depth, entity))
+        heapq.heappush(self.queue, (-priority, depth, next(self._seq), entity))
         self.entities[entity_key] = entity
         
         logger.debug(f"Added {entity} to queue (priority={priority}, depth={depth})")
@@ -139,10 +157,8 @@ class EntityQueue:
         if not self.queue:
             return None
         
-        # Sort by priority (descending) and depth (ascending)
-        self.queue = deque(sorted(self.queue, key=lambda x: (-x[0], x[1])))
-        
-        priority, depth, entity = self.queue.popleft()
+        # Highest priority, then lowest depth (O(log n) per pop)
+        _, depth, _, entity = heapq.heappop(self.queue)
         entity_key = (entity.entity_type, entity.entity_value)
         
         # Mark as processed
@@ -176,8 +192,25 @@ class EntityManager:
     def __init__(self):
         """Initialize entity manager."""
         self.entities: Dict[Tuple[str, str], Entity] = {}
+        self._alias_map = self._build_alias_map()
         logger.info("Initialized EntityManager")
     
+    @staticmethod
+    def _build_alias_map() -> Dict[str, str]:
+        """
+        Map every lowercased alias and type name to its entity type.
+        
+        Returns:
+            Dictionary of term -> entity type; the first type listed in
+            config wins when a term appears under several types
+        """
+        alias_map: Dict[str, str] = {}
+        for entity_type, alias_list in config.entity_mappings.get("aliases", {}).items():
+            for alias in alias_list:
+                alias_map.setdefault(alias.lower(), entity_type)
+            alias_map.setdefault(entity_type.lower(), entity_type)
+        return alias_map
+    
     def normalize_entity(self, user_term: str) -> Tuple[str, str]:
         """
         Normalize user term to canonical entity type.
@@ -188,21 +221,9 @@ class EntityManager:
         Returns:
             Tuple of (entity_type, normalized_term)
         """
-        user_term_lower = user_term.lower().strip()
-        
-        # Check all aliases
-        aliases = config.entity_mappings.get("aliases", {})
-        
-        for entity_type, alias_list in aliases.items():
-            if user_term_lower in [a.lower() for a in alias_list]:
-                return entity_type, user_term
-            
-            # Check if the term itself is the entity type
-            if user_term_lower == entity_type.lower():
-                return entity_type, user_term
-        
-        # Default: treat as-is
-        return "unknown", user_term
+        # Exact alias or entity type name; default: treat as-is
+        entity_type = self._alias_map.get(user_term.lower().strip(), "unknown")
+        return entity_type, user_term
     
     def get_related_entities(self, entity_type: str) -> List[str]:
         """
@@ -240,7 +261,7 @@ class EntityManager:
         
         for pattern in patterns:
             try:
-                regex = re.compile(pattern, re.IGNORECASE)
+                regex = _compile_entity_pattern(pattern)
                 matches = regex.findall(text)
                 
                 for match in matches:
@@ -281,10 +302,20 @@ class EntityManager:
             search_columns = logs.select_dtypes(include=['object']).columns.tolist()
         
         extracted_entities: Dict[Tuple[str, str], Entity] = {}
+        sanitized: Dict[str, str] = {}
         
         logger.info(f"Extracting {len(entity_types)} entity types from {len(logs)} log entries")
         logger.info(f"Search columns: {search_columns}")
         
+        # Factorize each column once: patterns then run on distinct cell
+        # values only, and rows are mapped back through their codes. This is
+        # shared by every entity type, so adding types doesn't re-read columns
+        factorized: Dict[str, Tuple[np.ndarray, List[str]]] = {}
+        for col in search_columns:
+            if col in logs.columns and col not in factorized:
+                codes, uniques = pd.factorize(logs[col].to_numpy(dtype=object))
+                factorized[col] = (codes, [str(u) for u in uniques])
+        
         for entity_type in entity_types:
             logger.info(f"Processing entity type: {entity_type}")
             patterns = config.get_entity_pattern(entity_type)
@@ -295,28 +326,32 @@ class EntityManager:
             for pattern in patterns:
                 logger.debug(f"  Using pattern: {pattern}")
                 try:
-                    regex = re.compile(pattern, re.IGNORECASE)
+                    regex = _compile_entity_pattern(pattern)
                     
                     # Search in specified columns
                     for col in search_columns:
-                        if col not in logs.columns:
+                        if col not in factorized:
                             continue
                         
                         logger.debug(f"  Searching column: {col} ({len(logs)} rows)")
-                        row_count = 0
-                        for idx, value in logs[col].items():
-                            row_count += 1
-                            if row_count % 1000 == 0:
-                                logger.debug(f"    Processed {row_count}/{len(logs)} rows in column {col}")
-                            
-                            if pd.isna(value):
-                                continue
-                            
-                            matches = regex.findall(str(value))
-                            
-                            for match in matches:
-                                entity_value = match if isinstance(match, str) else match[0]
-                                entity_value = sanitize_entity_name(entity_value)
+                        
+                        codes, uniques = factorized[col]
+                        unique_matches = [regex.findall(value) for value in uniques]
+                        hit_codes = np.flatnonzero([bool(m) for m in unique_matches])
+                        if not len(hit_codes):
+                            continue
+                        
+                        # Walk matching rows in order so occurrences stay sorted
+                        hit_rows = np.flatnonzero(np.isin(codes, hit_codes))
+                        for idx, code in zip(logs.index[hit_rows], codes[hit_rows].tolist()):
+                            for match in unique_matches[code]:
+                                raw_value = match if isinstance(match, str) else match[0]
+                                
+                                # Same values recur across rows; sanitize each once
+                                entity_value = sanitized.get(raw_value)
+                                if entity_value is None:
+                                    entity_value = sanitize_entity_name(raw_value)
+                                    sanitized[raw_value] = entity_value
                                 
                                 if not entity_value:
                                     continue
@@ -358,17 +393,17 @@ class EntityManager:
         Returns:
             Entity object with occurrence information
         """
-        occurrences = []
+        occurrences = set()
         
-        # Search all text columns
+        # Search all text columns (case-insensitive substring match)
         for col in logs.select_dtypes(include=['object']).columns:
-            for idx, value in logs[col].items():
-                if pd.isna(value):
-                    continue
-                
-                # Case-insensitive search
-                if entity_value.lower() in str(value).lower():
-                    occurrences.append(idx)
+            mask = logs[col].astype(str).str.contains(
+                entity_value,
+                case=False,
+                na=False,
+                regex=False
+            ) & logs[col].notna()
+            occurrences.update(logs.index[mask].tolist())
         
         # Determine entity type if not provided
         if entity_type is None:
@@ -377,7 +412,7 @@ class EntityManager:
         entity = Entity(
             entity_type=entity_type,
             entity_value=entity_value,
-            occurrences=list(set(occurrences))  # Remove duplicates
+            occurrences=sorted(occurrences)
         )
         
         entity_key = (entity_type, entity_value)
@@ -440,17 +475,13 @@ class EntityManager:
         
         entity_logs = logs.iloc[entity.occurrences]
         
-        # Extract entities of related types from those logs
-        for related_type in related_entity_types:
-            extracted = self.extract_all_entities_from_logs(
-                entity_logs,
-                entity_types=[related_type]
-            )
-            
-            for entity_key, related_entity in extracted.items():
-                if len(related_entities) >= max_related:
-                    break
-                related_entities.append(related_entity)
+        # Extract entities of all related types in one pass over those logs
+        # (results stay grouped by type, in related-type order)
+        extracted = self.extract_all_entities_from_logs(
+            entity_logs,
+            entity_types=related_entity_types
+        )
+        related_entities = list(itertools.islice(extracted.values(), max_related))
         
         logger.info(f"Found {len(related_entities)} related entities for {entity}")
         return related_entities
@@ -495,14 +526,12 @@ class EntityManager:
         Returns:
             List of Entity objects sorted by occurrence count
         """
-        entities = list(self.entities.values())
+        entities = self.entities.values()
         
         # Filter by type if specified
         if entity_type:
-            entities = [e for e in entities if e.entity_type == entity_type]
-        
-        # Sort by occurrence count
-        entities.sort(key=lambda e: len(e.occurrences), reverse=True)
+            entities = (e for e in entities if e.entity_type == entity_type)
         
-        return entities[:limit]
+        # Partial selection instead of a full sort; ties keep insertion order
+        return heapq.nlargest(limit, entities, key=lambda e: len(e.occurrences))
 
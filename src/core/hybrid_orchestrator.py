@@ -2,6 +2,7 @@
 Hybrid Orchestrator - Main coordinator for the hybrid architecture
 """
 
+import asyncio
 from typing import Dict, Any, Optional
 from .query_normalizer import QueryNormalizer
 from .plan_executor import PlanExecutor
@@ -154,6 +155,22 @@ class HybridOrchestrator:
                 "error": str(e)
             }
     
+    async def aprocess(self, query: str) -> Dict[str, Any]:
+        """
+        Async variant of process().
+        
+        Queries are independent of each other, so callers can run several
+        with asyncio.gather() and overlap the time spent waiting on the LLM.
+        
+        Args:
+            query: Natural language query
+            
+        Returns:
+            Same result dict as process()
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.process, query)
+    
     def process_simple(self, query: str) -> str:
         """
         Simple interface - just returns the answer string.
@@ -10,7 +10,9 @@ Main orchestrator for iterative ReAct architecture where:
 import json
 import logging
 import re
-from typing import Dict, Any, Optional, Tuple
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 import pandas as pd
 
 from .react_state import ReActState
@@ -26,6 +28,10 @@ from ..utils.exceptions import LLMError
 
 logger = setup_logger()
 
+# Compiled once; used on every LLM decision
+_JSON_BLOCK_RE = re.compile(r'```(?:json)?\s*(\{.*?\})\s*```', re.DOTALL)
+_TRAILING_COMMA_RE = re.compile(r',\s*([}\]])')
+
 
 class IterativeReactOrchestrator:
     """
@@ -138,7 +144,6 @@ class IterativeReactOrchestrator:
         except Exception as e:
             print(f"\n✗ ERROR: {e}")
             if self.verbose:
-                import traceback
                 traceback.print_exc()
             
             state.finalize(f"Error: {str(e)}")
@@ -152,6 +157,27 @@ class IterativeReactOrchestrator:
                 "summary": state.get_summary()
             }
     
+    def process_batch(self, queries: List[str], max_workers: int = 4) -> List[Dict[str, Any]]:
+        """
+        Process several independent queries concurrently.
+        
+        Each query runs process() with its own ReActState, so their LLM
+        round-trips and tool calls overlap instead of running back to back.
+        Progress printed by the queries interleaves.
+        
+        Args:
+            queries: Natural language queries
+            max_workers: Maximum queries in flight at once
+            
+        Returns:
+            Result dictionaries (see process()), in the same order as queries
+        """
+        if not queries:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(queries))) as executor:
+            return list(executor.map(self.process, queries))
+    
     def process_simple(self, query: str) -> str:
         """
         Simple interface - just returns the answer string.
@@ -251,7 +277,6 @@ class IterativeReactOrchestrator:
                 
             except Exception as e:
                 logger.error(f"Iteration failed: {e}")
-                import traceback
                 traceback.print_exc()
                 
                 # Don't count as consecutive failure, just log and continue
@@ -286,7 +311,8 @@ class IterativeReactOrchestrator:
             response = self.llm_client.generate(
                 prompt=prompt,
                 format_json=False,  # Let Modelfile handle JSON instruction
-                temperature=0.3
+                temperature=0.3,
+                stop_on_json=True  # Act as soon as the decision JSON is complete
             )
             
             # Parse JSON
@@ -345,8 +371,7 @@ class IterativeReactOrchestrator:
             pass
         
         # Strategy 2: Extract JSON from markdown code blocks
-        json_pattern = r'```(?:json)?\s*(\{.*?\})\s*```'
-        matches = re.findall(json_pattern, response, re.DOTALL)
+        matches = _JSON_BLOCK_RE.findall(response)
         if matches:
             try:
                 parsed = json.loads(matches[0])
@@ -365,7 +390,7 @@ class IterativeReactOrchestrator:
             json_str = json_str.strip()
             
             # Remove trailing commas before } or ]
-            json_str = re.sub(r',\s*([}\]])', r'\1', json_str)
+            json_str = _TRAILING_COMMA_RE.sub(r'\1', json_str)
             
             parsed = json.loads(json_str)
             logger.debug("Extracted JSON parse successful")
@@ -482,7 +507,6 @@ class IterativeReactOrchestrator:
         except Exception as e:
             error_msg = f"Tool execution failed: {e}"
             logger.error(error_msg)
-            import traceback
             traceback.print_exc()
             
             return ToolResult(
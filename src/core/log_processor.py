@@ -1,10 +1,12 @@
 """Log processing engine for reading, filtering, and extracting log data."""
 
 import csv
+import importlib.util
 import re
 from typing import List, Dict, Any, Optional, Iterator, Tuple
 from pathlib import Path
 from datetime import datetime
+import numpy as np
 import pandas as pd
 
 from ..utils.logger import setup_logger
@@ -30,7 +32,7 @@ class LogProcessor:
         Initialize log processor with file path and schema.
         
         Args:
-            log_file_path: Path to the CSV log file
+            log_file_path: Path to the CSV (or Parquet) log file
             schema_name: Schema name from log_schema.yaml
         """
         self.log_file_path = Path(log_file_path)
@@ -39,8 +41,10 @@ class LogProcessor:
         if not self.log_file_path.exists():
             raise LogFileError(f"Log file not found: {log_file_path}")
         
-        if not self.log_file_path.suffix.lower() == '.csv':
-            raise LogFileError(f"Only CSV files are supported: {log_file_path}")
+        if self.log_file_path.suffix.lower() not in ('.csv', '.parquet'):
+            raise LogFileError(f"Only CSV and Parquet files are supported: {log_file_path}")
+        
+        self.is_parquet = self.log_file_path.suffix.lower() == '.parquet'
         
         # Load schema configuration
         self.columns = config.get_log_columns(schema_name)
@@ -56,6 +60,13 @@ class LogProcessor:
         Yields:
             DataFrame chunks
         """
+        if self.is_parquet:
+            # Parquet is columnar; read once and slice into row chunks
+            logs = self.read_all_logs()
+            for start in range(0, len(logs), chunk_size):
+                yield logs.iloc[start:start + chunk_size]
+            return
+        
         try:
             logger.debug(f"Reading CSV in chunks of {chunk_size} rows")
             
@@ -70,20 +81,38 @@ class LogProcessor:
         except Exception as e:
             raise LogFileError(f"Error reading CSV file: {e}")
     
-    def read_all_logs(self) -> pd.DataFrame:
+    def read_all_logs(self, engine: str = "c") -> pd.DataFrame:
         """
         Read entire log file into memory.
         Use this for smaller files or when you need all data at once.
         
+        Args:
+            engine: pandas CSV parser ("c", "python" or "pyarrow").
+                "pyarrow" uses the multi-threaded Arrow parser and falls
+                back to "c" if pyarrow is not installed. Ignored for
+                Parquet files.
+        
         Returns:
             DataFrame with all log entries
         """
+        if self.is_parquet:
+            try:
+                df = pd.read_parquet(self.log_file_path)
+                logger.info(f"Loaded {len(df)} log entries")
+                return df
+            except Exception as e:
+                raise LogFileError(f"Error reading log file: {e}")
+        
+        engine = _resolve_csv_engine(engine)
+        
         try:
-            logger.debug(f"Reading entire log file: {self.log_file_path}")
+            logger.debug(f"Reading entire log file: {self.log_file_path} (engine={engine})")
+            
             df = pd.read_csv(
                 self.log_file_path,
                 encoding='utf-8',
-                on_bad_lines='skip'
+                on_bad_lines='skip',
+                engine=engine
             )
             logger.info(f"Loaded {len(df)} log entries")
             return df
@@ -212,27 +241,39 @@ class LogProcessor:
             search_columns = logs.select_dtypes(include=['object']).columns.tolist()
         
         entities_found: Dict[str, List[int]] = {}
+        # Row indices already recorded per entity, for O(1) duplicate checks
+        seen: Dict[str, set] = {}
         
         try:
+            # Factorize each column once; patterns run on distinct values only
+            # (NaN gets code -1 and is never matched), as in EntityManager
+            factorized = {}
+            for col in search_columns:
+                if col in logs.columns and col not in factorized:
+                    codes, uniques = pd.factorize(logs[col].to_numpy(dtype=object))
+                    factorized[col] = (codes, [str(u) for u in uniques])
+            
             for pattern in patterns:
                 regex = re.compile(pattern, re.IGNORECASE)
                 
-                for col in search_columns:
-                    if col not in logs.columns:
+                for col, (codes, uniques) in factorized.items():
+                    unique_matches = [regex.findall(value) for value in uniques]
+                    hit_codes = np.flatnonzero([bool(m) for m in unique_matches])
+                    if not len(hit_codes):
                         continue
                     
-                    for idx, value in logs[col].items():
-                        if pd.isna(value):
-                            continue
-                        
-                        matches = regex.findall(str(value))
-                        for match in matches:
+                    # Walk matching rows in order so index lists stay sorted
+                    hit_rows = np.flatnonzero(np.isin(codes, hit_codes))
+                    for idx, code in zip(logs.index[hit_rows], codes[hit_rows].tolist()):
+                        for match in unique_matches[code]:
                             entity_value = match if isinstance(match, str) else match[0]
                             
                             if entity_value not in entities_found:
                                 entities_found[entity_value] = []
+                                seen[entity_value] = set()
                             
-                            if idx not in entities_found[entity_value]:
+                            if idx not in seen[entity_value]:
+                                seen[entity_value].add(idx)
                                 entities_found[entity_value].append(idx)
             
             logger.info(f"Extracted {len(entities_found)} unique '{entity_type}' entities")
@@ -399,3 +440,10 @@ class LogProcessor:
         
         return stats
 
+
+def _resolve_csv_engine(engine: str) -> str:
+    """Return the requested CSV engine, downgrading pyarrow to c if unavailable."""
+    if engine == "pyarrow" and importlib.util.find_spec("pyarrow") is None:
+        logger.debug("pyarrow not installed, using the C CSV engine")
+        return "c"
+    return engine
@@ -48,8 +48,20 @@ class QueryParser:
             "trace", "flow", "timeline", "sequence", "track", "follow"
         ]
         
+        # One compiled alternation per keyword group: a single scan of the
+        # query instead of one substring check per keyword
+        self._trace_re = self._compile_keywords(self.trace_keywords)
+        self._analysis_re = self._compile_keywords(self.analysis_keywords)
+        self._aggregation_re = self._compile_keywords(self.aggregation_keywords)
+        self._relationship_re = self._compile_keywords(self.relationship_keywords)
+        
         logger.info("Initialized QueryParser")
     
+    @staticmethod
+    def _compile_keywords(keywords: List[str]) -> "re.Pattern":
+        """Compile a keyword list into one literal-substring alternation."""
+        return re.compile("|".join(re.escape(kw) for kw in keywords))
+    
     def parse_query(self, query: str) -> Dict[str, Any]:
         """
         Parse user query into structured format.
@@ -66,19 +78,19 @@ class QueryParser:
         
         # Detect query type (order matters!)
         # 1. Trace queries
-        if any(kw in query_lower for kw in self.trace_keywords):
+        if self._trace_re.search(query_lower):
             result = self._parse_trace_query(query_lower)
         
         # 2. Analysis queries
-        elif any(kw in query_lower for kw in self.analysis_keywords):
+        elif self._analysis_re.search(query_lower):
             result = self._parse_analysis_query(query_lower)
         
         # 3. Aggregation queries (must check before relationship)
-        elif any(kw in query_lower for kw in self.aggregation_keywords):
+        elif self._aggregation_re.search(query_lower):
             result = self._parse_aggregation_query(query_lower)
         
         # 4. Relationship queries (but check if it's really a relationship)
-        elif any(kw in query_lower for kw in self.relationship_keywords):
+        elif self._relationship_re.search(query_lower):
             # Check if it's actually a relationship or just "find X"
             result = self._parse_relationship_query(query_lower)
             
@@ -6,6 +6,7 @@ and context building.
 """
 
 import logging
+from itertools import islice
 from typing import Any, Dict, Optional
 import pandas as pd
 
@@ -146,7 +147,7 @@ class ResultSummarizer:
         
         # Regular dict
         parts = []
-        for k, v in list(data.items())[:3]:  # First 3 keys
+        for k, v in islice(data.items(), 3):  # First 3 keys
             if isinstance(v, (list, dict)):
                 parts.append(f"{k}: {type(v).__name__}")
             else:
@@ -5,12 +5,16 @@ Intelligently compresses large log datasets into compact, entity-aware summaries
 that fit in LLM context while preserving important information.
 """
 
+import copy
+import hashlib
+import heapq
 import json
 import logging
+import threading
 import yaml
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
-from collections import Counter, defaultdict
+from typing import Dict, List, Any, Optional, Sequence, Tuple
+from collections import Counter, OrderedDict, defaultdict
 from datetime import datetime
 import pandas as pd
 import re
@@ -52,12 +56,17 @@ class EntityExtractor:
                 mapping[alias.lower()] = entity_type
         return mapping
     
-    def extract_from_logs(self, logs: pd.DataFrame) -> Dict[str, Dict[str, int]]:
+    def extract_from_logs(
+        self,
+        logs: pd.DataFrame,
+        log_texts: Optional[Sequence[Any]] = None
+    ) -> Dict[str, Dict[str, int]]:
         """
         Extract all entities from logs.
         
         Args:
             logs: DataFrame with logs
+            log_texts: Pre-materialized '_source.log' values (taken from logs if None)
             
         Returns:
             Dict of entity_type -> {value: count}
@@ -67,7 +76,16 @@ class EntityExtractor:
         if logs.empty or '_source.log' not in logs.columns:
             return dict(entities)
         
-        for log_entry in logs['_source.log']:
+        # Field names repeat across every log, so resolve each raw name to
+        # its entity type once instead of lower()-ing it on every row
+        field_to_entity = self.field_to_entity
+        resolved: Dict[str, Optional[str]] = {}
+        skip_values = ('<null>', 'null', '')
+        
+        if log_texts is None:
+            log_texts = logs['_source.log'].to_numpy()
+        
+        for log_entry in log_texts:
             try:
                 # Parse JSON (handle double-escaped quotes)
                 json_str = self._extract_json(log_entry)
@@ -79,11 +97,16 @@ class EntityExtractor:
                 # Extract each field
                 for field_name, field_value in log_json.items():
                     # Skip empty or null
-                    if not field_value or field_value in ['<null>', 'null', '']:
+                    if not field_value or field_value in skip_values:
                         continue
                     
                     # Check if this is an entity field
-                    entity_type = self.field_to_entity.get(field_name.lower())
+                    if field_name in resolved:
+                        entity_type = resolved[field_name]
+                    else:
+                        entity_type = field_to_entity.get(field_name.lower())
+                        resolved[field_name] = entity_type
+                    
                     if entity_type:
                         entities[entity_type][str(field_value)] += 1
                         
@@ -115,13 +138,19 @@ class LogAggregator:
     Aggregate logs by entities and calculate statistics.
     """
     
-    def aggregate(self, logs: pd.DataFrame, entities: Dict[str, Dict[str, int]]) -> Dict[str, Any]:
+    def aggregate(
+        self,
+        logs: pd.DataFrame,
+        entities: Dict[str, Dict[str, int]],
+        log_texts: Optional[Sequence[Any]] = None
+    ) -> Dict[str, Any]:
         """
         Aggregate logs and compute statistics.
         
         Args:
             logs: DataFrame with logs
             entities: Extracted entities from EntityExtractor
+            log_texts: Pre-materialized '_source.log' values (taken from logs if None)
             
         Returns:
             Dict with aggregation results
@@ -147,14 +176,17 @@ class LogAggregator:
                 "top_5": sorted_values[:5]
             }
         
-        # Parse logs for severity, functions, messages
-        severities = []
-        functions = []
-        messages = []
-        timestamps = []
+        # Parse logs for severity, functions, messages, counting as we go
+        # rather than collecting per-row lists and counting afterwards
+        sev_counter = Counter()
+        func_counter = Counter()
+        msg_counter = Counter()
+        
+        if log_texts is None and '_source.log' in logs.columns:
+            log_texts = logs['_source.log'].to_numpy()
         
-        if '_source.log' in logs.columns:
-            for log_entry in logs['_source.log']:
+        if log_texts is not None:
+            for log_entry in log_texts:
                 try:
                     json_str = self._extract_json(log_entry)
                     if not json_str:
@@ -163,28 +195,25 @@ class LogAggregator:
                     log_json = json.loads(json_str)
                     
                     if 'Severity' in log_json:
-                        severities.append(log_json['Severity'])
+                        sev_counter[log_json['Severity']] += 1
                     if 'Function' in log_json:
-                        functions.append(log_json['Function'])
+                        func_counter[log_json['Function']] += 1
                     if 'Message' in log_json:
-                        messages.append(log_json['Message'])
+                        msg_counter[log_json['Message']] += 1
                         
                 except (json.JSONDecodeError, TypeError):
                     continue
         
         # Severity distribution
-        if severities:
-            sev_counter = Counter(severities)
+        if sev_counter:
             stats["severity_dist"] = dict(sev_counter.most_common())
         
         # Top functions
-        if functions:
-            func_counter = Counter(functions)
+        if func_counter:
             stats["top_functions"] = dict(func_counter.most_common(5))
         
         # Top messages
-        if messages:
-            msg_counter = Counter(messages)
+        if msg_counter:
             stats["top_messages"] = dict(msg_counter.most_common(5))
         
         # Time range
@@ -234,13 +263,19 @@ class SmartSampler:
         self.importance_weight = importance_weight
         self.diversity_weight = 1.0 - importance_weight
     
-    def sample(self, logs: pd.DataFrame, entities: Dict[str, Dict[str, int]]) -> List[Dict[str, Any]]:
+    def sample(
+        self,
+        logs: pd.DataFrame,
+        entities: Dict[str, Dict[str, int]],
+        log_texts: Optional[Sequence[Any]] = None
+    ) -> List[Dict[str, Any]]:
         """
         Select representative log samples.
         
         Args:
             logs: DataFrame with logs
             entities: Extracted entities
+            log_texts: Pre-materialized '_source.log' values (taken from logs if None)
             
         Returns:
             List of sampled log dictionaries
@@ -248,90 +283,121 @@ class SmartSampler:
         if logs.empty:
             return []
         
+        # Work on plain column values rather than iterrows(), which builds a
+        # Series per row; each log's JSON is parsed once and reused for both
+        # scoring and the output dict.
+        if log_texts is not None:
+            log_entries = log_texts
+        elif '_source.log' in logs.columns:
+            log_entries = logs['_source.log'].to_numpy()
+        else:
+            log_entries = [None] * len(logs)
+        
+        if '_source.@timestamp' in logs.columns:
+            timestamps = logs['_source.@timestamp'].tolist()
+        else:
+            timestamps = None
+        
+        # Every known entity value, for the relationship-log factor
+        entity_keys = set()
+        for values in entities.values():
+            entity_keys.update(values)
+        
         # Calculate scores for each log
         log_scores = []
         
-        for idx, row in logs.iterrows():
-            score = self._calculate_log_score(row, entities)
-            log_scores.append((idx, score, row))
+        for pos, log_entry in enumerate(log_entries):
+            log_json, parse_failed = self._parse_log(log_entry)
+            score = self._calculate_log_score(log_json, entities, entity_keys)
+            log_scores.append((pos, score, log_json, parse_failed))
         
-        # Sort by score
-        log_scores.sort(key=lambda x: x[1], reverse=True)
+        # Select top N by score (stable: ties keep log order)
+        top = heapq.nlargest(self.max_samples, log_scores, key=lambda x: x[1])
         
-        # Select top N
         selected_logs = []
-        for idx, score, row in log_scores[:self.max_samples]:
-            log_dict = self._row_to_dict(row)
+        for pos, score, log_json, parse_failed in top:
+            timestamp = timestamps[pos] if timestamps is not None else None
+            log_dict = self._to_log_dict(log_json, parse_failed, timestamp, timestamps is not None)
             if log_dict:
                 selected_logs.append(log_dict)
         
         return selected_logs
     
-    def _calculate_log_score(self, row: pd.Series, entities: Dict[str, Dict[str, int]]) -> float:
+    def _parse_log(self, log_entry: Any) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """
+        Parse the JSON payload of a log entry.
+        
+        Returns:
+            (parsed JSON or None, whether parsing raised)
         """
-        Calculate importance score for a log entry.
+        json_str = self._extract_json(log_entry)
+        if not json_str:
+            return None, False
+        
+        try:
+            return json.loads(json_str), False
+        except (json.JSONDecodeError, TypeError):
+            return None, True
+    
+    def _calculate_log_score(
+        self,
+        log_json: Optional[Dict[str, Any]],
+        entities: Dict[str, Dict[str, int]],
+        entity_keys: set
+    ) -> float:
+        """
+        Calculate importance score for a parsed log entry.
         
         Higher score = more important
         """
         score = 0.0
         
-        # Parse log JSON
-        if '_source.log' not in row:
+        if not isinstance(log_json, dict):
             return score
         
-        try:
-            json_str = self._extract_json(row['_source.log'])
-            if not json_str:
-                return score
-            
-            log_json = json.loads(json_str)
-            
-            # Importance factors
-            
-            # 1. Severity (ERROR > WARN > INFO > DEBUG)
-            severity = log_json.get('Severity', 'INFO')
-            severity_scores = {'ERROR': 10, 'WARN': 5, 'INFO': 1, 'DEBUG': 0.5}
-            score += severity_scores.get(severity, 0) * self.importance_weight
-            
-            # 2. Rare entities (inverse frequency)
-            for entity_type, values in entities.items():
-                for field_name, field_value in log_json.items():
-                    if str(field_value) in values:
-                        # Rare entities get higher score
-                        frequency = values[str(field_value)]
-                        rarity_score = 1.0 / (frequency + 1)  # Avoid division by zero
-                        score += rarity_score * self.diversity_weight
-            
-            # 3. Multiple entities (relationship logs)
-            entity_count = sum(1 for field in log_json.keys() 
-                             if any(field in aliases for aliases in entities.values()))
-            score += entity_count * 0.5
-            
-        except (json.JSONDecodeError, TypeError):
-            pass
+        # Importance factors
+        
+        # 1. Severity (ERROR > WARN > INFO > DEBUG)
+        severity = log_json.get('Severity', 'INFO')
+        severity_scores = {'ERROR': 10, 'WARN': 5, 'INFO': 1, 'DEBUG': 0.5}
+        score += severity_scores.get(severity, 0) * self.importance_weight
+        
+        # 2. Rare entities (inverse frequency)
+        field_values = [str(field_value) for field_value in log_json.values()]
+        for values in entities.values():
+            for field_value in field_values:
+                if field_value in values:
+                    # Rare entities get higher score
+                    frequency = values[field_value]
+                    rarity_score = 1.0 / (frequency + 1)  # Avoid division by zero
+                    score += rarity_score * self.diversity_weight
+        
+        # 3. Multiple entities (relationship logs)
+        entity_count = sum(1 for field in log_json if field in entity_keys)
+        score += entity_count * 0.5
         
         return score
     
-    def _row_to_dict(self, row: pd.Series) -> Optional[Dict[str, Any]]:
-        """Convert DataFrame row to dict with parsed JSON."""
-        try:
-            log_dict = {}
-            
-            # Parse JSON
-            if '_source.log' in row:
-                json_str = self._extract_json(row['_source.log'])
-                if json_str:
-                    log_json = json.loads(json_str)
-                    log_dict.update(log_json)
-            
-            # Add timestamp if available
-            if '_source.@timestamp' in row:
-                log_dict['timestamp'] = row['_source.@timestamp']
-            
-            return log_dict if log_dict else None
-            
-        except Exception:
+    def _to_log_dict(
+        self,
+        log_json: Optional[Dict[str, Any]],
+        parse_failed: bool,
+        timestamp: Any,
+        has_timestamp: bool
+    ) -> Optional[Dict[str, Any]]:
+        """Build the sample dict from a parsed log and its timestamp."""
+        if parse_failed:
             return None
+        
+        log_dict = {}
+        if log_json:
+            log_dict.update(log_json)
+        
+        # Add timestamp if available
+        if has_timestamp:
+            log_dict['timestamp'] = timestamp
+        
+        return log_dict if log_dict else None
     
     def _extract_json(self, log_entry: str) -> Optional[str]:
         """Extract and unescape JSON from log entry."""
@@ -381,9 +447,10 @@ class SummaryFormatter:
         # Available fields (metadata only - no values!)
         if stats.get('entities'):
             lines.append("\n🔍 Available Fields:")
-            for entity_type, entity_data in stats['entities'].items():
-                unique = entity_data['unique_count']
-                lines.append(f"  • {entity_type}: {unique} unique values available")
+            lines.extend(
+                f"  • {entity_type}: {entity_data['unique_count']} unique values available"
+                for entity_type, entity_data in stats['entities'].items()
+            )
         
         # Data quality indicators (generic)
         if stats.get('severity_dist'):
@@ -404,7 +471,8 @@ class SmartSummarizer:
     def __init__(self, 
                  config_dir: str = "config",
                  max_samples: int = 10,
-                 importance_weight: float = 0.6):
+                 importance_weight: float = 0.6,
+                 cache_size: int = 32):
         """
         Initialize smart summarizer.
         
@@ -412,11 +480,15 @@ class SmartSummarizer:
             config_dir: Path to config directory
             max_samples: Maximum sample logs to include
             importance_weight: Weight for importance sampling (0-1)
+            cache_size: Max summaries memoized by DataFrame content (0 disables)
         """
         self.entity_extractor = EntityExtractor(config_dir)
         self.aggregator = LogAggregator()
         self.sampler = SmartSampler(max_samples, importance_weight)
         self.formatter = SummaryFormatter()
+        self.cache_size = cache_size
+        self._summary_cache: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()
+        self._cache_lock = threading.Lock()  # queries may summarize concurrently
     
     def summarize(self, logs: pd.DataFrame) -> Dict[str, Any]:
         """
@@ -442,25 +514,50 @@ class SmartSummarizer:
                     "samples": []
                 }
             
+            # Same content summarized before (e.g. a repeated tool search)?
+            cache_key = self._cache_key(logs)
+            if cache_key is not None:
+                with self._cache_lock:
+                    cached = self._summary_cache.get(cache_key)
+                    if cached is not None:
+                        self._summary_cache.move_to_end(cache_key)
+                if cached is not None:
+                    logger.debug("Using cached summary")
+                    return copy.deepcopy(cached)
+            
+            # Materialize the log text column once for all three passes
+            log_texts = None
+            if '_source.log' in logs.columns:
+                log_texts = logs['_source.log'].to_numpy()
+            
             # Step 1: Extract entities
-            entities = self.entity_extractor.extract_from_logs(logs)
+            entities = self.entity_extractor.extract_from_logs(logs, log_texts=log_texts)
             
             # Step 2: Aggregate
-            stats = self.aggregator.aggregate(logs, entities)
+            stats = self.aggregator.aggregate(logs, entities, log_texts=log_texts)
             
             # Step 3: Smart sample
-            samples = self.sampler.sample(logs, entities)
+            samples = self.sampler.sample(logs, entities, log_texts=log_texts)
             
             # Step 4: Format
             summary_text = self.formatter.format(stats, samples)
             
-            return {
+            result = {
                 "summary_text": summary_text,
                 "entities": entities,
                 "stats": stats,
                 "samples": samples
             }
             
+            if cache_key is not None:
+                cached = copy.deepcopy(result)
+                with self._cache_lock:
+                    self._summary_cache[cache_key] = cached
+                    if len(self._summary_cache) > self.cache_size:
+                        self._summary_cache.popitem(last=False)
+            
+            return result
+            
         except Exception as e:
             logger.error(f"Summarization failed: {e}", exc_info=True)
             return {
@@ -469,4 +566,27 @@ class SmartSummarizer:
                 "stats": {"total_count": len(logs) if isinstance(logs, pd.DataFrame) else 0},
                 "samples": []
             }
-
+    
+    def _cache_key(self, logs: pd.DataFrame) -> Optional[Tuple]:
+        """
+        Build a content hash key for a DataFrame.
+        
+        Returns:
+            Hashable key, or None if caching is disabled or hashing fails
+        """
+        if self.cache_size <= 0:
+            return None
+        
+        try:
+            row_hashes = pd.util.hash_pandas_object(logs, index=False).to_numpy()
+            content_hash = hashlib.blake2b(row_hashes.tobytes(), digest_size=16).hexdigest()
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Could not hash logs for summary cache: {e}")
+            return None
+        
+        return (len(logs), tuple(logs.columns), content_hash)
+    
+    def clear_cache(self) -> None:
+        """Drop all memoized summaries."""
+        with self._cache_lock:
+            self._summary_cache.clear()
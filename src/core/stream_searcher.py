@@ -5,10 +5,18 @@ Fast, memory-efficient search without loading entire file into memory.
 """
 
 import csv
+import functools
+import importlib.util
 import json
+import mmap
 import re
-from typing import List, Dict, Any, Optional, Iterator
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from itertools import islice
+from typing import List, Dict, Any, Optional, Iterator, Tuple
 from pathlib import Path
+import numpy as np
 import pandas as pd
 
 from ..utils.logger import setup_logger
@@ -17,6 +25,144 @@ from ..utils.exceptions import LogFileError
 logger = setup_logger()
 
 
+# Characters that give a regex meaning beyond a plain substring
+_REGEX_METACHARS = frozenset(".^$*+?{}[]\\|()")
+
+
+def _is_literal_pattern(search_term: str) -> bool:
+    """True if a regex search term is just an ASCII substring (no metacharacters)."""
+    return search_term.isascii() and _REGEX_METACHARS.isdisjoint(search_term)
+
+
+# Term characters whose matches can differ between raw CSV lines and the
+# parsed fields (quoting, separators) or the re-serialized JSON that
+# _row_matches also searches (whitespace, brackets, escapes)
+_RAW_SCAN_UNSAFE_CHARS = frozenset('",{}[]\\ \t\r\n\x0b\x0c')
+_RAW_SCAN_SPLIT = re.compile("[" + re.escape("".join(sorted(_RAW_SCAN_UNSAFE_CHARS))) + "]")
+
+# Characters of a JSON number, whose text json.dumps may rewrite (1e2 -> 100.0)
+_JSON_NUMBER_CHARS = frozenset("0123456789.eE+-")
+
+
+def _raw_scan_needle(search_term: str) -> Optional[str]:
+    """
+    Pick the piece of a plain term that every matching row has in its raw line.
+    
+    Args:
+        search_term: Plain (non-regex) search term
+        
+    Returns:
+        The longest piece free of unsafe characters and not number-only (the
+        whole term when it qualifies), or None if no piece does
+    """
+    if not search_term.isascii():
+        return None
+    pieces = [
+        piece for piece in _RAW_SCAN_SPLIT.split(search_term)
+        if not _JSON_NUMBER_CHARS.issuperset(piece)
+    ]
+    return max(pieces, key=len, default=None)
+
+
+# Bytes handled at once when checking or case-folding a file without
+# copying it whole
+_SCAN_BLOCK_SIZE = 8 << 20
+
+
+def _is_raw_scannable_file(data) -> bool:
+    """
+    True if the raw lines of a CSV file can stand in for its parsed rows.
+    
+    The file must hold one record per line (no newline inside a quoted
+    field, i.e. an even number of quotes before every newline, as csv.writer
+    and pandas write it), be ASCII, and have no JSON escapes (\\/, \\uXXXX)
+    that json.dumps would rewrite. The file is read one block at a time.
+    
+    Args:
+        data: mmap (or bytes) of the CSV file
+    """
+    quote_parity = 0
+    for block_start in range(0, len(data), _SCAN_BLOCK_SIZE):
+        # One byte past the block so an escape split across blocks is seen
+        block = data[block_start:block_start + _SCAN_BLOCK_SIZE + 1]
+        if not block.isascii():
+            return False
+        arr = np.frombuffer(block, dtype=np.uint8)
+        
+        backslashes = np.flatnonzero(arr[:-1] == ord('\\'))
+        if np.isin(arr[backslashes + 1], (ord('/'), ord('u'))).any():
+            return False
+        
+        # Every newline must follow an even number of quotes (file-wide)
+        arr = arr[:_SCAN_BLOCK_SIZE]
+        quotes = np.flatnonzero(arr == ord('"'))
+        newlines = np.flatnonzero(arr == ord('\n'))
+        if ((np.searchsorted(quotes, newlines) + quote_parity) & 1).any():
+            return False
+        quote_parity = (quote_parity + len(quotes)) & 1
+    return True
+
+
+def _lowered_finder(data, block_size: int = _SCAN_BLOCK_SIZE):
+    """
+    Return a find(needle, pos) over data lowercased one block at a time.
+    
+    Each block is lowered together with len(needle) - 1 bytes of the next,
+    so matches across block edges are found without a whole-file copy.
+    
+    Args:
+        data: mmap (or bytes) to search
+        block_size: Bytes lowered at once
+    """
+    window_start, window = -1, b""
+    
+    def find(needle: bytes, pos: int) -> int:
+        nonlocal window_start, window
+        while pos < len(data):
+            block_start = pos - pos % block_size
+            if block_start != window_start:
+                window_start = block_start
+                window = data[block_start:block_start + block_size + len(needle) - 1].lower()
+            hit = window.find(needle, pos - block_start)
+            if hit != -1:
+                return block_start + hit
+            pos = block_start + block_size
+        return -1
+    
+    return find
+
+
+def _iter_line_spans(data, needle: bytes, find=None) -> Iterator[Tuple[int, int]]:
+    """
+    Yield (start, end) of each data line (header skipped) containing needle.
+    
+    Args:
+        data: bytes or mmap of the CSV file
+        needle: Bytes to find
+        find: find(needle, pos) to locate needle with (default data.find),
+            e.g. over a lowercased copy with the same offsets
+    """
+    find = find or data.find
+    pos = data.find(b"\n") + 1  # Skip header
+    while pos:
+        hit = find(needle, pos)
+        if hit == -1:
+            return
+        start = data.rfind(b"\n", 0, hit) + 1
+        end = data.find(b"\n", hit)
+        if end == -1:
+            end = len(data)
+        yield start, end
+        # Continue on the next line so each row counts once
+        pos = end + 1
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_search_pattern(search_term: str, flags: int) -> "re.Pattern":
+    """Compile a regex search term once per (term, flags)."""
+    return re.compile(search_term, flags)
+
+
 class StreamSearcher:
     """
     Stream-based CSV search engine.
@@ -27,16 +173,51 @@ class StreamSearcher:
     - JSON field search (for _source.log column)
     - Regex patterns
     - Case-sensitive/insensitive search
+    
+    Results are cached per search arguments, so repeated lookups of the same
+    value (common in ReAct loops and relationship BFS) skip the file scan.
+    The cache is dropped whenever the file's size or mtime changes.
+    
+    Plain-term searches scan the file's raw bytes and only parse matching
+    lines, provided the file has one record per line (see
+    _is_raw_scannable_file); otherwise every row is parsed.
     """
     
-    def __init__(self, csv_file_path: str):
+    def __init__(
+        self,
+        csv_file_path: str,
+        cache_size: int = 128,
+        engine: str = "stream",
+        keep_lowered_copy: bool = False
+    ):
         """
         Initialize stream searcher.
         
         Args:
             csv_file_path: Path to CSV log file
+            cache_size: Max number of search results to keep (0 disables caching)
+            engine: "stream" (row-by-row) or "pyarrow". "pyarrow" loads the
+                file once with Arrow's multi-threaded CSV reader and filters
+                it column-wise for plain searches (matching cell text only,
+                not re-serialized JSON); falls back to "stream" if pyarrow
+                is not installed
+            keep_lowered_copy: Keep a lowercased copy of the whole file in
+                memory so repeated case-insensitive searches don't fold it
+                again (off by default: it costs the file's size in RAM)
         """
         self.csv_file_path = Path(csv_file_path)
+        self.cache_size = cache_size
+        self.engine = _resolve_search_engine(engine)
+        self.keep_lowered_copy = keep_lowered_copy
+        self._search_cache: "OrderedDict[Tuple, pd.DataFrame]" = OrderedDict()
+        self._file_stamp: Optional[Tuple[int, int]] = None
+        self._cache_lock = threading.Lock()  # searchers are shared between tools/threads
+        self._copy_lock = threading.Lock()  # guards the raw-scan state and file copies below
+        self._scan_stamp: Optional[Tuple[int, int]] = None
+        self._raw_scannable = False
+        self._lowered: Optional[bytes] = None
+        self._arrow_table = None
+        self._arrow_stamp: Optional[Tuple[int, int]] = None
         
         if not self.csv_file_path.exists():
             raise LogFileError(f"CSV file not found: {csv_file_path}")
@@ -70,6 +251,39 @@ class StreamSearcher:
         Returns:
             DataFrame with matching rows
         """
+        cache_key = (
+            search_term,
+            tuple(columns) if columns else None,
+            case_sensitive,
+            regex,
+            max_results
+        )
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            logger.debug(f"Cache hit for search: '{search_term}'")
+            return cached
+        
+        # A cached unlimited search already holds the first max_results rows
+        if max_results:
+            cached = self._get_cached(cache_key[:-1] + (None,))
+            if cached is not None:
+                logger.debug(f"Cache hit for search: '{search_term}' (first {max_results})")
+                return cached.head(max_results)
+        
+        # A pattern without metacharacters is a plain substring: use the
+        # `in` path instead of the regex engine (the cache key keeps regex=True)
+        if regex and _is_literal_pattern(search_term):
+            regex = False
+        
+        if self.engine == "pyarrow" and not regex:
+            try:
+                df = self._arrow_search(search_term, columns, case_sensitive, max_results)
+            except Exception as e:
+                logger.warning(f"Arrow search failed ({e}), falling back to streaming search")
+            else:
+                self._store_cached(cache_key, df)
+                return df
+        
         logger.info(f"Streaming search for: '{search_term}' "
                    f"(case_sensitive={case_sensitive}, regex={regex})")
         
@@ -77,22 +291,16 @@ class StreamSearcher:
         if regex:
             flags = 0 if case_sensitive else re.IGNORECASE
             try:
-                pattern = re.compile(search_term, flags)
+                pattern = _compile_search_pattern(search_term, flags)
             except re.error as e:
                 logger.error(f"Invalid regex pattern: {e}")
                 return pd.DataFrame()
         else:
-            # For plain text, prepare comparison term
+            # For plain text, prepare comparison term (lowercased once, not per cell)
             compare_term = search_term if case_sensitive else search_term.lower()
         
         # Determine which column indices to search
-        if columns:
-            search_indices = [
-                i for i, col in enumerate(self.headers) 
-                if col in columns
-            ]
-        else:
-            search_indices = list(range(len(self.headers)))
+        search_indices = self._search_indices(columns)
         
         logger.debug(f"Searching in {len(search_indices)} columns")
         
@@ -101,35 +309,108 @@ class StreamSearcher:
         line_num = 0
         
         try:
-            with open(self.csv_file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                reader = csv.reader(f)
-                next(reader)  # Skip header
-                
-                for row in reader:
-                    line_num += 1
+            # Plain searches find candidate lines in the raw bytes and parse
+            # only those
+            raw_matches = None
+            if not regex:
+                raw_matches = self._raw_search(search_term, case_sensitive, max_results, columns)
+            
+            if raw_matches is not None:
+                matches = raw_matches
+            else:
+                with open(self.csv_file_path, 'r', encoding='utf-8', errors='ignore') as f:
+                    reader = csv.reader(f)
+                    next(reader)  # Skip header
                     
-                    # Check if this row matches
-                    if self._row_matches(row, search_term, search_indices, 
-                                        case_sensitive, regex, pattern if regex else None):
-                        matches.append(row)
+                    for row in reader:
+                        line_num += 1
                         
-                        # Stop if we hit max_results
-                        if max_results and len(matches) >= max_results:
-                            logger.debug(f"Hit max_results limit: {max_results}")
-                            break
+                        # Check if this row matches
+                        if self._row_matches(row, search_term if regex else compare_term,
+                                            search_indices, case_sensitive, regex,
+                                            pattern if regex else None):
+                            matches.append(row)
+                            
+                            # Stop if we hit max_results
+                            if max_results and len(matches) >= max_results:
+                                logger.debug(f"Hit max_results limit: {max_results}")
+                                break
         
         except Exception as e:
             logger.error(f"Error during streaming search: {e}")
             return pd.DataFrame()
         
-        logger.info(f"Found {len(matches)} matches out of {line_num} lines scanned")
-        
-        # Convert to DataFrame
-        if matches:
-            df = pd.DataFrame(matches, columns=self.headers)
-            return df
+        if raw_matches is not None:
+            logger.info(f"Found {len(matches)} matches (raw byte scan)")
         else:
-            return pd.DataFrame(columns=self.headers)
+            logger.info(f"Found {len(matches)} matches out of {line_num} lines scanned")
+        
+        # Convert to DataFrame; dtype=str keeps empty results the same
+        # string dtype as non-empty ones (Arrow-backed on pandas 3 with pyarrow)
+        df = pd.DataFrame(matches, columns=self.headers, dtype=str)
+        
+        self._store_cached(cache_key, df)
+        return df
+    
+    def _current_file_stamp(self) -> Tuple[int, int]:
+        """Return (size, mtime_ns) of the CSV file."""
+        stat = self.csv_file_path.stat()
+        return stat.st_size, stat.st_mtime_ns
+    
+    def _get_cached(self, key: Tuple) -> Optional[pd.DataFrame]:
+        """
+        Look up a cached search result.
+        
+        Returns a copy so callers can modify the result freely, or None on a
+        miss. Clears the cache if the file changed since it was filled.
+        """
+        if not self.cache_size:
+            return None
+        
+        try:
+            stamp = self._current_file_stamp()
+        except OSError:
+            stamp = None
+        
+        with self._cache_lock:
+            if stamp is None:
+                self._search_cache.clear()
+                return None
+            
+            if stamp != self._file_stamp:
+                self._search_cache.clear()
+                self._file_stamp = stamp
+                return None
+            
+            df = self._search_cache.get(key)
+            if df is None:
+                return None
+            
+            self._search_cache.move_to_end(key)
+            return df.copy()
+    
+    def _store_cached(self, key: Tuple, df: pd.DataFrame) -> None:
+        """Store a search result, evicting the least recently used entry."""
+        if not self.cache_size:
+            return
+        
+        with self._cache_lock:
+            self._search_cache[key] = df.copy()
+            self._search_cache.move_to_end(key)
+            while len(self._search_cache) > self.cache_size:
+                self._search_cache.popitem(last=False)
+    
+    def clear_cache(self) -> None:
+        """Drop all cached search results and any in-memory copy of the file."""
+        with self._cache_lock:
+            self._search_cache.clear()
+            self._file_stamp = None
+        with self._copy_lock:
+            self._scan_stamp = None
+            self._raw_scannable = False
+            self._lowered = None
+            self._arrow_table = None
+            self._arrow_stamp = None
     
     def _row_matches(
         self,
@@ -145,7 +426,8 @@ class StreamSearcher:
         
         Args:
             row: CSV row as list of strings
-            search_term: Search term
+            search_term: Search term (already lowercased for plain
+                case-insensitive search)
             search_indices: Column indices to search
             case_sensitive: Case-sensitive matching
             is_regex: Whether using regex
@@ -192,7 +474,8 @@ class StreamSearcher:
         
         Args:
             value: String value to check
-            search_term: Search term
+            search_term: Search term (already lowercased for plain
+                case-insensitive search)
             case_sensitive: Case-sensitive matching
             is_regex: Whether using regex
             pattern: Compiled regex pattern
@@ -206,7 +489,53 @@ class StreamSearcher:
             if case_sensitive:
                 return search_term in value
             else:
-                return search_term.lower() in value.lower()
+                return search_term in value.lower()
+    
+    def iter_search(
+        self,
+        search_term: str,
+        columns: Optional[List[str]] = None,
+        case_sensitive: bool = False,
+        regex: bool = False
+    ) -> Iterator[List[str]]:
+        """
+        Lazily yield matching rows without building a DataFrame.
+        
+        Nothing is cached; stop consuming (e.g. with itertools.islice) to
+        stop reading the file.
+        
+        Args:
+            search_term: Text/pattern to search for
+            columns: Specific columns to search (None = all columns)
+            case_sensitive: Case-sensitive matching
+            regex: Treat search_term as regex pattern
+            
+        Yields:
+            Matching CSV rows as lists of strings (in self.headers order)
+            
+        Raises:
+            re.error: If regex=True and the pattern is invalid
+        """
+        pattern = None
+        if regex and _is_literal_pattern(search_term):
+            regex = False
+        if regex:
+            flags = 0 if case_sensitive else re.IGNORECASE
+            pattern = _compile_search_pattern(search_term, flags)
+            compare_term = search_term
+        else:
+            compare_term = search_term if case_sensitive else search_term.lower()
+        
+        search_indices = self._search_indices(columns)
+        
+        with open(self.csv_file_path, 'r', encoding='utf-8', errors='ignore') as f:
+            reader = csv.reader(f)
+            next(reader)  # Skip header
+            
+            for row in reader:
+                if self._row_matches(row, compare_term, search_indices,
+                                    case_sensitive, regex, pattern):
+                    yield row
     
     def count_matches(
         self,
@@ -227,34 +556,194 @@ class StreamSearcher:
         """
         logger.info(f"Counting matches for: '{search_term}'")
         
-        # Prepare search term
-        compare_term = search_term if case_sensitive else search_term.lower()
+        try:
+            count = None
+            if not columns and _raw_scan_needle(search_term) == search_term:
+                # Every line containing the term is a match: no parsing needed
+                with self._raw_scan(search_term, case_sensitive) as scan:
+                    if scan is not None:
+                        find, raw, needle = scan
+                        count = sum(1 for _ in _iter_line_spans(raw, needle, find))
+            if count is None:
+                rows = self._raw_search(search_term, case_sensitive, None, columns)
+                count = len(rows) if rows is not None else None
+            if count is None:
+                count = sum(1 for _ in self.iter_search(search_term, columns, case_sensitive))
+        except Exception as e:
+            logger.error(f"Error counting matches: {e}")
+            return 0
+        
+        logger.info(f"Found {count} matches")
+        return count
+    
+    def _arrow_search(
+        self,
+        search_term: str,
+        columns: Optional[List[str]],
+        case_sensitive: bool,
+        max_results: Optional[int]
+    ) -> pd.DataFrame:
+        """
+        Filter the Arrow table for a plain term, OR-ing a mask per column.
+        
+        Args:
+            search_term: Plain text to search for
+            columns: Specific columns to search (None = all columns)
+            case_sensitive: Case-sensitive matching
+            max_results: Stop after N matches (None = unlimited)
+            
+        Returns:
+            DataFrame with matching rows (all columns as strings)
+        """
+        import pyarrow.compute as pc
         
-        # Determine which columns to search
+        table = self._load_arrow_table()
+        logger.info(f"Arrow search for: '{search_term}' (case_sensitive={case_sensitive})")
+        
+        mask = None
+        for idx in self._search_indices(columns):
+            column_mask = pc.match_substring(
+                table.column(idx), search_term, ignore_case=not case_sensitive
+            )
+            mask = column_mask if mask is None else pc.or_(mask, column_mask)
+        
+        matches = table.filter(mask) if mask is not None else table.slice(0, 0)
+        if max_results:
+            matches = matches.slice(0, max_results)
+        
+        logger.info(f"Found {matches.num_rows} matches out of {table.num_rows} rows")
+        return matches.to_pandas()
+    
+    def _load_arrow_table(self):
+        """Read the whole file into an Arrow table (all strings), reloading when it changes."""
+        import pyarrow as pa
+        from pyarrow import csv as pa_csv
+        
+        stamp = self._current_file_stamp()
+        with self._copy_lock:
+            if stamp != self._arrow_stamp:
+                self._arrow_table = pa_csv.read_csv(
+                    self.csv_file_path,
+                    read_options=pa_csv.ReadOptions(block_size=8 << 20),
+                    convert_options=pa_csv.ConvertOptions(
+                        column_types={col: pa.string() for col in self.headers},
+                        strings_can_be_null=False
+                    )
+                )
+                self._arrow_stamp = stamp
+            return self._arrow_table
+    
+    def _search_indices(self, columns: Optional[List[str]]) -> List[int]:
+        """Return the indices of the columns to search (all when columns is empty)."""
         if columns:
-            search_indices = [
+            return [
                 i for i, col in enumerate(self.headers) 
                 if col in columns
             ]
-        else:
-            search_indices = list(range(len(self.headers)))
+        return list(range(len(self.headers)))
+    
+    def _raw_search(
+        self,
+        search_term: str,
+        case_sensitive: bool,
+        max_results: Optional[int],
+        columns: Optional[List[str]] = None
+    ) -> Optional[List[List[str]]]:
+        """
+        Collect matches for a plain term, parsing only candidate lines.
         
-        count = 0
+        Lines are picked by a raw-bytes scan for the term (or its longest
+        safe piece); candidates are confirmed with _row_matches unless the
+        whole term was scanned for across all columns.
         
-        try:
-            with open(self.csv_file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                reader = csv.reader(f)
-                next(reader)  # Skip header
-                
-                for row in reader:
-                    if self._row_matches(row, search_term, search_indices, 
-                                        case_sensitive, False, None):
-                        count += 1
+        Args:
+            search_term: Plain text to search for
+            case_sensitive: Case-sensitive matching
+            max_results: Stop after N matches (None = unlimited)
+            columns: Specific columns to search (None = all columns)
+            
+        Returns:
+            Matching CSV rows, or None if the term or file needs the
+            row-by-row path
+        """
+        needle_term = _raw_scan_needle(search_term)
+        if needle_term is None:
+            return None
         
-        except Exception as e:
-            logger.error(f"Error counting matches: {e}")
-            return 0
+        with self._raw_scan(needle_term, case_sensitive) as scan:
+            if scan is None:
+                return None
+            find, raw, needle = scan
+            lines = (
+                raw[start:end].decode('utf-8')
+                for start, end in _iter_line_spans(raw, needle, find)
+            )
+            rows = csv.reader(lines)
+            
+            if columns or needle_term != search_term:
+                compare_term = search_term if case_sensitive else search_term.lower()
+                search_indices = self._search_indices(columns)
+                rows = (
+                    row for row in rows
+                    if self._row_matches(row, compare_term, search_indices,
+                                         case_sensitive, False)
+                )
+            
+            return list(islice(rows, max_results or None))
+    
+    @contextmanager
+    def _raw_scan(self, search_term: str, case_sensitive: bool):
+        """
+        Set up a raw-bytes scan for a term from _raw_scan_needle().
         
-        logger.info(f"Found {count} matches")
-        return count
+        Yields:
+            (find, raw, needle): find(needle, pos) over the (case-folded)
+            file, the mmapped file at the same offsets, and the encoded term;
+            or None when the file needs the row-by-row path
+        """
+        with open(self.csv_file_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                want_lowered = not case_sensitive and self.keep_lowered_copy
+                scannable, lowered = self._raw_scan_state(mm, want_lowered)
+                if not scannable:
+                    yield None
+                elif case_sensitive:
+                    yield mm.find, mm, search_term.encode('ascii')
+                else:
+                    # bytes.lower() only folds ASCII, which str.lower() agrees with
+                    needle = search_term.lower().encode('ascii')
+                    if lowered is not None and len(lowered) == len(mm):
+                        yield lowered.find, mm, needle
+                    else:
+                        yield _lowered_finder(mm), mm, needle
+    
+    def _raw_scan_state(self, mm: mmap.mmap, want_lowered: bool) -> Tuple[bool, Optional[bytes]]:
+        """
+        Return whether the file can be scanned raw, checked once per version.
+        
+        Args:
+            mm: The mmapped file
+            want_lowered: Build the lowercased copy if it isn't kept yet
+            
+        Returns:
+            (scannable, lowered copy or None)
+        """
+        stamp = self._current_file_stamp()
+        with self._copy_lock:
+            if stamp != self._scan_stamp:
+                self._raw_scannable = _is_raw_scannable_file(mm)
+                self._lowered = None
+                self._scan_stamp = stamp
+            if want_lowered and self._raw_scannable and self._lowered is None:
+                self._lowered = mm[:].lower()
+            return self._raw_scannable, self._lowered
+
 
+def _resolve_search_engine(engine: str) -> str:
+    """Return the requested search engine, downgrading pyarrow to stream if unavailable."""
+    if engine not in ("stream", "pyarrow"):
+        raise ValueError(f"Unknown search engine: {engine}")
+    if engine == "pyarrow" and importlib.util.find_spec("pyarrow") is None:
+        logger.debug("pyarrow not installed, using the streaming search")
+        return "stream"
+    return engine
@@ -4,6 +4,8 @@ Tools module for ReAct orchestrator.
 Provides primitive atomic operations that the LLM can compose.
 """
 
+import functools
+
 from .base_tool import Tool, ToolResult, ToolParameter, ParameterType
 from .grep_tools import (
     GrepLogsTool,
@@ -34,6 +36,7 @@ from .meta_tools import (
 from .output_tools import (
     ReturnLogsTool
 )
+from ..stream_searcher import StreamSearcher
 
 __all__ = [
     # Base classes
@@ -57,6 +60,9 @@ def create_all_tools(log_file_path: str, config_dir: str = "config"):
     """
     Factory function to create all tools.
     
+    Tools hold no per-query state, so instances are built once per
+    (log file, config dir) and shared; each call gets its own list.
+    
     Args:
         log_file_path: Path to CSV log file
         config_dir: Path to configuration directory
@@ -64,19 +70,29 @@ def create_all_tools(log_file_path: str, config_dir: str = "config"):
     Returns:
         List of all instantiated tools
     """
+    return list(_build_all_tools(str(log_file_path), str(config_dir)))
+
+
+@functools.lru_cache(maxsize=4)
+def _build_all_tools(log_file_path: str, config_dir: str) -> tuple:
+    """Instantiate every tool (cached by create_all_tools)."""
     tools = []
     
+    # One searcher shared by all file-scanning tools so repeated searches
+    # across tools hit the same result cache instead of re-reading the CSV
+    searcher = StreamSearcher(log_file_path)
+    
     # NEW: Grep-based tools (memory-efficient)
-    tools.append(GrepLogsTool(log_file_path))
+    tools.append(GrepLogsTool(log_file_path, searcher=searcher))
     tools.append(ParseJsonFieldTool())
     tools.append(ExtractUniqueValuesTool())
     tools.append(CountValuesTool())
-    tools.append(GrepAndParseTool(log_file_path))
+    tools.append(GrepAndParseTool(log_file_path, searcher=searcher))
     
     # NEW: Advanced tools (Phase 1-3)
-    tools.append(FindRelationshipChainTool(log_file_path, config_dir))  # Relationship discovery
+    tools.append(FindRelationshipChainTool(log_file_path, config_dir, searcher=searcher))  # Relationship discovery
     tools.append(CountUniquePerGroupTool())  # Aggregation: count distinct per group
-    tools.append(CountViaRelationshipTool(log_file_path, config_dir))  # Aggregation: via chains
+    tools.append(CountViaRelationshipTool(log_file_path, config_dir, searcher=searcher))  # Aggregation: via chains
     tools.append(SortByTimeTool())  # Time-based
     tools.append(ExtractTimeRangeTool())
     tools.append(SummarizeLogsTool())  # Analysis
@@ -89,4 +105,4 @@ def create_all_tools(log_file_path: str, config_dir: str = "config"):
     # Meta tools
     tools.append(FinalizeAnswerTool())
     
-    return tools
+    return tuple(tools)
@@ -8,6 +8,7 @@ import json
 import logging
 from typing import Dict, Any, List, Optional
 from collections import defaultdict
+from itertools import islice
 import pandas as pd
 
 from .base_tool import Tool, ToolResult, ToolParameter, ParameterType
@@ -156,7 +157,7 @@ class CountUniquePerGroupTool(Tool):
                 top_str = ", ".join(f"{k}:{v}" for k, v in top_groups.items())
             else:
                 # Show first 10 + count
-                top_str = ", ".join(f"{k}:{v}" for k, v in list(top_groups.items())[:display_limit])
+                top_str = ", ".join(f"{k}:{v}" for k, v in islice(top_groups.items(), display_limit))
                 top_str += f" (and {len(top_groups)-display_limit} more)"
             
             msg = f"[FINAL AGGREGATION] Counted unique '{count_field}' per '{group_by}': {total_groups} groups, {total_items} total unique values. Results: {top_str}"
@@ -197,7 +198,12 @@ class CountViaRelationshipTool(Tool):
     → Chain: CPE → CM → RPD → MdId
     """
     
-    def __init__(self, log_file: str, config_dir: str = "config"):
+    def __init__(
+        self,
+        log_file: str,
+        config_dir: str = "config",
+        searcher: Optional[StreamSearcher] = None
+    ):
         super().__init__(
             name="count_via_relationship",
             description="Count values via relationship chains (for cross-log aggregation)",
@@ -231,6 +237,7 @@ class CountViaRelationshipTool(Tool):
         self.requires_logs = False
         self.log_file = log_file
         self.config_dir = config_dir
+        self.searcher = searcher or StreamSearcher(log_file)
         
         # Load entity mappings
         config_path = Path(config_dir) / "entity_mappings.yaml"
@@ -259,10 +266,8 @@ class CountViaRelationshipTool(Tool):
         try:
             # Step 1: Get all unique source values
             logger.info(f"Finding all unique values for '{source_field}'")
-            searcher = StreamSearcher(self.log_file)
-            
             # Search for logs containing source_field
-            source_logs = searcher.search(source_field, case_sensitive=False, regex=False)
+            source_logs = self.searcher.search(source_field, case_sensitive=False, regex=False)
             
             source_values = set()
             for log_entry in source_logs['_source.log']:
@@ -328,7 +333,7 @@ class CountViaRelationshipTool(Tool):
                 top_str = ", ".join(f"{k}:{v}" for k, v in top_groups.items())
             else:
                 # Show first 10 + count
-                top_str = ", ".join(f"{k}:{v}" for k, v in list(top_groups.items())[:display_limit])
+                top_str = ", ".join(f"{k}:{v}" for k, v in islice(top_groups.items(), display_limit))
                 top_str += f" (and {len(top_groups)-display_limit} more)"
             
             msg = f"[FINAL AGGREGATION] Counted '{source_field}' per '{target_field}' via relationship chain: {total_groups} groups, {found_count}/{len(source_values)} values mapped ({coverage_pct:.1f}%). Results: {top_str}"
@@ -373,7 +378,6 @@ class CountViaRelationshipTool(Tool):
         """
         from collections import deque
         
-        searcher = StreamSearcher(self.log_file)
         visited = set()
         queue = deque([(start_value, 0)])  # (value, depth)
         
@@ -389,7 +393,7 @@ class CountViaRelationshipTool(Tool):
             
             # Search for logs containing this value
             try:
-                results = searcher.search(current_value, case_sensitive=False, regex=False, max_results=50)
+                results = self.searcher.search(current_value, case_sensitive=False, regex=False, max_results=50)
                 
                 for log_entry in results['_source.log']:
                     try:
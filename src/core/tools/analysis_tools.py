@@ -8,6 +8,7 @@ import json
 import logging
 from typing import Dict, Any, List, Optional
 from collections import Counter
+from itertools import islice
 import pandas as pd
 
 from .base_tool import Tool, ToolResult, ToolParameter, ParameterType
@@ -278,7 +279,7 @@ class AggregateByFieldTool(Tool):
             total_unique = len(counts)
             total_occurrences = sum(counts.values())
             
-            top_str = ", ".join(f"{k}:{v}" for k, v in list(top_items.items())[:3])
+            top_str = ", ".join(f"{k}:{v}" for k, v in islice(top_items.items(), 3))
             if len(top_items) > 3:
                 top_str += f" (and {len(top_items)-3} more)"
             
@@ -6,6 +6,7 @@ These tools use streaming search instead of loading entire CSV into memory.
 
 import json
 import logging
+import re
 from typing import List, Optional, Dict, Any
 import pandas as pd
 
@@ -47,7 +48,7 @@ class GrepLogsTool(Tool):
     Replaces SearchLogsTool which loaded ALL logs.
     """
     
-    def __init__(self, log_file: str):
+    def __init__(self, log_file: str, searcher: Optional[StreamSearcher] = None):
         super().__init__(
             name="grep_logs",
             description="Search logs for matching pattern (fast, memory-efficient)",
@@ -73,7 +74,7 @@ class GrepLogsTool(Tool):
             ]
         )
         self.log_file = log_file
-        self.searcher = StreamSearcher(log_file)
+        self.searcher = searcher or StreamSearcher(log_file)
         self.requires_logs = False  # Doesn't need pre-loaded logs!
     
     def execute(self, **kwargs) -> ToolResult:
@@ -174,6 +175,10 @@ class ParseJsonFieldTool(Tool):
         try:
             values = []
             
+            # Cheap pre-check: only rows that contain the key are worth a
+            # full json.loads (the lookup below stays the source of truth)
+            key_re = re.compile(r'"' + re.escape(field_name) + r'"\s*:', re.IGNORECASE)
+            
             # Parse JSON from _source.log column
             if '_source.log' in logs.columns:
                 for log_entry in logs['_source.log']:
@@ -183,6 +188,8 @@ class ParseJsonFieldTool(Tool):
                         if json_start == -1:
                             continue
                         json_str = log_entry[json_start:].replace('""', '"')
+                        if not key_re.search(json_str):
+                            continue
                         
                         log_json = json.loads(json_str)
                         # Case-insensitive field lookup
@@ -325,27 +332,29 @@ class ExtractUniqueValuesTool(Tool):
         if not isinstance(logs, pd.DataFrame) or logs.empty:
             return field_names  # Can't parse, return as-is
         
-        all_values = []
+        # Parse each log once and look up every field in it; values are
+        # still grouped by field, in field order
+        values_by_field = [(field_name, []) for field_name in field_names]
         
-        for field_name in field_names:
-            # Parse from _source.log column
-            if '_source.log' in logs.columns:
-                for log_entry in logs['_source.log']:
-                    try:
-                        # Extract JSON part
-                        json_start = log_entry.find('{')
-                        if json_start == -1:
-                            continue
-                        json_str = log_entry[json_start:].replace('""', '"')
-                        log_json = json.loads(json_str)
-                        
-                        # Case-insensitive field lookup
+        if '_source.log' in logs.columns:
+            for log_entry in logs['_source.log']:
+                try:
+                    # Extract JSON part
+                    json_start = log_entry.find('{')
+                    if json_start == -1:
+                        continue
+                    json_str = log_entry[json_start:].replace('""', '"')
+                    log_json = json.loads(json_str)
+                    
+                    # Case-insensitive field lookup
+                    for field_name, field_values in values_by_field:
                         value = case_insensitive_get(log_json, field_name)
                         if value:
-                            all_values.append(value)
-                    except (json.JSONDecodeError, TypeError, AttributeError):
-                        continue
+                            field_values.append(value)
+                except (json.JSONDecodeError, TypeError, AttributeError):
+                    continue
         
+        all_values = [v for _, field_values in values_by_field for v in field_values]
         return all_values if all_values else field_names
 
 
@@ -456,27 +465,29 @@ class CountValuesTool(Tool):
         if not isinstance(logs, pd.DataFrame) or logs.empty:
             return field_names  # Can't parse, return as-is
         
-        all_values = []
+        # Parse each log once and look up every field in it; values are
+        # still grouped by field, in field order
+        values_by_field = [(field_name, []) for field_name in field_names]
         
-        for field_name in field_names:
-            # Parse from _source.log column
-            if '_source.log' in logs.columns:
-                for log_entry in logs['_source.log']:
-                    try:
-                        # Extract JSON part
-                        json_start = log_entry.find('{')
-                        if json_start == -1:
-                            continue
-                        json_str = log_entry[json_start:].replace('""', '"')
-                        log_json = json.loads(json_str)
-                        
-                        # Case-insensitive field lookup
+        if '_source.log' in logs.columns:
+            for log_entry in logs['_source.log']:
+                try:
+                    # Extract JSON part
+                    json_start = log_entry.find('{')
+                    if json_start == -1:
+                        continue
+                    json_str = log_entry[json_start:].replace('""', '"')
+                    log_json = json.loads(json_str)
+                    
+                    # Case-insensitive field lookup
+                    for field_name, field_values in values_by_field:
                         value = case_insensitive_get(log_json, field_name)
                         if value:
-                            all_values.append(value)
-                    except (json.JSONDecodeError, TypeError, AttributeError):
-                        continue
+                            field_values.append(value)
+                except (json.JSONDecodeError, TypeError, AttributeError):
+                    continue
         
+        all_values = [v for _, field_values in values_by_field for v in field_values]
         return all_values if all_values else field_names
 
 
@@ -487,7 +498,7 @@ class GrepAndParseTool(Tool):
     Grep for pattern, then extract JSON field from results.
     """
     
-    def __init__(self, log_file: str):
+    def __init__(self, log_file: str, searcher: Optional[StreamSearcher] = None):
         super().__init__(
             name="grep_and_parse",
             description="Search logs and extract JSON field in one step",
@@ -513,7 +524,7 @@ class GrepAndParseTool(Tool):
             ]
         )
         self.log_file = log_file
-        self.searcher = StreamSearcher(log_file)
+        self.searcher = searcher or StreamSearcher(log_file)
         self.requires_logs = False
     
     def execute(self, **kwargs) -> ToolResult:
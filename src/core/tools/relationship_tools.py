@@ -50,7 +50,12 @@ class FindRelationshipChainTool(Tool):
     Solves the CPE→RPD→MdId problem where data is split across logs.
     """
     
-    def __init__(self, log_file: str, config_dir: str = "config"):
+    def __init__(
+        self,
+        log_file: str,
+        config_dir: str = "config",
+        searcher: Optional[StreamSearcher] = None
+    ):
         super().__init__(
             name="find_relationship_chain",
             description="Find connection between start entity and target field (tree search)",
@@ -76,7 +81,7 @@ class FindRelationshipChainTool(Tool):
             ]
         )
         self.log_file = log_file
-        self.searcher = StreamSearcher(log_file)
+        self.searcher = searcher or StreamSearcher(log_file)
         self.requires_logs = False
         
         # Load entity mappings
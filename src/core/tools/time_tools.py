@@ -65,15 +65,12 @@ class SortByTimeTool(Tool):
                 )
             
             # Parse timestamps
-            logs_copy = logs.copy()
-            logs_copy['_parsed_time'] = self._parse_timestamps(logs_copy[time_col])
+            parsed_times = self._parse_timestamps(logs[time_col]).reset_index(drop=True)
             
-            # Sort
+            # Sort row positions by parsed time and take the rows once,
+            # instead of copying the frame to add a temporary sort column
             ascending = (order == "asc")
-            sorted_logs = logs_copy.sort_values('_parsed_time', ascending=ascending)
-            
-            # Drop temporary column
-            sorted_logs = sorted_logs.drop(columns=['_parsed_time'])
+            sorted_logs = logs.iloc[parsed_times.sort_values(ascending=ascending).index]
             
             direction = "oldest→newest" if ascending else "newest→oldest"
             
@@ -191,17 +188,15 @@ class ExtractTimeRangeTool(Tool):
             end_dt = self._parse_time(end_time)
             
             # Parse log timestamps
-            logs_copy = logs.copy()
             # Try custom format first
-            parsed_times = pd.to_datetime(logs_copy[time_col], format="%b %d, %Y @ %H:%M:%S.%f", errors='coerce')
+            parsed_times = pd.to_datetime(logs[time_col], format="%b %d, %Y @ %H:%M:%S.%f", errors='coerce')
             # Fallback to auto if many failed
             if parsed_times.isna().sum() > len(parsed_times) * 0.5:
-                parsed_times = pd.to_datetime(logs_copy[time_col], errors='coerce')
-            logs_copy['_parsed_time'] = parsed_times
+                parsed_times = pd.to_datetime(logs[time_col], errors='coerce')
             
-            # Filter
-            mask = (logs_copy['_parsed_time'] >= start_dt) & (logs_copy['_parsed_time'] <= end_dt)
-            filtered = logs_copy[mask].drop(columns=['_parsed_time'])
+            # Filter straight from the input; no temporary column to add/drop
+            mask = (parsed_times >= start_dt) & (parsed_times <= end_dt)
+            filtered = logs[mask.to_numpy()]
             
             return ToolResult(
                 success=True,
@@ -4,6 +4,7 @@ from .ollama_client import OllamaClient
 from .prompts import PromptBuilder, PromptValidator
 from .response_parser import ResponseParser
 from .qwen_planner import QwenPlanner
+from .cache import TemplateCache
 
 __all__ = [
     'OllamaClient',
@@ -11,4 +12,5 @@ __all__ = [
     'PromptValidator',
     'ResponseParser',
     'QwenPlanner',
+    'TemplateCache',
 ]
@@ -0,0 +1,178 @@
+"""Disk-backed cache of parsed LLM responses keyed by prompt content."""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: saves still merge, but aren't serialized
+    fcntl = None
+
+from ..utils.logger import setup_logger
+
+logger = setup_logger()
+
+DEFAULT_CACHE_PATH = Path("~/.cache/log-analyser/llm.json")
+
+
+@contextmanager
+def _locked_directory(directory: Path):
+    """Hold an exclusive flock on directory, serializing saves across processes."""
+    if fcntl is None:
+        yield
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(fd)  # closing the descriptor releases the lock
+
+
+class TemplateCache:
+    """
+    Stores parsed LLM responses on disk so identical prompts skip the model.
+
+    Entries are keyed by a SHA-256 of the prompt text and carry a hit count;
+    save() merges them with the file on disk and writes them most-used first.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Initialize the cache, loading any entries already on disk.
+
+        Args:
+            path: Cache file (default: ~/.cache/log-analyser/llm.json)
+        """
+        self.path = Path(path or DEFAULT_CACHE_PATH).expanduser()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    @staticmethod
+    def key(*parts: str) -> str:
+        """
+        Build a cache key from the model name and prompt parts.
+
+        Args:
+            *parts: Strings that together determine the response (model
+                name first, then e.g. system and user prompt)
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+    def _load(self):
+        """Read entries from disk; a missing or unreadable file starts empty."""
+        self._entries = dict(
+            sorted(self._read_entries().items(), key=lambda item: item[1].get("hits", 0), reverse=True)
+        )
+        if self._entries:
+            logger.debug(f"Loaded {len(self._entries)} cached LLM responses from {self.path}")
+
+    def _read_entries(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Read the entries currently on disk.
+
+        Returns:
+            Entries by key (empty if the file is missing or unreadable)
+        """
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                entries = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable LLM cache {self.path}: {e}")
+            return {}
+        if not isinstance(entries, dict):
+            logger.warning(f"Ignoring malformed LLM cache {self.path}")
+            return {}
+        return entries
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Return the cached response for key, counting the hit.
+
+        Args:
+            key: Key from TemplateCache.key()
+
+        Returns:
+            Cached response, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            entry["hits"] = entry.get("hits", 0) + 1
+            return entry["response"]
+
+    def put(self, key: str, response: Any):
+        """
+        Store a JSON-serializable response.
+
+        Args:
+            key: Key from TemplateCache.key()
+            response: Parsed response to cache
+        """
+        with self._lock:
+            self._entries[key] = {"response": response, "hits": 1}
+
+    def save(self):
+        """
+        Write the cache to disk, most-used entries first.
+
+        Entries another process saved since this cache was loaded are kept;
+        for keys both have, the higher hit count wins. Saves are serialized
+        with a lock on the cache directory (where fcntl exists), and each
+        writes a unique temporary file that is renamed into place, so a
+        crash never leaves a truncated cache.
+        """
+        tmp_path = None
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with _locked_directory(self.path.parent):
+                entries = self._merge_with_disk()
+                with tempfile.NamedTemporaryFile(
+                    "w", encoding="utf-8", dir=self.path.parent,
+                    prefix=self.path.name + ".", suffix=".tmp", delete=False
+                ) as f:
+                    tmp_path = f.name
+                    json.dump(entries, f)
+                os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not save LLM cache {self.path}: {e}")
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _merge_with_disk(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Fold the entries on disk into this cache.
+
+        Returns:
+            All entries, most-used first
+        """
+        on_disk = self._read_entries()
+        with self._lock:
+            for key, entry in on_disk.items():
+                ours = self._entries.get(key)
+                if ours is None:
+                    self._entries[key] = entry
+                elif entry.get("hits", 0) > ours["hits"]:
+                    ours["hits"] = entry["hits"]
+            return dict(
+                sorted(self._entries.items(), key=lambda item: item[1].get("hits", 0), reverse=True)
+            )
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
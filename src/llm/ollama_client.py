@@ -1,13 +1,26 @@
 """Ollama API client for LLM integration."""
 
+import asyncio
+import functools
 import json
+import os
+import re
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, Any, Optional, List
 from ..utils.logger import setup_logger
 from ..utils.exceptions import LLMError
 
 logger = setup_logger()
 
+# Compiled once; used on every JSON response
+_JSON_BLOCK_RE = re.compile(r'```(?:json)?\s*(\{.*?\})\s*```', re.DOTALL)
+_TRAILING_COMMA_RE = re.compile(r',\s*([}\]])')
+
+# Pooled keep-alive connections per client; covers generate_batch's
+# concurrent requests (default executor) without reconnecting
+_POOL_SIZE = 16
+
 
 class OllamaClient:
     """
@@ -28,7 +41,7 @@ class OllamaClient:
         
         Args:
             base_url: Ollama API base URL
-            model: Default model name (auto-detects if None)
+            model: Default model name (falls back to $OLLAMA_MODEL, then auto-detects)
             timeout: Request timeout in seconds
             max_retries: Maximum retry attempts
         """
@@ -36,6 +49,17 @@ class OllamaClient:
         self.timeout = timeout
         self.max_retries = max_retries
         
+        # One session for every request so TCP connections are kept alive
+        # and reused across calls instead of reconnecting each time
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=_POOL_SIZE)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        
+        # Explicit override from the environment (e.g. a quantized tag)
+        if model is None:
+            model = os.getenv("OLLAMA_MODEL") or None
+        
         # Auto-detect model if not specified
         if model is None:
             available_models = self.list_models()
@@ -67,7 +91,7 @@ class OllamaClient:
             True if server is healthy, False otherwise
         """
         try:
-            response = requests.get(
+            response = self._session.get(
                 f"{self.base_url}/api/tags",
                 timeout=5
             )
@@ -92,7 +116,7 @@ class OllamaClient:
             List of model names
         """
         try:
-            response = requests.get(
+            response = self._session.get(
                 f"{self.base_url}/api/tags",
                 timeout=5
             )
@@ -115,7 +139,8 @@ class OllamaClient:
         format_json: bool = False,
         system_prompt: Optional[str] = None,
         temperature: float = 0.7,
-        max_tokens: Optional[int] = None
+        max_tokens: Optional[int] = None,
+        stop_on_json: bool = False
     ) -> str:
         """
         Generate text using Ollama API.
@@ -127,6 +152,9 @@ class OllamaClient:
             system_prompt: Optional system prompt
             temperature: Sampling temperature (0.0 - 1.0)
             max_tokens: Maximum tokens to generate
+            stop_on_json: If True, stream the response and stop as soon as a
+                complete top-level JSON object has been generated (after any
+                <think> block), cancelling the rest of the generation
             
         Returns:
             Generated text or JSON string
@@ -141,7 +169,7 @@ class OllamaClient:
         payload = {
             "model": model,
             "prompt": prompt,
-            "stream": False,
+            "stream": stop_on_json,
             "options": {
                 "temperature": temperature
             }
@@ -164,7 +192,10 @@ class OllamaClient:
             try:
                 logger.debug(f"Attempt {attempt + 1}/{self.max_retries}")
                 
-                response = requests.post(
+                if stop_on_json:
+                    return self._generate_until_json(payload)
+                
+                response = self._session.post(
                     f"{self.base_url}/api/generate",
                     json=payload,
                     timeout=self.timeout
@@ -198,6 +229,151 @@ class OllamaClient:
         
         raise LLMError("Generation failed after all retry attempts")
     
+    def _generate_until_json(self, payload: Dict[str, Any]) -> str:
+        """
+        Stream a generation and return once a complete JSON object arrives.
+        
+        Closing the response early makes Ollama stop generating, so trailing
+        text after the decision JSON is never produced.
+        
+        Args:
+            payload: /api/generate payload with "stream" enabled
+            
+        Returns:
+            Generated text up to (and including) the first complete JSON object
+        """
+        text = ""
+        fed = 0
+        detector = _JsonObjectDetector()
+        stopped_early = False
+        
+        with self._session.post(
+            f"{self.base_url}/api/generate",
+            json=payload,
+            timeout=self.timeout,
+            stream=True
+        ) as response:
+            response.raise_for_status()
+            
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                
+                chunk = json.loads(line)
+                if "error" in chunk:
+                    raise LLMError(f"Generation failed: {chunk['error']}")
+                
+                text += chunk.get('response', '')
+                if chunk.get('done'):
+                    break
+                
+                # Only look for the decision JSON after the model's <think> block
+                if '<think>' in text:
+                    think_end = text.rfind('</think>')
+                    if think_end == -1:
+                        continue
+                    think_end += len('</think>')
+                    if fed < think_end:
+                        fed = think_end
+                        detector = _JsonObjectDetector()
+                
+                if detector.feed(text[fed:]):
+                    stopped_early = True
+                    break
+                fed = len(text)
+        
+        logger.info(
+            f"Generation successful: {len(text)} chars"
+            + (" (stopped after complete JSON)" if stopped_early else "")
+        )
+        
+        return text
+    
+    async def agenerate(self, prompt: str, **kwargs) -> str:
+        """
+        Async variant of generate().
+        
+        Runs the blocking HTTP call in the event loop's default executor so
+        several independent prompts can wait on Ollama concurrently.
+        
+        Args:
+            prompt: Input prompt for the model
+            **kwargs: Same keyword arguments as generate()
+            
+        Returns:
+            Generated text or JSON string
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(self.generate, prompt, **kwargs)
+        )
+    
+    async def agenerate_json(self, prompt: str, **kwargs) -> Dict[str, Any]:
+        """
+        Async variant of generate_json(), run in the default executor like agenerate().
+        
+        Args:
+            prompt: Input prompt
+            **kwargs: Same keyword arguments as generate_json()
+            
+        Returns:
+            Parsed JSON dictionary
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(self.generate_json, prompt, **kwargs)
+        )
+    
+    def generate_batch(self, prompts: List[str], **kwargs) -> List[str]:
+        """
+        Generate responses for several independent prompts concurrently.
+        
+        Each prompt is a separate /api/generate request; they are issued
+        together via agenerate() so Ollama can serve them in parallel.
+        Must be called from synchronous code (it runs its own event loop).
+        
+        Args:
+            prompts: Input prompts
+            **kwargs: Same keyword arguments as generate(), applied to all prompts
+            
+        Returns:
+            Generated texts, in the same order as prompts
+            
+        Raises:
+            LLMError: If any generation fails
+        """
+        async def _gather() -> List[str]:
+            return await asyncio.gather(
+                *(self.agenerate(prompt, **kwargs) for prompt in prompts)
+            )
+        
+        return list(asyncio.run(_gather()))
+    
+    def generate_json_batch(self, prompts: List[str], **kwargs) -> List[Dict[str, Any]]:
+        """
+        Generate JSON responses for several independent prompts concurrently.
+        
+        Ollama's /api/generate takes one prompt per request, so this is the
+        JSON counterpart of generate_batch(): one agenerate_json() per
+        prompt, gathered. Must be called from synchronous code.
+        
+        Args:
+            prompts: Input prompts
+            **kwargs: Same keyword arguments as generate_json(), applied to all prompts
+            
+        Returns:
+            Parsed JSON dictionaries, in the same order as prompts
+            
+        Raises:
+            LLMError: If any generation or JSON parsing fails
+        """
+        async def _gather() -> List[Dict[str, Any]]:
+            return await asyncio.gather(
+                *(self.agenerate_json(prompt, **kwargs) for prompt in prompts)
+            )
+        
+        return list(asyncio.run(_gather()))
+    
     def generate_json(
         self,
         prompt: str,
@@ -256,9 +432,7 @@ class OllamaClient:
             pass
         
         # Strategy 2: Extract JSON from markdown code blocks
-        import re
-        json_pattern = r'```(?:json)?\s*(\{.*?\})\s*```'
-        matches = re.findall(json_pattern, response_text, re.DOTALL)
+        matches = _JSON_BLOCK_RE.findall(response_text)
         if matches:
             try:
                 return json.loads(matches[0])
@@ -277,7 +451,7 @@ class OllamaClient:
         # Strategy 4: Try to fix common issues (trailing commas, etc.)
         try:
             # Remove trailing commas before } or ]
-            cleaned = re.sub(r',\s*([}\]])', r'\1', response_text)
+            cleaned = _TRAILING_COMMA_RE.sub(r'\1', response_text)
             return json.loads(cleaned)
         except json.JSONDecodeError:
             pass
@@ -313,7 +487,7 @@ class OllamaClient:
             payload["format"] = "json"
         
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self.base_url}/api/chat",
                 json=payload,
                 timeout=self.timeout
@@ -341,7 +515,7 @@ class OllamaClient:
         model = model or self.model
         
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self.base_url}/api/show",
                 json={"name": model},
                 timeout=5
@@ -354,3 +528,44 @@ class OllamaClient:
             logger.error(f"Failed to get model info: {e}")
             return {}
 
+
+class _JsonObjectDetector:
+    """
+    Incrementally tracks brace depth over streamed text.
+    
+    Strings and escapes are respected so braces inside JSON string values
+    don't count.
+    """
+    
+    def __init__(self):
+        self.depth = 0
+        self.in_string = False
+        self.escape = False
+        self.started = False
+    
+    def feed(self, text: str) -> bool:
+        """
+        Consume more text.
+        
+        Returns:
+            True once a top-level JSON object has been closed
+        """
+        for ch in text:
+            if self.in_string:
+                if self.escape:
+                    self.escape = False
+                elif ch == '\\':
+                    self.escape = True
+                elif ch == '"':
+                    self.in_string = False
+            elif ch == '"':
+                if self.started:
+                    self.in_string = True
+            elif ch == '{':
+                self.depth += 1
+                self.started = True
+            elif ch == '}' and self.started:
+                self.depth -= 1
+                if self.depth == 0:
+                    return True
+        return False
@@ -1,12 +1,17 @@
 """Centralized logging configuration."""
 
 import logging
+import os
 import sys
 from pathlib import Path
 from typing import Optional
 from rich.logging import RichHandler
 from rich.console import Console
 
+# Settings each named logger was last configured with, so repeated
+# module-level setup_logger() calls don't rebuild identical handlers
+_configured = {}
+
 
 def setup_logger(
     name: str = "log-analyzer",
@@ -17,6 +22,11 @@ def setup_logger(
     """Setup structured logging with optional file output and rich formatting."""
     
     logger = logging.getLogger(name)
+    
+    settings = (level.upper(), log_file, rich_console)
+    if _configured.get(name) == settings and logger.handlers:
+        return logger
+    
     logger.setLevel(getattr(logging, level.upper()))
     
     # Clear existing handlers
@@ -35,7 +45,9 @@ def setup_logger(
             console=Console(stderr=True, emoji=False),
             show_time=True,
             show_path=False,
-            markup=True
+            markup=True,
+            # Rich tracebacks are costly to render; opt in with RICH_TB=1
+            rich_tracebacks=os.getenv("RICH_TB") == "1"
         )
     else:
         console_handler = logging.StreamHandler(sys.stderr)
@@ -52,6 +64,7 @@ def setup_logger(
         file_handler.setFormatter(formatter)
         logger.addHandler(file_handler)
     
+    _configured[name] = settings
     return logger
 
 
@@ -0,0 +1,122 @@
+"""Shared pytest fixtures."""
+
+import importlib.util
+import socket
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from src.core.log_processor import LogProcessor
+from src.core.entity_manager import EntityManager
+
+
+SAMPLE_LOG = "tests/sample_logs/system.csv"
+
+
+def _has_parquet_engine() -> bool:
+    """Check whether pandas can read/write Parquet here."""
+    return any(
+        importlib.util.find_spec(module) is not None
+        for module in ("pyarrow", "fastparquet")
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_log_path(tmp_path_factory):
+    """
+    Path of the sample log file to load.
+    
+    Converts system.csv to Parquet once per session (in the session's temp
+    directory, so nothing is written to the source tree and pytest -n
+    workers don't share the file) when a Parquet engine is installed;
+    otherwise uses the CSV.
+    """
+    if not _has_parquet_engine():
+        return SAMPLE_LOG
+    
+    parquet_path = tmp_path_factory.mktemp("sample_logs") / "system.parquet"
+    pd.read_csv(SAMPLE_LOG).to_parquet(parquet_path, index=False)
+    return str(parquet_path)
+
+
+@pytest.fixture(scope="session")
+def sample_logs_session(sample_log_path):
+    """
+    Sample logs parsed once per test session (once per worker under
+    pytest -n; the sample is small enough that sharing it isn't worth it).
+    
+    Text columns keep pandas' default string dtype, which is Arrow-backed
+    on pandas 3 when pyarrow is installed. They are deliberately not cast
+    to "string[pyarrow]": that NA-semantics dtype is left out of
+    select_dtypes(include=['object']), which the scanners under test use
+    to pick text columns.
+    """
+    processor = LogProcessor(sample_log_path)
+    return processor.read_all_logs(engine="pyarrow")
+
+
+@pytest.fixture
+def sample_logs(sample_logs_session):
+    """
+    Fixture to load sample logs.
+    
+    Returns a copy of the session DataFrame: some LogProcessor methods
+    (filter_by_timerange, get_statistics) convert columns in place.
+    """
+    return sample_logs_session.copy()
+
+
+@pytest.fixture(scope="session")
+def entity_index_map(sample_logs_session):
+    """
+    Row indices of each entity_id in the sample logs.
+    
+    Built with one groupby pass per session instead of a boolean scan per
+    lookup. Positions equal labels here since the logs keep a RangeIndex.
+    """
+    return sample_logs_session.groupby("entity_id").indices
+
+
+@pytest.fixture(scope="session")
+def extracted_entities(sample_logs_session):
+    """
+    cm and md_id entities extracted from the sample logs once per session.
+    
+    Read-only: tests that need extraction as setup (not under test) use
+    this instead of re-scanning every row with the entity regexes.
+    """
+    return EntityManager().extract_all_entities_from_logs(
+        sample_logs_session,
+        entity_types=["cm", "md_id"]
+    )
+
+
+@pytest.fixture(scope="session")
+def orchestrator():
+    """
+    One IterativeReactOrchestrator over test.csv for the whole session.
+    
+    Loading the tools and the LLM client is the expensive part, so every
+    orchestrator test shares this instance. Skips when test.csv or the
+    Ollama server is unavailable.
+    """
+    from src.core import IterativeReactOrchestrator
+    from src.llm.ollama_client import OllamaClient
+    
+    if not Path("test.csv").exists():
+        pytest.skip("test.csv not found")
+    # TCP preflight first: fails fast, without waiting on an HTTP timeout
+    try:
+        socket.create_connection(("localhost", 11434), timeout=0.5).close()
+    except OSError:
+        pytest.skip("Ollama server is not running")
+    if not OllamaClient(model="qwen3-react").health_check():
+        pytest.skip("Ollama server is not running")
+    
+    return IterativeReactOrchestrator(
+        log_file="test.csv",
+        config_dir="config",
+        model="qwen3-react",
+        max_iterations=10
+    )
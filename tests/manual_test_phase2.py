@@ -8,6 +8,7 @@ Usage:
 """
 
 import sys
+from itertools import islice
 from pathlib import Path
 
 # Add src to path
@@ -23,7 +24,10 @@ from src.core.chunker import LogChunker
 from src.core.entity_manager import EntityManager, Entity
 
 
-console = Console()
+# When output is piped (CI, log files) skip colour and the repr highlighter;
+# markup stays on so the [tags] are still stripped from the text
+_interactive = sys.stdout.isatty()
+console = Console(highlight=_interactive, no_color=not _interactive)
 SAMPLE_LOG = "tests/sample_logs/system.csv"
 
 
@@ -38,7 +42,7 @@ def test_log_processor():
     
     # Read all logs
     console.print("[yellow]→ Reading all logs...[/yellow]")
-    logs = processor.read_all_logs()
+    logs = processor.read_all_logs(engine="pyarrow")
     console.print(f"[green]✓[/green] Loaded {len(logs)} log entries")
     
     # Get statistics
@@ -73,7 +77,7 @@ def test_log_processor():
     console.print("[yellow]→ Extracting CM entities...[/yellow]")
     cm_entities = processor.extract_entities(logs, "cm")
     console.print(f"[green]✓[/green] Extracted {len(cm_entities)} unique CM entities:")
-    for entity, indices in list(cm_entities.items())[:5]:
+    for entity, indices in islice(cm_entities.items(), 5):
         console.print(f"    {entity}: {len(indices)} occurrences")
     
     return logs
@@ -114,7 +118,7 @@ def test_chunker(logs):
     # Entity-context chunking
     console.print(f"\n[yellow]Testing Entity-Context Chunking:[/yellow]")
     console.print("[yellow]→ Getting CM12345 indices...[/yellow]")
-    cm_indices = logs[logs["entity_id"] == "CM12345"].index.tolist()
+    cm_indices = logs.query('entity_id == "CM12345"').index.tolist()
     console.print(f"[yellow]→ Found {len(cm_indices)} CM12345 occurrences, creating entity chunks...[/yellow]")
     entity_chunks = chunker.chunk_by_entity_context(
         logs,
@@ -204,6 +208,10 @@ def test_entity_manager(logs):
     console.print(f"[green]✓[/green] Found CM12345 in {len(cm_entity.occurrences)} locations")
     console.print(f"  Indices: {cm_entity.occurrences[:10]}...")  # Show first 10
     
+    console.print("[yellow]→ Searching for 'timeout' in logs...[/yellow]")
+    timeout_entity = manager.find_entity_in_logs(logs, "timeout")
+    console.print(f"[green]✓[/green] Found 'timeout' in {len(timeout_entity.occurrences)} locations")
+    
     # Test entity queue
     console.print(f"\n[yellow]Testing Entity Queue:[/yellow]")
     console.print("[yellow]→ Building entity queue...[/yellow]")
@@ -217,21 +225,19 @@ def test_entity_manager(logs):
     return manager
 
 
-def test_integration():
+def test_integration(logs, manager):
     """Test integration of all components."""
     console.print("\n[bold cyan]═══ Testing Component Integration ═══[/bold cyan]\n")
     
-    # Load logs
-    console.print("[yellow]→ Loading logs...[/yellow]")
-    processor = LogProcessor(SAMPLE_LOG)
-    logs = processor.read_all_logs()
-    console.print(f"[green]✓[/green] Loaded {len(logs)} log entries")
+    # Reuse the logs and the (cm, md_id) extraction from the earlier tests
+    # rather than re-reading the CSV and re-scanning it for cm entities
+    console.print(f"[green]✓[/green] Using {len(logs)} loaded log entries")
     
-    # Extract entities
-    console.print("[yellow]→ Extracting entities...[/yellow]")
-    manager = EntityManager()
-    entities = manager.extract_all_entities_from_logs(logs, entity_types=["cm"])
-    console.print(f"[green]✓[/green] Extracted {len(entities)} entities")
+    entities = {
+        key: entity for key, entity in manager.entities.items()
+        if key[0] == "cm"
+    }
+    console.print(f"[green]✓[/green] Reusing {len(entities)} extracted cm entities")
     
     # Create entity-focused chunks
     console.print("[yellow]→ Initializing chunker...[/yellow]")
@@ -255,9 +261,10 @@ def test_integration():
     console.print(f"[green]✓[/green] Created {len(chunks)} smart chunks")
     
     # Show chunk distribution
-    entity_chunks = sum(1 for c in chunks if c.focus_entity)
+    chunk_stats = chunker.get_chunk_statistics(chunks)
+    entity_chunks = chunk_stats.get("chunks_with_entities", 0)
     console.print(f"  Entity-focused chunks: {entity_chunks}")
-    console.print(f"  General chunks: {len(chunks) - entity_chunks}")
+    console.print(f"  General chunks: {chunk_stats['total_chunks'] - entity_chunks}")
     
     # Show sample chunk
     if chunks:
@@ -284,14 +291,13 @@ def main():
         manager = test_entity_manager(logs)
         
         # Test integration
-        test_integration()
+        test_integration(logs, manager)
         
         console.print("\n[bold green]═══ All Manual Tests Completed Successfully! ═══[/bold green]\n")
         
     except Exception as e:
         console.print(f"\n[bold red]Error during testing:[/bold red] {e}")
-        import traceback
-        traceback.print_exc()
+        console.print_exception(show_locals=False, max_frames=5)
         return 1
     
     return 0
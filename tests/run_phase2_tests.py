@@ -8,24 +8,32 @@ Usage:
     python tests/run_phase2_tests.py --module log_processor
 """
 
+import os
 import sys
 import argparse
+import importlib.util
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-import pytest
 
 
-console = Console()
+# When output is piped (CI, log files) skip colour and the repr highlighter;
+# markup stays on so the [tags] are still stripped from the text
+_interactive = sys.stdout.isatty()
+console = Console(highlight=_interactive, no_color=not _interactive)
+
+# Built-in pytest plugins the Phase 2 run doesn't use: the .pytest_cache
+# (no --lf/--ff here) and the warnings summary
+PYTEST_BASE_ARGS = ["-p", "no:cacheprovider", "-p", "no:warnings"]
 
 
 def run_all_tests(verbose=False):
     """Run all Phase 2 tests."""
+    import pytest  # deferred: not needed for --info/--help
+    
     console.print("\n[bold blue]═══ Phase 2: Log Processing Engine Tests ═══[/bold blue]\n")
     
     test_files = [
@@ -34,11 +42,12 @@ def run_all_tests(verbose=False):
         "tests/test_entity_manager.py"
     ]
     
-    # Verify test files exist
-    missing = []
-    for test_file in test_files:
-        if not Path(test_file).exists():
-            missing.append(test_file)
+    # Verify test files exist (one directory listing instead of a stat per file)
+    try:
+        existing = {entry.name for entry in os.scandir("tests") if entry.is_file()}
+    except FileNotFoundError:
+        existing = set()
+    missing = [f for f in test_files if Path(f).name not in existing]
     
     if missing:
         console.print(f"[red]Missing test files:[/red]")
@@ -47,7 +56,14 @@ def run_all_tests(verbose=False):
         return False
     
     # Run pytest
-    args = ["-v"] if verbose else []
+    args = list(PYTEST_BASE_ARGS)
+    if verbose:
+        args.append("-v")
+    
+    # Spread the test files over worker processes when pytest-xdist is available
+    if importlib.util.find_spec("xdist") is not None:
+        args.extend(["-n", "auto"])
+    
     args.extend(test_files)
     
     result = pytest.main(args)
@@ -62,6 +78,8 @@ def run_all_tests(verbose=False):
 
 def run_module_tests(module_name, verbose=False):
     """Run tests for a specific module."""
+    import pytest
+    
     console.print(f"\n[bold blue]Testing {module_name}...[/bold blue]\n")
     
     test_file = f"tests/test_{module_name}.py"
@@ -70,7 +88,7 @@ def run_module_tests(module_name, verbose=False):
         console.print(f"[red]Test file not found: {test_file}[/red]")
         return False
     
-    args = [test_file]
+    args = PYTEST_BASE_ARGS + [test_file]
     if verbose:
         args.append("-v")
     
@@ -80,6 +98,8 @@ def run_module_tests(module_name, verbose=False):
 
 def show_component_info():
     """Display information about Phase 2 components."""
+    from rich.table import Table
+    
     console.print("\n[bold blue]Phase 2: Log Processing Engine Components[/bold blue]\n")
     
     table = Table(show_header=True, header_style="bold cyan")
@@ -11,7 +11,9 @@ Tools tested:
 6. analyze_logs (WITH LLM call - optional)
 """
 
+import functools
 import logging
+import os
 import sys
 import pandas as pd
 from pathlib import Path
@@ -31,6 +33,21 @@ from src.core.tools.time_tools import SortByTimeTool, ExtractTimeRangeTool
 from src.core.tools.analysis_tools import SummarizeLogsTool, AggregateByFieldTool, AnalyzeLogsTool
 
 
+# Largest row count any test below needs; smaller reads slice this frame
+HEAD_ROWS = 400
+
+
+@functools.lru_cache(maxsize=4)
+def _load_head(log_file: str, mtime: float) -> pd.DataFrame:
+    """Parse the first HEAD_ROWS rows once per (path, mtime)."""
+    return pd.read_csv(log_file, nrows=HEAD_ROWS)
+
+
+def read_head(log_file: str, nrows: int) -> pd.DataFrame:
+    """First nrows rows of the log file, served from the cached parse."""
+    return _load_head(log_file, os.path.getmtime(log_file)).head(nrows)
+
+
 def print_header(title: str):
     """Print test section header."""
     print("\n" + "="*70)
@@ -103,7 +120,7 @@ def test_sort_by_time(log_file: str):
     tool = SortByTimeTool()
     
     # Load some sample logs
-    logs = pd.read_csv(log_file, nrows=20)
+    logs = read_head(log_file, 20)
     
     # Test 2a: Sort ascending (oldest first)
     print("\n--- Test 2a: Sort ascending (oldest first) ---")
@@ -132,7 +149,7 @@ def test_extract_time_range(log_file: str):
     tool = ExtractTimeRangeTool()
     
     # Load sample logs
-    logs = pd.read_csv(log_file, nrows=100)
+    logs = read_head(log_file, 100)
     
     # Get a sample timestamp for testing
     if '_source.@timestamp' in logs.columns:
@@ -165,7 +182,7 @@ def test_summarize_logs(log_file: str):
     tool = SummarizeLogsTool()
     
     # Load sample logs
-    logs = pd.read_csv(log_file, nrows=100)
+    logs = read_head(log_file, 100)
     
     # Test 4a: Basic summary
     print("\n--- Test 4a: Basic summary ---")
@@ -185,7 +202,7 @@ def test_aggregate_by_field(log_file: str):
     tool = AggregateByFieldTool()
     
     # Load sample logs (more rows to include RpdName at line 320)
-    logs = pd.read_csv(log_file, nrows=400)
+    logs = read_head(log_file, 400)
     
     # Test 5a: Aggregate by Severity
     print("\n--- Test 5a: Aggregate by Severity ---")
@@ -219,7 +236,7 @@ def test_analyze_logs(log_file: str, skip_llm: bool = True):
     tool = AnalyzeLogsTool(model="qwen3-loganalyzer")
     
     # Load sample logs
-    logs = pd.read_csv(log_file, nrows=30)
+    logs = read_head(log_file, 30)
     
     # Test 6a: Error analysis
     print("\n--- Test 6a: Error analysis ---")
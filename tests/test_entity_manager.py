@@ -1,28 +1,25 @@
 """Test entity manager functionality."""
 
+import random
+
 import pytest
 import pandas as pd
 
-from src.core.log_processor import LogProcessor
 from src.core.entity_manager import Entity, EntityQueue, EntityManager
 
 
-SAMPLE_LOG = "tests/sample_logs/system.csv"
-
-
-@pytest.fixture
-def sample_logs():
-    """Fixture to load sample logs."""
-    processor = LogProcessor(SAMPLE_LOG)
-    return processor.read_all_logs()
-
-
 @pytest.fixture
 def entity_manager():
     """Fixture for EntityManager."""
     return EntityManager()
 
 
+@pytest.fixture(scope="session")
+def cm12345_entity(sample_logs_session):
+    """CM12345 found by scanning the sample logs once per session (read-only)."""
+    return EntityManager().find_entity_in_logs(sample_logs_session, "CM12345")
+
+
 def test_entity_initialization():
     """Test Entity object initialization."""
     entity = Entity(
@@ -47,6 +44,16 @@ def test_entity_add_occurrence():
     assert 5 in entity.occurrences
 
 
+def test_entity_add_occurrence_after_external_append():
+    """Test duplicates are still rejected when occurrences is mutated directly."""
+    entity = Entity("cm", "CM12345", [0])
+    entity.occurrences.append(7)
+    entity.add_occurrence(7)
+    entity.add_occurrence(8)
+    
+    assert entity.occurrences == [0, 7, 8]
+
+
 def test_entity_mark_explored():
     """Test marking entity as explored."""
     entity = Entity("cm", "CM12345")
@@ -106,6 +113,18 @@ def test_entity_queue_prevent_duplicates():
     assert not queue.has_more()
 
 
+def test_entity_queue_dedup_many_entities():
+    """Test dedup stays exact with many distinct entities and repeats."""
+    queue = EntityQueue(max_depth=5)
+    values = [f"CM{i:05d}" for i in range(10_000)]
+    
+    for value in values + values[::2]:
+        queue.add_entity(Entity("cm", value), depth=0)
+    
+    stats = queue.get_statistics()
+    assert stats["queued"] == len(values)
+
+
 def test_entity_queue_priority_ordering():
     """Test that queue respects priority ordering."""
     queue = EntityQueue(max_depth=5)
@@ -124,6 +143,23 @@ def test_entity_queue_priority_ordering():
     assert first == entity2  # Priority 10
 
 
+def test_entity_queue_large_n_order():
+    """Test pop order (priority desc, depth asc, FIFO) at 10k entities."""
+    rng = random.Random(0)
+    queue = EntityQueue(max_depth=5)
+    added = []
+    
+    for i in range(10_000):
+        entity = Entity("cm", f"CM{i:05d}")
+        priority, depth = rng.randint(0, 20), rng.randint(0, 4)
+        queue.add_entity(entity, priority=priority, depth=depth)
+        added.append((-priority, depth, i, entity))
+    popped = [queue.get_next_entity()[1] for _ in range(len(added))]
+    
+    assert popped == [entity for *_, entity in sorted(added, key=lambda x: x[:3])]
+    assert not queue.has_more()
+
+
 def test_entity_queue_max_depth():
     """Test that queue respects max depth."""
     queue = EntityQueue(max_depth=2)
@@ -183,10 +219,10 @@ def test_extract_entities_from_text(entity_manager):
     # Should find both CM12345 and CM12346
 
 
-def test_extract_all_entities_from_logs(entity_manager, sample_logs):
+def test_extract_all_entities_from_logs(entity_manager, sample_logs_session):
     """Test extracting all entities from logs."""
     entities = entity_manager.extract_all_entities_from_logs(
-        sample_logs,
+        sample_logs_session,
         entity_types=["cm"]
     )
     
@@ -198,18 +234,26 @@ def test_extract_all_entities_from_logs(entity_manager, sample_logs):
         assert len(entity.occurrences) > 0
 
 
-def test_find_entity_in_logs(entity_manager, sample_logs):
+def test_find_entity_in_logs(cm12345_entity):
     """Test finding specific entity in logs."""
-    entity = entity_manager.find_entity_in_logs(
-        sample_logs,
-        entity_value="CM12345"
-    )
+    entity = cm12345_entity
     
     assert isinstance(entity, Entity)
     assert entity.entity_value == "CM12345"
     assert len(entity.occurrences) > 0
 
 
+def test_find_entity_in_logs_scans_given_logs(entity_manager):
+    """Test that occurrences come from the logs passed in, not earlier results."""
+    entity_manager.entities[("cm", "CM12345")] = Entity("cm", "CM12345", [0])
+    logs = pd.DataFrame({"message": ["boot", "link up", "CM12345 online", "cm12345 offline"]})
+    
+    entity = entity_manager.find_entity_in_logs(logs, "CM12345", "cm")
+    
+    assert entity.occurrences == [2, 3]
+    assert entity_manager.entities[("cm", "CM12345")] is entity
+
+
 def test_build_entity_queue(entity_manager):
     """Test building entity queue."""
     entity1 = Entity("cm", "CM12345", [0])
@@ -221,26 +265,26 @@ def test_build_entity_queue(entity_manager):
     assert queue.has_more()
 
 
-def test_expand_entity_relationships(entity_manager, sample_logs):
+def test_expand_entity_relationships(entity_manager, sample_logs_session, cm12345_entity):
     """Test expanding entity relationships."""
-    # First find an entity
-    entity = entity_manager.find_entity_in_logs(sample_logs, "CM12345")
-    
-    # Expand relationships
+    # Expand relationships of an already found entity
     related = entity_manager.expand_entity_relationships(
-        entity,
-        sample_logs,
+        cm12345_entity,
+        sample_logs_session,
         max_related=5
     )
     
     assert isinstance(related, list)
     # May or may not find related entities depending on config and data
+    assert len(related) <= 5
+    related_types = set(entity_manager.get_related_entities(cm12345_entity.entity_type))
+    assert all(entity.entity_type in related_types for entity in related)
 
 
-def test_get_entity_summary(entity_manager, sample_logs):
+def test_get_entity_summary(entity_manager, extracted_entities):
     """Test getting entity summary."""
-    # Extract some entities first
-    entity_manager.extract_all_entities_from_logs(sample_logs, entity_types=["cm"])
+    # Use entities extracted once for the session
+    entity_manager.entities.update(extracted_entities)
     
     summary = entity_manager.get_entity_summary()
     
@@ -250,10 +294,10 @@ def test_get_entity_summary(entity_manager, sample_logs):
     assert summary["total_entities"] > 0
 
 
-def test_get_top_entities(entity_manager, sample_logs):
+def test_get_top_entities(entity_manager, extracted_entities):
     """Test getting top entities by occurrence."""
-    # Extract entities
-    entity_manager.extract_all_entities_from_logs(sample_logs, entity_types=["cm"])
+    # Use entities extracted once for the session
+    entity_manager.entities.update(extracted_entities)
     
     top = entity_manager.get_top_entities(entity_type="cm", limit=3)
     
@@ -265,10 +309,27 @@ def test_get_top_entities(entity_manager, sample_logs):
         assert len(top[0].occurrences) >= len(top[1].occurrences)
 
 
-def test_entity_manager_multiple_entity_types(entity_manager, sample_logs):
+def test_get_top_entities_matches_full_sort():
+    """Top-K selection should equal a stable full sort, ties included."""
+    manager = EntityManager()
+    for i, count in enumerate([3, 7, 3, 1, 7, 5]):
+        manager.entities[("cm", f"cm{i}")] = Entity("cm", f"cm{i}", occurrences=list(range(count)))
+    manager.entities[("md_id", "md0")] = Entity("md_id", "md0", occurrences=list(range(9)))
+    
+    expected = sorted(
+        (e for e in manager.entities.values() if e.entity_type == "cm"),
+        key=lambda e: len(e.occurrences),
+        reverse=True
+    )[:4]
+    
+    assert manager.get_top_entities(entity_type="cm", limit=4) == expected
+    assert manager.get_top_entities(limit=1)[0].entity_value == "md0"
+
+
+def test_entity_manager_multiple_entity_types(entity_manager, sample_logs_session):
     """Test extracting multiple entity types."""
     entities = entity_manager.extract_all_entities_from_logs(
-        sample_logs,
+        sample_logs_session,
         entity_types=["cm", "md_id"]
     )
     
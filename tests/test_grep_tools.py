@@ -4,9 +4,19 @@ Test Script for New Grep-Based Tools
 Tests the grep-first approach independently before integration.
 """
 
+import mmap
+import os
+import re
 import sys
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 sys.path.insert(0, '.')
 
+import numpy as np
+import pandas as pd
+import pytest
+
 from src.core.tools.grep_tools import (
     GrepLogsTool,
     ParseJsonFieldTool,
@@ -14,8 +24,105 @@ from src.core.tools.grep_tools import (
     CountValuesTool,
     GrepAndParseTool
 )
+from thread_output import thread_local_stdout
+
+
+@lru_cache(maxsize=1)
+def _grep_cm_macs():
+    """
+    Grep CmMacAddress logs and parse the MACs once.
+    
+    Shared by the extract-unique and count tests (also when run as a
+    script), so test.csv is scanned once for both. Read-only.
+    
+    Returns:
+        Tuple of (grep_result, parse_result); parse_result is None if grep failed
+    """
+    grep_result = GrepLogsTool("test.csv").execute(pattern="CmMacAddress", max_results=50)
+    if not grep_result.success:
+        return grep_result, None
+    
+    parse_result = ParseJsonFieldTool().execute(logs=grep_result.data, field_name="CmMacAddress")
+    return grep_result, parse_result
+
+
+@lru_cache(maxsize=1)
+def _grep_parse_tool():
+    """One GrepAndParseTool (and StreamSearcher) shared by the tests below."""
+    return GrepAndParseTool("test.csv")
+
+
+def _mmap_grep(path, pattern):
+    """
+    Return the raw lines of a file that contain pattern.
+    
+    Uses mmap + bytes.find, so non-matching lines are never decoded or
+    split. Plain case-sensitive matching only; a CSV record spanning
+    several lines is returned as the line holding the match.
+    
+    Args:
+        path: File path
+        pattern: Text to look for
+        
+    Returns:
+        List of matching lines as bytes (without newline)
+    """
+    needle = pattern.encode('utf-8')
+    lines = []
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return lines
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos = mm.find(needle)
+            while pos >= 0:
+                line_start = mm.rfind(b"\n", 0, pos) + 1
+                line_end = mm.find(b"\n", pos)
+                if line_end < 0:
+                    line_end = len(mm)
+                lines.append(mm[line_start:line_end])
+                pos = mm.find(needle, line_end + 1)
+    return lines
+
+
+_CM_MAC_WITH_MDID = re.compile(
+    rb'"MdId"":""[^"]+"",\s*""CmMacAddress"":""([0-9a-f]{2}(?::[0-9a-f]{2}){5})""'
+)
 
 
+def _sample_cm_mac(path):
+    """
+    Pick a CM MAC from the file that is logged together with an MdId.
+    
+    Logs with an empty JSON value are skipped: the JSON tools unescape
+    '""' to '"', which turns an empty value into invalid JSON.
+    
+    Args:
+        path: CSV file path
+        
+    Returns:
+        MAC address string, or None if the file is missing or has none
+    """
+    if not os.path.exists(path):
+        return None
+    for line in _mmap_grep(path, "MdId"):
+        if b'""""' in line:
+            continue
+        match = _CM_MAC_WITH_MDID.search(line)
+        if match:
+            return match.group(1).decode('ascii')
+    return None
+
+
+# The CM MAC the lookup tests below search for (a CM MAC, not a CPE MAC -
+# CM logs carry an MdId); skip them when test.csv has no such log
+CM_MAC = _sample_cm_mac("test.csv")
+requires_cm_mac = pytest.mark.skipif(
+    CM_MAC is None,
+    reason="test.csv has no CM MAC logged with an MdId"
+)
+
+
+@requires_cm_mac
 def test_grep_logs():
     """Test basic grep functionality."""
     print("\n" + "="*70)
@@ -25,16 +132,17 @@ def test_grep_logs():
     tool = GrepLogsTool("test.csv")
     
     # Search for a CM MAC address (not CPE MAC - CM has MdId)
-    result = tool.execute(pattern="2c:ab:a4:40:a8:bc")
+    result = tool.execute(pattern=CM_MAC)
     
-    print(f"Pattern: 2c:ab:a4:40:a8:bc (CM MAC)")
+    print(f"Pattern: {CM_MAC} (CM MAC)")
     print(f"Success: {result.success}")
     print(f"Message: {result.message}")
     print(f"Rows found: {len(result.data) if result.success else 0}")
     
-    return result.success and len(result.data) > 0
+    assert result.success and len(result.data) > 0
 
 
+@requires_cm_mac
 def test_parse_json_field():
     """Test JSON field extraction."""
     print("\n" + "="*70)
@@ -43,11 +151,9 @@ def test_parse_json_field():
     
     # First grep for CM MAC (has MdId)
     grep_tool = GrepLogsTool("test.csv")
-    grep_result = grep_tool.execute(pattern="2c:ab:a4:40:a8:bc")
+    grep_result = grep_tool.execute(pattern=CM_MAC)
     
-    if not grep_result.success:
-        print("✗ Grep failed")
-        return False
+    assert grep_result.success, "Grep failed"
     
     # Then parse MdId
     parse_tool = ParseJsonFieldTool()
@@ -59,7 +165,7 @@ def test_parse_json_field():
     if result.success and result.data:
         print(f"MDIDs found: {result.data[:3]}")
     
-    return result.success and len(result.data) > 0
+    assert result.success and len(result.data) > 0
 
 
 def test_extract_unique():
@@ -68,21 +174,12 @@ def test_extract_unique():
     print("TEST 3: Extract Unique Values")
     print("="*70)
     
-    # First get some values
-    grep_tool = GrepLogsTool("test.csv")
-    grep_result = grep_tool.execute(pattern="CmMacAddress", max_results=50)
+    # First get some values (grep + parse CM MACs)
+    grep_result, parse_result = _grep_cm_macs()
     
-    if not grep_result.success:
-        print("✗ Grep failed")
-        return False
+    assert grep_result.success, "Grep failed"
     
-    # Parse CM MACs
-    parse_tool = ParseJsonFieldTool()
-    parse_result = parse_tool.execute(logs=grep_result.data, field_name="CmMacAddress")
-    
-    if not parse_result.success or not parse_result.data:
-        print("✗ Parse failed")
-        return False
+    assert parse_result.success and parse_result.data, "Parse failed"
     
     # Extract unique
     unique_tool = ExtractUniqueValuesTool()
@@ -93,7 +190,7 @@ def test_extract_unique():
     print(f"Message: {result.message}")
     print(f"Unique count: {len(result.data) if result.success else 0}")
     
-    return result.success
+    assert result.success
 
 
 def test_count_values():
@@ -103,19 +200,11 @@ def test_count_values():
     print("="*70)
     
     # Get some CM MACs
-    grep_tool = GrepLogsTool("test.csv")
-    grep_result = grep_tool.execute(pattern="CmMacAddress", max_results=30)
-    
-    if not grep_result.success:
-        print("✗ Grep failed")
-        return False
+    grep_result, parse_result = _grep_cm_macs()
     
-    parse_tool = ParseJsonFieldTool()
-    parse_result = parse_tool.execute(logs=grep_result.data, field_name="CmMacAddress")
+    assert grep_result.success, "Grep failed"
     
-    if not parse_result.success:
-        print("✗ Parse failed")
-        return False
+    assert parse_result.success, "Parse failed"
     
     # Count
     count_tool = CountValuesTool()
@@ -125,34 +214,36 @@ def test_count_values():
     print(f"Message: {result.message}")
     print(f"Unique count: {result.data if result.success else 0}")
     
-    return result.success
+    assert result.success
 
 
+@requires_cm_mac
 def test_grep_and_parse():
     """Test combined grep+parse operation."""
     print("\n" + "="*70)
     print("TEST 5: Grep and Parse (Combined)")
     print("="*70)
     
-    tool = GrepAndParseTool("test.csv")
+    tool = _grep_parse_tool()
     
     # Get MDID for CM MAC in one step
     result = tool.execute(
-        pattern="2c:ab:a4:40:a8:bc",
+        pattern=CM_MAC,
         field_name="MdId",
         unique_only=True
     )
     
-    print(f"Pattern: 2c:ab:a4:40:a8:bc (CM MAC)")
+    print(f"Pattern: {CM_MAC} (CM MAC)")
     print(f"Field: MdId")
     print(f"Success: {result.success}")
     print(f"Message: {result.message}")
     if result.success and result.data:
         print(f"MDIDs: {result.data}")
     
-    return result.success and len(result.data) > 0
+    assert result.success and len(result.data) > 0
 
 
+@requires_cm_mac
 def test_relationship_query():
     """Test relationship query pattern."""
     print("\n" + "="*70)
@@ -160,22 +251,20 @@ def test_relationship_query():
     print("="*70)
     
     # Step 1: Get MDID for a CM MAC
-    tool1 = GrepAndParseTool("test.csv")
+    tool1 = _grep_parse_tool()
     mdid_result = tool1.execute(
-        pattern="2c:ab:a4:40:a8:bc",
+        pattern=CM_MAC,
         field_name="MdId",
         unique_only=True
     )
     
-    if not mdid_result.success or not mdid_result.data:
-        print("✗ Step 1 failed: Couldn't find MDID")
-        return False
+    assert mdid_result.success and mdid_result.data, "Step 1 failed: Couldn't find MDID"
     
     mdid = mdid_result.data[0]
     print(f"Step 1: Found MDID = {mdid}")
     
     # Step 2: Find all CM MACs with this MDID
-    tool2 = GrepAndParseTool("test.csv")
+    tool2 = _grep_parse_tool()
     cm_result = tool2.execute(
         pattern=mdid,
         field_name="CmMacAddress",
@@ -186,7 +275,7 @@ def test_relationship_query():
     if cm_result.success and cm_result.data:
         print(f"Sample CM MACs: {cm_result.data[:5]}")
     
-    return cm_result.success
+    assert cm_result.success
 
 
 def test_count_unique_pattern():
@@ -203,7 +292,7 @@ def test_count_unique_pattern():
     
     if not error_result.success or error_result.data.empty:
         print("ℹ️  No ERROR logs found (might be INFO/DEBUG only)")
-        return True  # Not a failure, just no errors in test data
+        return  # Not a failure, just no errors in test data
     
     # Step 2: Parse CM MACs
     parse_tool = ParseJsonFieldTool()
@@ -211,7 +300,7 @@ def test_count_unique_pattern():
     
     if not parse_result.success or not parse_result.data:
         print("ℹ️  No CM MACs in ERROR logs")
-        return True
+        return
     
     # Step 3: Count unique
     count_tool = CountValuesTool()
@@ -219,7 +308,38 @@ def test_count_unique_pattern():
     
     print(f"Step 2: {count_result.message if count_result.success else 'Count failed'}")
     
-    return count_result.success
+    assert count_result.success
+
+
+def _low_cardinality_dtypes(path, sample_rows=10000, max_ratio=0.01):
+    """
+    Pick columns to load as categoricals from a sample of the file.
+    
+    Args:
+        path: CSV file path
+        sample_rows: Rows to read for the cardinality probe
+        max_ratio: Max unique values, as a fraction of sampled rows
+        
+    Returns:
+        dtype mapping for pd.read_csv
+    """
+    sample = pd.read_csv(path, nrows=sample_rows, encoding='utf-8', on_bad_lines='skip', engine='c')
+    limit = max(1, int(len(sample) * max_ratio))
+    return {col: 'category' for col, n in sample.nunique().items() if n <= limit}
+
+
+def _contains(series, pat):
+    """Substring mask for a column; categoricals are matched once per category."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        hits = np.asarray(series.cat.categories.astype(str).str.contains(pat, regex=False), dtype=bool)
+        codes = series.cat.codes.to_numpy()
+        if len(hits) == 0:
+            return np.zeros(len(series), dtype=bool)
+        return (codes >= 0) & hits[codes]
+    if not isinstance(series.dtype, pd.StringDtype):
+        # Only non-string columns need a str copy to be searchable
+        series = series.astype(str)
+    return series.str.contains(pat, regex=False, na=False).to_numpy()
 
 
 def performance_test():
@@ -230,13 +350,14 @@ def performance_test():
     
     import time
     
-    # NEW: Grep approach
+    # NEW: Grep approach (fresh tool so the timing includes the file scan,
+    # not a hit in the shared searcher's result cache)
     print("\nNEW Approach (Grep):")
     start = time.time()
     
     tool = GrepAndParseTool("test.csv")
     result = tool.execute(
-        pattern="2c:ab:a4:40:a8:bc",
+        pattern=CM_MAC,
         field_name="MdId",
         unique_only=True
     )
@@ -247,14 +368,20 @@ def performance_test():
     
     # OLD: Load-all approach (simulated)
     print("\nOLD Approach (Load All):")
+    # The dtype probe reads the file once more; keep it out of the timing
+    dtypes = _low_cardinality_dtypes("test.csv")
     start = time.time()
     
-    import pandas as pd
-    df = pd.read_csv("test.csv", encoding='utf-8', on_bad_lines='skip')
-    # Search
-    mask = df.astype(str).apply(
-        lambda row: any("2c:ab:a4:40:a8:bc" in str(cell) for cell in row), axis=1
+    df = pd.read_csv(
+        "test.csv",
+        encoding='utf-8',
+        on_bad_lines='skip',
+        engine='c',
+        dtype=dtypes
     )
+    # Search (substring match per column, then any() across columns)
+    pat = CM_MAC
+    mask = np.column_stack([_contains(df[col], pat) for col in df.columns]).any(axis=1)
     filtered = df[mask]
     # Parse (simulated)
     
@@ -262,11 +389,34 @@ def performance_test():
     print(f"  Time: {old_time*1000:.2f}ms")
     print(f"  Rows: {len(filtered)}")
     
+    # RAW: mmap + bytes.find, only matching lines are materialized
+    print("\nRAW Approach (mmap grep):")
+    start = time.time()
+    
+    raw_lines = _mmap_grep("test.csv", CM_MAC)
+    
+    raw_time = time.time() - start
+    print(f"  Time: {raw_time*1000:.2f}ms")
+    print(f"  Lines: {len(raw_lines)}")
+    
     print(f"\n📊 Speedup: {old_time/grep_time:.2f}x")
     
     return True
 
 
+def _run_one(stdout, name, test_func):
+    """Run one test on a worker thread, capturing its printed output."""
+    with stdout.capturing() as buffer:
+        try:
+            test_func()
+            passed = True
+        except Exception as e:
+            print(f"\n✗ {name} FAILED: {e}")
+            traceback.print_exc(file=buffer)
+            passed = False
+    return name, passed, buffer.getvalue()
+
+
 def main():
     """Run all tests."""
     print("="*70)
@@ -284,16 +434,17 @@ def main():
         ("Count Unique Pattern", test_count_unique_pattern),
     ]
     
+    # The tests are independent, so run them on threads (pandas and file
+    # IO release the GIL). Each thread's output is buffered and printed
+    # here in the original order.
+    with thread_local_stdout() as stdout:
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            outcomes = list(executor.map(lambda t: _run_one(stdout, *t), tests))
+    
     results = []
-    for name, test_func in tests:
-        try:
-            passed = test_func()
-            results.append((name, passed))
-        except Exception as e:
-            print(f"\n✗ {name} FAILED: {e}")
-            import traceback
-            traceback.print_exc()
-            results.append((name, False))
+    for name, passed, output in outcomes:
+        print(output, end="")
+        results.append((name, passed))
     
     # Performance test
     try:
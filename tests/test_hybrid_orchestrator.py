@@ -2,6 +2,7 @@
 Test Hybrid Orchestrator - End-to-end tests
 """
 
+import asyncio
 import sys
 sys.path.insert(0, '.')
 
@@ -49,27 +50,33 @@ def main():
         print(f"✗ Failed to initialize: {e}")
         return
     
-    # Run tests
+    # Run tests (queries are independent, so wait on the LLM concurrently)
+    async def run_all():
+        return await asyncio.gather(
+            *[orchestrator.aprocess(query) for query in QUERIES],
+            return_exceptions=True
+        )
+    
+    outcomes = asyncio.run(run_all())
+    
     results = []
-    for i, query in enumerate(QUERIES, 1):
+    for i, (query, result) in enumerate(zip(QUERIES, outcomes), 1):
         print(f"\n{'='*60}")
         print(f"[{i}/{len(QUERIES)}] {query}")
         print("=" * 60)
         
-        try:
-            result = orchestrator.process(query)
-            
-            print(f"\nNormalized: {result.get('normalized_query', 'N/A')}")
-            print(f"Search value: {result.get('search_value', 'N/A')}")
-            print(f"Plan: {result.get('plan', {})}")
-            print(f"\nAnswer: {result['answer']}")
-            print(f"Success: {result['success']}")
-            
-            results.append(result['success'])
-            
-        except Exception as e:
-            print(f"✗ Error: {e}")
+        if isinstance(result, Exception):
+            print(f"✗ Error: {result}")
             results.append(False)
+            continue
+        
+        print(f"\nNormalized: {result.get('normalized_query', 'N/A')}")
+        print(f"Search value: {result.get('search_value', 'N/A')}")
+        print(f"Plan: {result.get('plan', {})}")
+        print(f"\nAnswer: {result['answer']}")
+        print(f"Success: {result['success']}")
+        
+        results.append(result['success'])
     
     # Summary
     passed = sum(results)
@@ -3,7 +3,12 @@ Unit tests for each individual tool.
 Tests tools in isolation before orchestration.
 """
 
+import os
 import sys
+import threading
+import traceback
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from rich.console import Console
 from rich.table import Table
@@ -15,32 +20,229 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from src.core.tools import create_all_tools
 from src.utils.logger import setup_logger
+from thread_output import thread_local_stdout
 
-console = Console(force_terminal=True, force_jupyter=False)
+# QUIET=1: only failing tests and the final counts are shown
+QUIET = bool(os.environ.get("QUIET"))
+# VERBOSE=1: print tracebacks of tests that raised in the summary
+VERBOSE = bool(os.environ.get("VERBOSE"))
+console = Console(force_terminal=True, force_jupyter=False, quiet=QUIET)
+report_console = Console(force_terminal=True, force_jupyter=False)
 logger = setup_logger()
 
 
+def _freeze(value):
+    """Hashable stand-in for tool params; DataFrames are keyed by identity"""
+    if isinstance(value, pd.DataFrame):
+        return ("DataFrame", id(value))
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+# (tool, needs, [(test name, params builder)]) in run order. Builders get
+# the first search's result frame (or None). needs: "rows" skips the group
+# unless that frame has rows, "frame" unless it exists, None always runs.
+TEST_GROUPS = [
+    ("search_logs", None, [
+        ("Basic search with value", lambda logs: {"value": "MAWED07T01"}),
+        ("Search with specific columns", lambda logs: {"value": "error", "columns": ["_source.log"]}),
+        ("Search with no results", lambda logs: {"value": "NONEXISTENT_VALUE_12345"}),
+    ]),
+    ("filter_by_time", "rows", [
+        ("Filter by time range", lambda logs: {
+            "logs": logs,
+            "start_time": "2024-01-01T00:00:00",
+            "end_time": "2025-12-31T23:59:59"
+        }),
+    ]),
+    ("filter_by_severity", "rows", [
+        ("Filter ERROR logs", lambda logs: {"logs": logs, "severities": ["ERROR"]}),
+        ("Filter ERROR and WARNING logs", lambda logs: {"logs": logs, "severities": ["ERROR", "WARNING"]}),
+    ]),
+    ("filter_by_field", "rows", [
+        ("Filter by field value", lambda logs: {"logs": logs, "field": "_source.log", "value": "MAWED07T01"}),
+    ]),
+    ("get_log_count", "frame", [
+        ("Count logs", lambda logs: {"logs": logs}),
+    ]),
+    ("extract_entities", "rows", [
+        ("Extract single entity type", lambda logs: {"logs": logs, "entity_types": ["cm_mac"]}),
+        ("Extract multiple entity types", lambda logs: {"logs": logs, "entity_types": ["cm_mac", "rpdname", "md_id"]}),
+        ("Extract all entity types (empty list)", lambda logs: {"logs": logs, "entity_types": []}),
+    ]),
+    ("count_entities", "rows", [
+        ("Count entities of specific type", lambda logs: {"logs": logs, "entity_type": "cm_mac"}),
+    ]),
+    ("aggregate_entities", "rows", [
+        ("Aggregate entity statistics", lambda logs: {"logs": logs, "entity_types": ["cm_mac", "rpdname"]}),
+    ]),
+    ("find_entity_relationships", "rows", [
+        ("Find entity relationships", lambda logs: {
+            "logs": logs,
+            "target_value": "MAWED07T01",
+            "related_types": ["cm_mac"]
+        }),
+    ]),
+    ("normalize_term", None, [
+        ("Normalize search term", lambda logs: {"term": "reg"}),
+    ]),
+    ("fuzzy_search", None, [
+        ("Fuzzy search with normalized term", lambda logs: {
+            "logs": logs if logs is not None else pd.DataFrame(),
+            "term": "error"
+        }),
+    ]),
+    ("return_logs", "rows", [
+        ("Format logs for display", lambda logs: {"logs": logs, "max_samples": 3}),
+    ]),
+    ("finalize_answer", None, [
+        ("Finalize with answer", lambda logs: {"answer": "Test answer", "confidence": 0.95}),
+    ]),
+]
+
+# Tool results ToolTester keeps for repeated identical calls
+RESULTS_CACHE_SIZE = 8
+
+# Status cell markup for the summary table
+STATUS_MARKUP = {
+    "PASS": "[green]PASS[/green]",
+    "FAIL": "[red]FAIL[/red]",
+    "ERROR": "[red]ERROR[/red]"
+}
+
+
 class ToolTester:
     """Helper class for testing tools"""
     
     def __init__(self, log_file: str):
         self.log_file = log_file
         self.tools = create_all_tools(log_file)
-        self.tool_dict = {tool.name: tool for tool in self.tools}
+        # Interned keys let get_tool's literal names match by identity
+        self.tool_dict = {sys.intern(tool.name): tool for tool in self.tools}
         self.results = []
+        # Per-thread test state: held messages, and while a group runs on a
+        # worker thread, its results
+        self._local = threading.local()
+        # LRU of (tool name, frozen params) -> (params, ToolResult); params are
+        # kept so the DataFrames keyed by id() stay alive while cached
+        self._results_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
     
     def get_tool(self, name: str):
         """Get tool by name"""
         return self.tool_dict.get(name)
     
+    def _execute(self, tool, params: dict):
+        """Run a tool, reusing the result of an identical earlier call"""
+        try:
+            key = (tool.name, _freeze(params))
+            hash(key)
+        except TypeError:
+            # Unhashable parameter value; run uncached
+            return tool.execute(**params)
+        
+        with self._cache_lock:
+            cached = self._results_cache.get(key)
+            if cached is not None:
+                self._results_cache.move_to_end(key)
+                return cached[1]
+        
+        result = tool.execute(**params)
+        with self._cache_lock:
+            self._results_cache[key] = (params, result)
+            # Bounded so old results (and their data) are released
+            if len(self._results_cache) > RESULTS_CACHE_SIZE:
+                self._results_cache.popitem(last=False)
+        return result
+    
+    def _record(self, entry: dict):
+        """Record a test outcome for the summary"""
+        getattr(self._local, "results", self.results).append(entry)
+        self._local.status = entry["status"]
+    
+    def _say(self, message: str):
+        """Print a test message now, or hold it until the outcome is known when QUIET"""
+        if QUIET:
+            self._local.pending.append(message)
+        else:
+            console.print(message)
+    
     def test_tool(self, tool_name: str, test_name: str, params: dict, expected_success: bool = True):
         """Test a tool with given parameters"""
-        console.print(f"\n[yellow]Testing {tool_name}: {test_name}[/yellow]")
+        self._local.pending = []
+        result = self._run_tool(tool_name, test_name, params, expected_success)
+        
+        # Held messages are only rendered for tests that didn't pass
+        if self._local.status != "PASS":
+            for message in self._local.pending:
+                report_console.print(message)
+        return result
+    
+    def run_group(self, group_num: int, group: tuple, logs, has_logs: bool):
+        """
+        Run one TEST_GROUPS entry.
+        
+        Returns the result of the group's first test case (None if skipped)
+        """
+        tool_name, needs, cases = group
+        console.print("\n" + "=" * 70)
+        console.print(f"[bold cyan]TEST GROUP {group_num}: {tool_name.upper()}[/bold cyan]")
+        console.print("=" * 70)
+        
+        if (needs == "rows" and not has_logs) or (needs == "frame" and logs is None):
+            console.print(f"[yellow]⚠ Skipping {tool_name} (no logs available)[/yellow]")
+            return None
+        
+        first_result = None
+        for case_num, (test_name, make_params) in enumerate(cases, 1):
+            result = self.test_tool(tool_name, test_name, make_params(logs))
+            if case_num == 1:
+                first_result = result
+            
+            if tool_name == "return_logs" and result and result.success:
+                console.print("\n[cyan]Formatted Output:[/cyan]")
+                console.print(Panel(result.data.get('formatted', 'No output'), border_style="cyan"))
+        
+        return first_result
+    
+    def _run_group_captured(self, stdout, numbered_group: tuple, logs, has_logs: bool):
+        """Run a group on a worker thread; returns its printed output and results"""
+        self._local.results = []
+        try:
+            with stdout.capturing() as buffer:
+                self.run_group(*numbered_group, logs, has_logs)
+            return buffer.getvalue(), self._local.results
+        finally:
+            del self._local.results
+    
+    def run_groups(self, numbered_groups: list, logs, has_logs: bool, max_workers: int = 8):
+        """
+        Run independent groups concurrently.
+        
+        Output and results are replayed in group order once all finish.
+        """
+        with thread_local_stdout() as stdout:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                outcomes = list(executor.map(
+                    lambda numbered: self._run_group_captured(stdout, numbered, logs, has_logs),
+                    numbered_groups
+                ))
+        
+        for output, results in outcomes:
+            sys.stdout.write(output)
+            self.results.extend(results)
+    
+    def _run_tool(self, tool_name: str, test_name: str, params: dict, expected_success: bool):
+        """Execute one tool test and record its outcome"""
+        self._say(f"\n[yellow]Testing {tool_name}: {test_name}[/yellow]")
         
         tool = self.get_tool(tool_name)
         if not tool:
-            console.print(f"[red]✗ Tool '{tool_name}' not found[/red]")
-            self.results.append({
+            self._say(f"[red]✗ Tool '{tool_name}' not found[/red]")
+            self._record({
                 "tool": tool_name,
                 "test": test_name,
                 "status": "FAIL",
@@ -50,22 +252,22 @@ class ToolTester:
         
         try:
             # Execute tool
-            result = tool.execute(**params)
+            result = self._execute(tool, params)
             
             # Check success matches expected
             success_match = result.success == expected_success
             
             if success_match:
-                console.print(f"[green]✓ {result.message}[/green]")
+                self._say(f"[green]✓ {result.message}[/green]")
                 if result.data is not None:
                     if isinstance(result.data, pd.DataFrame):
-                        console.print(f"  Data: DataFrame with {len(result.data)} rows")
+                        self._say(f"  Data: DataFrame with {len(result.data)} rows")
                     elif isinstance(result.data, dict):
-                        console.print(f"  Data: {result.data}")
+                        self._say(f"  Data: {result.data}")
                     else:
-                        console.print(f"  Data: {type(result.data).__name__}")
+                        self._say(f"  Data: {type(result.data).__name__}")
                 
-                self.results.append({
+                self._record({
                     "tool": tool_name,
                     "test": test_name,
                     "status": "PASS",
@@ -73,9 +275,9 @@ class ToolTester:
                 })
                 return result
             else:
-                console.print(f"[red]✗ Expected success={expected_success}, got {result.success}[/red]")
-                console.print(f"  Error: {result.error}")
-                self.results.append({
+                self._say(f"[red]✗ Expected success={expected_success}, got {result.success}[/red]")
+                self._say(f"  Error: {result.error}")
+                self._record({
                     "tool": tool_name,
                     "test": test_name,
                     "status": "FAIL",
@@ -84,55 +286,52 @@ class ToolTester:
                 return result
                 
         except Exception as e:
-            console.print(f"[red]✗ Exception: {e}[/red]")
-            import traceback
-            traceback.print_exc()
-            self.results.append({
+            self._say(f"[red]✗ Exception: {e}[/red]")
+            # Keep the exception; its traceback is only formatted on request
+            self._record({
                 "tool": tool_name,
                 "test": test_name,
                 "status": "ERROR",
-                "error": str(e)
+                "error": str(e),
+                "exception": e
             })
             return None
     
-    def print_summary(self):
-        """Print test summary"""
+    def print_summary(self) -> tuple:
+        """Print test summary; returns (passed, failed, errors)"""
         console.print("\n" + "=" * 70)
         console.print("[bold]TEST SUMMARY[/bold]")
         console.print("=" * 70)
         
-        table = Table(show_header=True, header_style="bold magenta")
-        table.add_column("Tool", style="cyan", width=25)
-        table.add_column("Test", style="white", width=30)
-        table.add_column("Status", justify="center", width=10)
-        
-        passed = 0
-        failed = 0
-        errors = 0
+        counts = Counter(r['status'] for r in self.results)
+        passed = counts["PASS"]
+        failed = counts["FAIL"]
+        errors = len(self.results) - passed - failed
         
-        for r in self.results:
-            status_color = {
-                "PASS": "green",
-                "FAIL": "red",
-                "ERROR": "red"
-            }.get(r['status'], "white")
+        # The table is only built when it will be shown
+        if not QUIET:
+            table = Table(show_header=True, header_style="bold magenta")
+            table.add_column("Tool", style="cyan", width=25)
+            table.add_column("Test", style="white", width=30)
+            table.add_column("Status", justify="center", width=10)
             
-            table.add_row(
-                r['tool'],
-                r['test'],
-                f"[{status_color}]{r['status']}[/{status_color}]"
-            )
+            for r in self.results:
+                table.add_row(r['tool'], r['test'], STATUS_MARKUP.get(r['status'], r['status']))
             
-            if r['status'] == "PASS":
-                passed += 1
-            elif r['status'] == "FAIL":
-                failed += 1
-            else:
-                errors += 1
+            console.print(table)
+        report_console.print(f"\n[bold]Results: {passed} passed, {failed} failed, {errors} errors[/bold]")
+        report_console.print(f"[bold]Total: {passed}/{len(self.results)} tests passed[/bold]")
+        
+        if VERBOSE:
+            for r in self.results:
+                if "exception" in r:
+                    report_console.print(f"\n[red]Traceback for {r['tool']}: {r['test']}[/red]")
+                    exc = r["exception"]
+                    report_console.print("".join(traceback.format_exception(type(exc), exc, exc.__traceback__)), markup=False, highlight=False)
+        elif errors:
+            report_console.print("[dim]Set VERBOSE=1 to show tracebacks[/dim]")
         
-        console.print(table)
-        console.print(f"\n[bold]Results: {passed} passed, {failed} failed, {errors} errors[/bold]")
-        console.print(f"[bold]Total: {passed}/{len(self.results)} tests passed[/bold]")
+        return passed, failed, errors
 
 
 def main():
@@ -158,278 +357,22 @@ def main():
     for idx, tool in enumerate(tester.tools, 1):
         console.print(f"  {idx}. {tool.name}")
     
-    # ================================================================
-    # TEST 1: SEARCH_LOGS
-    # ================================================================
-    console.print("\n" + "=" * 70)
-    console.print("[bold cyan]TEST GROUP 1: SEARCH_LOGS[/bold cyan]")
-    console.print("=" * 70)
-    
-    # Test 1.1: Basic search
-    result = tester.test_tool(
-        "search_logs",
-        "Basic search with value",
-        {"value": "MAWED07T01"},
-        expected_success=True
-    )
+    # Group 1 runs first: its first search supplies the logs for the rest
+    result = tester.run_group(1, TEST_GROUPS[0], None, False)
     search_result_df = result.data if result else None
+    has_logs = search_result_df is not None and not search_result_df.empty
     
-    # Test 1.2: Search with column filter
-    tester.test_tool(
-        "search_logs",
-        "Search with specific columns",
-        {"value": "error", "columns": ["_source.log"]},
-        expected_success=True
-    )
-    
-    # Test 1.3: Search no results
-    tester.test_tool(
-        "search_logs",
-        "Search with no results",
-        {"value": "NONEXISTENT_VALUE_12345"},
-        expected_success=True
-    )
-    
-    # ================================================================
-    # TEST 2: FILTER_BY_TIME
-    # ================================================================
-    console.print("\n" + "=" * 70)
-    console.print("[bold cyan]TEST GROUP 2: FILTER_BY_TIME[/bold cyan]")
-    console.print("=" * 70)
-    
-    if search_result_df is not None and not search_result_df.empty:
-        tester.test_tool(
-            "filter_by_time",
-            "Filter by time range",
-            {
-                "logs": search_result_df,
-                "start_time": "2024-01-01T00:00:00",
-                "end_time": "2025-12-31T23:59:59"
-            },
-            expected_success=True
-        )
-    else:
-        console.print("[yellow]⚠ Skipping filter_by_time (no logs available)[/yellow]")
-    
-    # ================================================================
-    # TEST 3: FILTER_BY_SEVERITY
-    # ================================================================
-    console.print("\n" + "=" * 70)
-    console.print("[bold cyan]TEST GROUP 3: FILTER_BY_SEVERITY[/bold cyan]")
-    console.print("=" * 70)
-    
-    if search_result_df is not None and not search_result_df.empty:
-        # Test 3.1: Filter errors
-        tester.test_tool(
-            "filter_by_severity",
-            "Filter ERROR logs",
-            {"logs": search_result_df, "severities": ["ERROR"]},
-            expected_success=True
-        )
-        
-        # Test 3.2: Filter multiple severities
-        tester.test_tool(
-            "filter_by_severity",
-            "Filter ERROR and WARNING logs",
-            {"logs": search_result_df, "severities": ["ERROR", "WARNING"]},
-            expected_success=True
-        )
-    else:
-        console.print("[yellow]⚠ Skipping filter_by_severity (no logs available)[/yellow]")
-    
-    # ================================================================
-    # TEST 4: FILTER_BY_FIELD
-    # ================================================================
-    console.print("\n" + "=" * 70)
-    console.print("[bold cyan]TEST GROUP 4: FILTER_BY_FIELD[/bold cyan]")
-    console.print("=" * 70)
-    
-    if search_result_df is not None and not search_result_df.empty:
-        tester.test_tool(
-            "filter_by_field",
-            "Filter by field value",
-            {"logs": search_result_df, "field": "_source.log", "value": "MAWED07T01"},
-            expected_success=True
-        )
-    else:
-        console.print("[yellow]⚠ Skipping filter_by_field (no logs available)[/yellow]")
-    
-    # ================================================================
-    # TEST 5: GET_LOG_COUNT
-    # ================================================================
-    console.print("\n" + "=" * 70)
-    console.print("[bold cyan]TEST GROUP 5: GET_LOG_COUNT[/bold cyan]")
-    console.print("=" * 70)
-    
-    if search_result_df is not None:
-        tester.test_tool(
-            "get_log_count",
-            "Count logs",
-            {"logs": search_result_df},
-            expected_success=True
-        )
-    else:
-        console.print("[yellow]⚠ Skipping get_log_count (no logs available)[/yellow]")
-    
-    # ================================================================
-    # TEST 6: EXTRACT_ENTITIES
-    # ================================================================
-    console.print("\n" + "=" * 70)
-    console.print("[bold cyan]TEST GROUP 6: EXTRACT_ENTITIES[/bold cyan]")
-    console.print("=" * 70)
-    
-    if search_result_df is not None and not search_result_df.empty:
-        # Test 6.1: Extract single entity type
-        result = tester.test_tool(
-            "extract_entities",
-            "Extract single entity type",
-            {"logs": search_result_df, "entity_types": ["cm_mac"]},
-            expected_success=True
-        )
-        entities_result = result.data if result else {}
-        
-        # Test 6.2: Extract multiple entity types
-        tester.test_tool(
-            "extract_entities",
-            "Extract multiple entity types",
-            {"logs": search_result_df, "entity_types": ["cm_mac", "rpdname", "md_id"]},
-            expected_success=True
-        )
-        
-        # Test 6.3: Extract all entity types
-        tester.test_tool(
-            "extract_entities",
-            "Extract all entity types (empty list)",
-            {"logs": search_result_df, "entity_types": []},
-            expected_success=True
-        )
-    else:
-        console.print("[yellow]⚠ Skipping extract_entities (no logs available)[/yellow]")
-        entities_result = {}
-    
-    # ================================================================
-    # TEST 7: COUNT_ENTITIES
-    # ================================================================
-    console.print("\n" + "=" * 70)
-    console.print("[bold cyan]TEST GROUP 7: COUNT_ENTITIES[/bold cyan]")
-    console.print("=" * 70)
-    
-    if search_result_df is not None and not search_result_df.empty:
-        tester.test_tool(
-            "count_entities",
-            "Count entities of specific type",
-            {"logs": search_result_df, "entity_type": "cm_mac"},
-            expected_success=True
-        )
-    else:
-        console.print("[yellow]⚠ Skipping count_entities (no logs available)[/yellow]")
-    
-    # ================================================================
-    # TEST 8: AGGREGATE_ENTITIES
-    # ================================================================
-    console.print("\n" + "=" * 70)
-    console.print("[bold cyan]TEST GROUP 8: AGGREGATE_ENTITIES[/bold cyan]")
-    console.print("=" * 70)
-    
-    if search_result_df is not None and not search_result_df.empty:
-        tester.test_tool(
-            "aggregate_entities",
-            "Aggregate entity statistics",
-            {"logs": search_result_df, "entity_types": ["cm_mac", "rpdname"]},
-            expected_success=True
-        )
-    else:
-        console.print("[yellow]⚠ Skipping aggregate_entities (no logs available)[/yellow]")
-    
-    # ================================================================
-    # TEST 9: FIND_ENTITY_RELATIONSHIPS
-    # ================================================================
-    console.print("\n" + "=" * 70)
-    console.print("[bold cyan]TEST GROUP 9: FIND_ENTITY_RELATIONSHIPS[/bold cyan]")
-    console.print("=" * 70)
-    
-    if search_result_df is not None and not search_result_df.empty:
-        tester.test_tool(
-            "find_entity_relationships",
-            "Find entity relationships",
-            {"logs": search_result_df, "target_value": "MAWED07T01", "related_types": ["cm_mac"]},
-            expected_success=True
-        )
-    else:
-        console.print("[yellow]⚠ Skipping find_entity_relationships (no logs available)[/yellow]")
-    
-    # ================================================================
-    # TEST 10: NORMALIZE_TERM
-    # ================================================================
-    console.print("\n" + "=" * 70)
-    console.print("[bold cyan]TEST GROUP 10: NORMALIZE_TERM[/bold cyan]")
-    console.print("=" * 70)
-    
-    tester.test_tool(
-        "normalize_term",
-        "Normalize search term",
-        {"term": "reg"},
-        expected_success=True
-    )
-    
-    # ================================================================
-    # TEST 11: FUZZY_SEARCH
-    # ================================================================
-    console.print("\n" + "=" * 70)
-    console.print("[bold cyan]TEST GROUP 11: FUZZY_SEARCH[/bold cyan]")
-    console.print("=" * 70)
-    
-    tester.test_tool(
-        "fuzzy_search",
-        "Fuzzy search with normalized term",
-        {"logs": search_result_df if search_result_df is not None else pd.DataFrame(), "term": "error"},
-        expected_success=True
-    )
-    
-    # ================================================================
-    # TEST 12: RETURN_LOGS
-    # ================================================================
-    console.print("\n" + "=" * 70)
-    console.print("[bold cyan]TEST GROUP 12: RETURN_LOGS[/bold cyan]")
-    console.print("=" * 70)
-    
-    if search_result_df is not None and not search_result_df.empty:
-        result = tester.test_tool(
-            "return_logs",
-            "Format logs for display",
-            {"logs": search_result_df, "max_samples": 3},
-            expected_success=True
-        )
-        
-        if result and result.success:
-            console.print("\n[cyan]Formatted Output:[/cyan]")
-            console.print(Panel(result.data.get('formatted', 'No output'), border_style="cyan"))
-    else:
-        console.print("[yellow]⚠ Skipping return_logs (no logs available)[/yellow]")
-    
-    # ================================================================
-    # TEST 13: FINALIZE_ANSWER
-    # ================================================================
-    console.print("\n" + "=" * 70)
-    console.print("[bold cyan]TEST GROUP 13: FINALIZE_ANSWER[/bold cyan]")
-    console.print("=" * 70)
-    
-    tester.test_tool(
-        "finalize_answer",
-        "Finalize with answer",
-        {"answer": "Test answer", "confidence": 0.95},
-        expected_success=True
-    )
+    # Groups 2-13 only read that frame, so they run concurrently
+    tester.run_groups(list(enumerate(TEST_GROUPS, 1))[1:], search_result_df, has_logs)
     
     # Print summary
-    tester.print_summary()
+    passed, failed, errors = tester.print_summary()
     
     # Check if all passed
-    all_passed = all(r['status'] == 'PASS' for r in tester.results)
-    if all_passed:
-        console.print("\n[bold green]✓ ALL TOOLS WORKING CORRECTLY[/bold green]")
+    if failed == 0 and errors == 0:
+        report_console.print("\n[bold green]✓ ALL TOOLS WORKING CORRECTLY[/bold green]")
     else:
-        console.print("\n[bold red]✗ SOME TOOLS HAVE ISSUES - FIX BEFORE ORCHESTRATION[/bold red]")
+        report_console.print("\n[bold red]✗ SOME TOOLS HAVE ISSUES - FIX BEFORE ORCHESTRATION[/bold red]")
 
 
 if __name__ == "__main__":
@@ -3,7 +3,9 @@ Test iterative ReAct with qwen3-loganalyzer
 Just send query + history, no extra prompts
 """
 
+import functools
 import json
+from src.core.tools import create_all_tools
 from src.llm.ollama_client import OllamaClient
 
 queries = [
@@ -11,54 +13,85 @@ queries = [
     "Count unique CM MACs in warning logs"
 ]
 
+# Log file whose tool registry names the actions the model may pick
+LOG_FILE = "test.csv"
+
+# Canned tool outputs fed back to the model in place of real tool runs
+SIMULATED_RESULTS = {
+    "grep_logs": "Found 150 logs",
+    "parse_json_field": "Extracted 150 values for CmMacAddress",
+    "extract_unique": "Found 15 unique values",
+    "count_values": "Count: 15 unique",
+    "grep_and_parse": "Found 40 logs, extracted 12 unique values",
+    "find_relationship_chain": "Found chain: cm_mac -> MdId -> RpdName (2 hops)",
+    "count_unique_per_group": "Counted unique values in 3 groups: MAWED07T01=12, MAWED07T02=8, MAWED07T03=5",
+    "count_via_relationship": "Count: 25 values via 2 relationship chains",
+    "sort_by_time": "Sorted 150 logs by timestamp",
+    "extract_time_range": "Filtered to 80 logs",
+    "summarize_logs": "150 logs: 25 ERROR, 40 WARNING, 85 INFO",
+    "aggregate_by_field": "Grouped 150 logs into 6 Severity values",
+    "analyze_logs": "Found 3 patterns; likely root cause: repeated CM registration failures",
+    "return_logs": "Displayed 5 sample logs",
+    "finalize_answer": "DONE"
+}
+
+
+@functools.lru_cache(maxsize=None)
+def simulated_results() -> dict:
+    """Canned output per registered tool, fed back to the model in place of real runs.
+    
+    Built from the live tool registry on first use so the table follows
+    create_all_tools; a tool missing from SIMULATED_RESULTS gets a generic line.
+    """
+    return {
+        tool.name: SIMULATED_RESULTS.get(tool.name, f"Executed {tool.name}")
+        for tool in create_all_tools(LOG_FILE)
+    }
+
 def simulate_result(action: str) -> str:
     """Simulate tool result"""
-    results = {
-        "search_logs": "Found 150 logs",
-        "filter_by_time": "Filtered to 80 logs",
-        "filter_by_severity": "Filtered to 25 logs",
-        "filter_by_field": "Filtered to 40 logs",
-        "extract_entities": "Extracted 15 entities",
-        "count_entities": "Count: 15 unique",
-        "aggregate_entities": "Found 15 unique values",
-        "find_entity_relationships": "Found 5 related entities",
-        "normalize_term": "Normalized to: cm_mac",
-        "fuzzy_search": "Found 8 matching logs",
-        "get_log_count": "Total: 150 logs",
-        "return_logs": "Displayed 5 sample logs",
-        "finalize_answer": "DONE"
-    }
-    return results.get(action, "Executed")
+    return simulated_results().get(action, "Executed")
 
 def test_iterative():
     client = OllamaClient(model="qwen3-react")
     
-    for idx, query in enumerate(queries, 1):
+    # Queries are independent, so each iteration sends every still-active
+    # query's prompt in one batch instead of running the queries one by one
+    histories = {idx: [] for idx in range(1, len(queries) + 1)}
+    active = list(histories)
+    
+    for iteration in range(1, 5):  # max 4 iterations
+        if not active:
+            break
+        
         print(f"\n{'='*60}")
-        print(f"Test {idx}: {query}")
+        print(f"Iteration {iteration} (active tests: {active})")
         print('='*60)
         
-        history = []
-        
-        for iteration in range(1, 5):  # max 4 iterations
-            print(f"\n--- Iteration {iteration} ---")
-            
-            # Build simple message
+        # Build simple messages
+        messages = []
+        for idx in active:
+            query = queries[idx - 1]
+            history = histories[idx]
             if history:
                 msg = f"Query: {query}\n\nPrevious: {history}\n\nNext action?"
             else:
                 msg = query
-            
+            messages.append(msg)
+        
+        # Call LLM
+        responses = client.generate_batch(messages)
+        
+        still_active = []
+        for idx, msg, response in zip(active, messages, responses):
+            print(f"\n--- Test {idx}: {queries[idx - 1]} ---")
             print(f"Sending: {msg}\n")
             
-            # Call LLM
-            response = client.generate(msg)
-            
             # Extract JSON (skip <think> tags)
             json_str = response
             if "<think>" in response:
-                # Remove thinking process
-                json_str = response.split("</think>")[-1].strip()
+                # Remove thinking process (text after the last </think>)
+                json_str = response.rpartition("</think>")[2].strip()
             
             print(f"LLM Response (thinking + JSON):\n{response[:200]}...\n")
             print(f"Extracted JSON: {json_str}\n")
@@ -70,16 +103,19 @@ def test_iterative():
                 result = simulate_result(action)
                 print(f"Simulated: {result}")
                 
-                history.append(f"{action} → {result}")
+                histories[idx].append(f"{action} → {result}")
                 
                 if action == "finalize_answer":
                     print(f"\n✓ Done in {iteration} steps")
-                    break
+                    continue
                     
             except:
                 print("✗ Parse failed")
-                break
+                continue
+            
+            still_active.append(idx)
+        
+        active = still_active
 
 if __name__ == "__main__":
     test_iterative()
-
@@ -5,11 +5,19 @@ Tests the full iterative ReAct architecture end-to-end with real tools
 and LLM integration.
 """
 
+import os
+import socket
 import sys
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 sys.path.insert(0, '.')
 
+import pytest
+
 from src.core import IterativeReactOrchestrator
 from src.utils.logger import setup_logger
+from thread_output import thread_local_stdout
 
 logger = setup_logger()
 
@@ -65,6 +73,73 @@ TEST_QUERIES = [
     },
 ]
 
+# Iteration cap for the test orchestrator: one past the largest expected
+# count, so runaway queries stop early. REACT_MAX_ITERATIONS overrides it.
+MAX_ITERATIONS = int(os.environ.get(
+    "REACT_MAX_ITERATIONS",
+    max(tc["expected_iterations"][1] for tc in TEST_QUERIES) + 1
+))
+# Edge-case queries only need to show they don't crash
+EDGE_CASE_MAX_ITERATIONS = 4
+
+
+@pytest.fixture(scope="module")
+def orchestrator(orchestrator):
+    """
+    The shared session orchestrator, capped at MAX_ITERATIONS for this
+    module; the original cap is restored afterwards so it doesn't leak
+    into other modules' tests.
+    """
+    max_iterations = orchestrator.max_iterations
+    orchestrator.max_iterations = MAX_ITERATIONS
+    yield orchestrator
+    orchestrator.max_iterations = max_iterations
+
+
+# Where the orchestrator's OllamaClient connects by default
+OLLAMA_ADDRESS = ("localhost", 11434)
+
+
+def ollama_reachable(timeout: float = 0.5) -> bool:
+    """Cheap TCP preflight: is anything listening on the Ollama port?"""
+    try:
+        socket.create_connection(OLLAMA_ADDRESS, timeout=timeout).close()
+        return True
+    except OSError:
+        return False
+
+
+def _print_setup_help():
+    """Print what the suite needs to run."""
+    print("\nPlease ensure:")
+    print("  1. Ollama is running (ollama serve)")
+    print("  2. qwen3-react model exists (ollama list)")
+    print("  3. test.csv exists in current directory")
+
+
+# (query, exception) for main queries that raised; VERBOSE=1 prints tracebacks
+QUERY_EXCEPTIONS = []
+VERBOSE = bool(os.environ.get("VERBOSE"))
+# QUIET=1: skip per-query detail and the output of queries that passed
+QUIET = bool(os.environ.get("QUIET"))
+
+# Main queries in flight at once; Ollama serves OLLAMA_NUM_PARALLEL
+# requests per model concurrently (4 by default) and queues the rest
+QUERY_WORKERS = 4
+
+
+def _run_query(stdout, orchestrator, test_num, test_case):
+    """Run one main query on a worker thread; returns (passed, output)."""
+    with stdout.capturing() as buffer:
+        passed = test_single_query(orchestrator, test_case, test_num, len(TEST_QUERIES))
+    return passed, buffer.getvalue()
+
+
+@pytest.mark.parametrize(
+    "test_case, test_num, total_tests",
+    [(case, num, len(TEST_QUERIES)) for num, case in enumerate(TEST_QUERIES, 1)],
+    ids=[case["query"] for case in TEST_QUERIES]
+)
 def test_single_query(orchestrator, test_case, test_num, total_tests):
     """
     Test a single query.
@@ -82,11 +157,12 @@ def test_single_query(orchestrator, test_case, test_num, total_tests):
     expected_min, expected_max = test_case["expected_iterations"]
     description = test_case["description"]
     
-    print(f"\n{'='*70}")
-    print(f"TEST {test_num}/{total_tests}: {description}")
-    print(f"Query: \"{query}\"")
-    print(f"Expected: {expected_min}-{expected_max} iterations")
-    print('='*70)
+    if not QUIET:
+        print(f"\n{'='*70}")
+        print(f"TEST {test_num}/{total_tests}: {description}")
+        print(f"Query: \"{query}\"")
+        print(f"Expected: {expected_min}-{expected_max} iterations")
+        print('='*70)
     
     try:
         # Process query
@@ -98,15 +174,17 @@ def test_single_query(orchestrator, test_case, test_num, total_tests):
             return False
         
         # Display results
-        print(f"\n✓ SUCCESS")
-        print(f"Answer: {result['answer']}")
-        print(f"Iterations: {result['iterations']}/{result['max_iterations']}")
-        print(f"Tools used: {' → '.join(result['tools_used'])}")
+        if not QUIET:
+            print(f"\n✓ SUCCESS")
+            print(f"Answer: {result['answer']}")
+            print(f"Iterations: {result['iterations']}/{result['max_iterations']}")
+            print(f"Tools used: {' → '.join(result['tools_used'])}")
         
         # Check iteration count
         iterations = result['iterations']
         if expected_min <= iterations <= expected_max:
-            print(f"✓ Iterations within expected range")
+            if not QUIET:
+                print(f"✓ Iterations within expected range")
             return True
         else:
             print(f"⚠ WARNING: Iterations ({iterations}) outside expected range ({expected_min}-{expected_max})")
@@ -115,8 +193,8 @@ def test_single_query(orchestrator, test_case, test_num, total_tests):
             
     except Exception as e:
         print(f"✗ EXCEPTION: {e}")
-        import traceback
-        traceback.print_exc()
+        # Formatted by main() only when VERBOSE is set
+        QUERY_EXCEPTIONS.append((query, e))
         return False
 
 def test_edge_cases(orchestrator):
@@ -148,23 +226,29 @@ def test_edge_cases(orchestrator):
         },
     ]
     
+    # The edge cases are independent; run them as one concurrent batch
+    # under a tighter iteration cap
+    max_iterations = orchestrator.max_iterations
+    orchestrator.max_iterations = min(max_iterations, EDGE_CASE_MAX_ITERATIONS)
+    try:
+        results = orchestrator.process_batch([tc["query"] for tc in edge_cases])
+    except Exception as e:
+        print(f"✗ EXCEPTION: {e}")
+        return 0
+    finally:
+        orchestrator.max_iterations = max_iterations
+    
     passed = 0
-    for i, test_case in enumerate(edge_cases, 1):
+    for i, (test_case, result) in enumerate(zip(edge_cases, results), 1):
         print(f"\nEdge Case {i}: {test_case['description']}")
         print(f"Query: \"{test_case['query']}\"")
         
-        try:
-            result = orchestrator.process(test_case["query"])
-            
-            # For edge cases, we just check it doesn't crash
-            if result["success"] or "error" in result:
-                print(f"✓ Handled gracefully: {result['answer'][:100]}")
-                passed += 1
-            else:
-                print(f"✗ Unexpected result")
-                
-        except Exception as e:
-            print(f"✗ EXCEPTION: {e}")
+        # For edge cases, we just check it doesn't crash
+        if result["success"] or "error" in result:
+            print(f"✓ Handled gracefully: {result['answer'][:100]}")
+            passed += 1
+        else:
+            print(f"✗ Unexpected result")
     
     return passed
 
@@ -222,35 +306,53 @@ def main():
     print("ITERATIVE REACT ORCHESTRATOR - COMPREHENSIVE TEST SUITE")
     print("=" * 70)
     
+    # Preflight before building anything: without these every query would
+    # only fail after the client's retries
+    if not Path("test.csv").exists():
+        print("\n✗ test.csv not found")
+        _print_setup_help()
+        return
+    if not ollama_reachable():
+        print(f"\n✗ Ollama not reachable at {OLLAMA_ADDRESS[0]}:{OLLAMA_ADDRESS[1]}")
+        _print_setup_help()
+        return
+    
     # Initialize orchestrator
     print("\nInitializing orchestrator...")
     print("  Log file: test.csv")
     print("  Model: qwen3-react")
-    print("  Max iterations: 10 (configurable via max_iterations parameter)")
+    print(f"  Max iterations: {MAX_ITERATIONS} (override with REACT_MAX_ITERATIONS)")
     
     try:
         orchestrator = IterativeReactOrchestrator(
             log_file="test.csv",
             config_dir="config",
             model="qwen3-react",
-            max_iterations=10,  # You can change this: 5, 15, 20, etc.
+            max_iterations=MAX_ITERATIONS,
             verbose=True  # Enable verbose to see prompts and responses
         )
         print("✓ Orchestrator initialized\n")
     except Exception as e:
         print(f"✗ Failed to initialize orchestrator: {e}")
-        print("\nPlease ensure:")
-        print("  1. Ollama is running (ollama serve)")
-        print("  2. qwen3-react model exists (ollama list)")
-        print("  3. test.csv exists in current directory")
+        _print_setup_help()
         return
     
     # Run main tests
     print(f"\nRunning {len(TEST_QUERIES)} main test cases...")
-    results = []
     
-    for i, test_case in enumerate(TEST_QUERIES, 1):
-        passed = test_single_query(orchestrator, test_case, i, len(TEST_QUERIES))
+    # Each query is its own ReActState and mostly waits on the LLM, so the
+    # queries overlap on threads; outputs are printed in query order
+    with thread_local_stdout() as stdout:
+        with ThreadPoolExecutor(max_workers=QUERY_WORKERS) as executor:
+            outcomes = list(executor.map(
+                lambda numbered: _run_query(stdout, orchestrator, *numbered),
+                enumerate(TEST_QUERIES, 1)
+            ))
+    
+    results = []
+    for passed, output in outcomes:
+        if not (QUIET and passed):
+            print(output, end="")
         results.append(passed)
     
     # Run edge case tests
@@ -283,6 +385,11 @@ def main():
         print("✗ NEEDS WORK - Significant issues detected")
     
     print('='*70)
+    
+    if VERBOSE:
+        for query, exc in QUERY_EXCEPTIONS:
+            print(f"\nTraceback for \"{query}\":")
+            print("".join(traceback.format_exception(type(exc), exc, exc.__traceback__)), end="")
 
 if __name__ == "__main__":
     main()
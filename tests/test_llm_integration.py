@@ -1,19 +1,59 @@
 #!/usr/bin/env python
-"""Test script for Phase 3 LLM integration."""
+"""
+Test script for Phase 3 LLM integration.
 
+The generation requests are sent concurrently; start the server with
+OLLAMA_NUM_PARALLEL > 1 (e.g. OLLAMA_NUM_PARALLEL=4 ollama serve) for
+them to actually run in parallel.
+
+Sample-log analyses are cached on disk (~/.cache/log-analyser/llm.json)
+so repeat runs skip unchanged chunks; set LLM_CACHE=0 to always query
+the model.
+"""
+
+import asyncio
+import functools
+import json
+import os
 import sys
 from pathlib import Path
+from typing import List
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-from src.llm import OllamaClient, PromptBuilder, ResponseParser
+from src.llm import OllamaClient, PromptBuilder, ResponseParser, TemplateCache
 from src.core.log_processor import LogProcessor
 from src.core.chunker import LogChunker
 
-console = Console()
+# When output is piped (CI, log files) skip colour and the repr highlighter;
+# markup stays on so the [tags] are still stripped from the text
+_interactive = sys.stdout.isatty()
+# QUIET=1: no progress output at all
+QUIET = bool(os.environ.get("QUIET"))
+console = Console(highlight=_interactive, no_color=not _interactive, quiet=QUIET)
+
+
+# LLM_CACHE=0 sends every sample-log chunk to the model, ignoring cached responses
+USE_LLM_CACHE = os.environ.get("LLM_CACHE", "1") != "0"
+
+# Max sample-log chunks sent to the model, so the test's cost doesn't grow
+# with the sample file
+MAX_SAMPLE_CHUNKS = 3
+
+
+@functools.lru_cache(maxsize=None)
+def get_response_cache() -> TemplateCache:
+    """On-disk cache of sample-log analyses, shared by repeated test runs."""
+    return TemplateCache()
+
+
+@functools.lru_cache(maxsize=None)
+def get_client() -> OllamaClient:
+    """Shared OllamaClient, so every test reuses one pooled HTTP session."""
+    return OllamaClient()
 
 
 def test_ollama_connection():
@@ -21,7 +61,7 @@ def test_ollama_connection():
     console.print("\n[bold cyan]═══ Testing Ollama Connection ═══[/bold cyan]\n")
     
     console.print("[yellow]→ Initializing Ollama client...[/yellow]")
-    client = OllamaClient()
+    client = get_client()
     
     console.print("[yellow]→ Checking server health...[/yellow]")
     is_healthy = client.health_check()
@@ -147,79 +187,136 @@ def test_response_parser():
     return parser
 
 
+JSON_PROMPT = """Generate a simple JSON object with these fields:
+- status: "ok"
+- message: "test successful"
+- count: 42
+
+Return ONLY the JSON, no other text."""
+
+
+async def _run_generations(client: OllamaClient, system_prompt: str, chunk_prompts: List[str]):
+    """
+    Issue the independent generation requests concurrently.
+    
+    Returns:
+        (text response, JSON response, per-chunk log analyses); a failed
+        request yields its exception instead of a result
+    """
+    return await asyncio.gather(
+        client.agenerate(
+            prompt="Say 'Hello, I am working!' and nothing else.",
+            temperature=0.1,
+            max_tokens=50
+        ),
+        client.agenerate_json(prompt=JSON_PROMPT, temperature=0.1),
+        # generate_json_batch runs its own event loop, so give it a thread
+        asyncio.to_thread(
+            client.generate_json_batch,
+            chunk_prompts,
+            system_prompt=system_prompt,
+            temperature=0.3
+        ),
+        return_exceptions=True
+    )
+
+
 def test_llm_generation(client: OllamaClient, builder: PromptBuilder, parser: ResponseParser):
-    """Test actual LLM generation (if Ollama is available)."""
+    """
+    Test actual LLM generation (if Ollama is available).
+    
+    The requests are sent together; the server only works on them in
+    parallel when started with OLLAMA_NUM_PARALLEL > 1, otherwise it
+    queues them.
+    """
     console.print("\n[bold cyan]═══ Testing LLM Generation ═══[/bold cyan]\n")
     
     if not client:
         console.print("[yellow]⚠ Skipping LLM generation test (Ollama not available)[/yellow]")
         return
     
-    # Simple test prompt
-    console.print("[yellow]→ Testing simple text generation...[/yellow]")
+    # Build the log analysis prompt up front so all requests can go out together
     try:
-        response = client.generate(
-            prompt="Say 'Hello, I am working!' and nothing else.",
-            temperature=0.1,
-            max_tokens=50
-        )
-        console.print(f"[green]✓[/green] Generated response: {response[:100]}")
+        # Load sample logs
+        processor = LogProcessor("tests/sample_logs/system.csv")
+        logs = processor.read_all_logs()
+        
+        # Get CM12345 logs
+        cm_logs = processor.filter_by_entity(logs, "entity_id", "CM12345")
+        
+        # The system prompt doesn't depend on the logs
+        system_prompt, _ = builder.build_find_prompt(entity="CM12345", log_chunk="")
+        
+        # One find prompt per chunk, as the production path would send them
+        chunks = LogChunker().chunk_by_size(cm_logs, max_tokens=2000)[:MAX_SAMPLE_CHUNKS]
+        chunk_prompts = []
+        for chunk in chunks:
+            log_chunk = builder.format_log_chunk(chunk.logs.to_dict('records'))
+            _, user_prompt = builder.build_find_prompt(
+                entity="CM12345",
+                log_chunk=log_chunk
+            )
+            chunk_prompts.append(user_prompt)
     except Exception as e:
-        console.print(f"[red]✗[/red] Generation failed: {e}")
+        console.print(f"[red]✗[/red] Could not prepare sample log prompts: {e}")
         return
     
+    if not chunk_prompts:
+        console.print("[yellow]⚠ Skipping LLM generation test (no CM12345 logs in the sample)[/yellow]")
+        return
+    
+    # Only chunks without a cached response go to the model
+    cache = get_response_cache() if USE_LLM_CACHE else None
+    keys = [TemplateCache.key(client.model, system_prompt, prompt) for prompt in chunk_prompts]
+    cached = [cache.get(key) if cache is not None else None for key in keys]
+    misses = [i for i, hit in enumerate(cached) if hit is None]
+    
+    console.print("[yellow]→ Sending text, JSON and log analysis requests...[/yellow]")
+    console.print(
+        f"  Log analysis: {len(cm_logs)} logs, first {len(chunk_prompts)} chunk(s), "
+        f"{len(chunk_prompts) - len(misses)} cached"
+    )
+    response, json_response, chunk_responses = asyncio.run(
+        _run_generations(client, system_prompt, [chunk_prompts[i] for i in misses])
+    )
+    
+    if not isinstance(chunk_responses, Exception):
+        for i, chunk_response in zip(misses, chunk_responses):
+            cached[i] = chunk_response
+            if cache is not None:
+                cache.put(keys[i], chunk_response)
+        if cache is not None:
+            cache.save()
+        chunk_responses = cached
+    
+    # Simple test prompt
+    console.print("\n[yellow]→ Simple text generation[/yellow]")
+    if isinstance(response, Exception):
+        console.print(f"[red]✗[/red] Generation failed: {response}")
+    else:
+        console.print(f"[green]✓[/green] Generated response: {response[:100]}")
+    
     # Test JSON generation
-    console.print("\n[yellow]→ Testing JSON generation...[/yellow]")
-    try:
-        json_prompt = """Generate a simple JSON object with these fields:
-- status: "ok"
-- message: "test successful"
-- count: 42
-
-Return ONLY the JSON, no other text."""
-        
-        json_response = client.generate_json(
-            prompt=json_prompt,
-            temperature=0.1
-        )
+    console.print("\n[yellow]→ JSON generation[/yellow]")
+    if isinstance(json_response, Exception):
+        console.print(f"[red]✗[/red] JSON generation failed: {json_response}")
+    else:
         console.print(f"[green]✓[/green] Generated JSON with {len(json_response)} keys")
         console.print(f"  Keys: {list(json_response.keys())}")
-    except Exception as e:
-        console.print(f"[red]✗[/red] JSON generation failed: {e}")
-        return
     
     # Test with actual log data
-    console.print("\n[yellow]→ Testing with sample log data...[/yellow]")
+    console.print("\n[yellow]→ Sample log data analysis[/yellow]")
+    if isinstance(chunk_responses, Exception):
+        console.print(f"[red]✗[/red] Log analysis failed: {chunk_responses}")
+        return
+    
     try:
-        # Load sample logs
-        processor = LogProcessor("tests/sample_logs/system.csv")
-        logs = processor.read_all_logs()
-        
-        # Get CM12345 logs
-        cm_logs = processor.filter_by_entity(logs, "entity_id", "CM12345")
-        
-        # Format for LLM
-        log_dicts = cm_logs.to_dict('records')[:5]  # First 5 entries
-        log_chunk = builder.format_log_chunk(log_dicts)
-        
-        # Build prompt
-        system_prompt, user_prompt = builder.build_find_prompt(
-            entity="CM12345",
-            log_chunk=log_chunk
-        )
-        
-        console.print(f"  Sending {len(log_chunk)} chars to LLM...")
-        
-        # Generate response
-        llm_response = client.generate_json(
-            prompt=user_prompt,
-            system_prompt=system_prompt,
-            temperature=0.3
+        # Parse each chunk's response and merge them
+        parsed = parser.merge_responses(
+            [parser.parse_find_response(r) for r in chunk_responses],
+            mode="find"
         )
         
-        # Parse response
-        parsed = parser.parse_find_response(llm_response)
-        
         console.print(f"[green]✓[/green] LLM analysis complete!")
         console.print(f"  Entities found: {parsed['entities_found']}")
         console.print(f"  Next entities: {parsed['next_entities']}")
@@ -237,6 +334,88 @@ Return ONLY the JSON, no other text."""
         traceback.print_exc()
 
 
+def test_template_cache_roundtrip(tmp_path):
+    """Cached responses survive a reload and are written most-used first."""
+    path = tmp_path / "llm.json"
+    cache = TemplateCache(path)
+    cold, hot = TemplateCache.key("sys", "cold"), TemplateCache.key("sys", "hot")
+    cache.put(cold, {"entities_found": []})
+    cache.put(hot, {"entities_found": ["CM12345"]})
+    assert cache.get(hot) == {"entities_found": ["CM12345"]}
+    assert cache.get(TemplateCache.key("sys", "missing")) is None
+    cache.save()
+    
+    reloaded = TemplateCache(path)
+    assert len(reloaded) == 2
+    assert list(reloaded._entries) == [hot, cold]
+    assert reloaded.get(cold) == {"entities_found": []}
+
+
+def test_template_cache_ignores_corrupt_file(tmp_path):
+    """An unreadable cache file starts empty and is replaced on save."""
+    path = tmp_path / "llm.json"
+    path.write_text('{"truncated": {"response": ', encoding="utf-8")
+    
+    cache = TemplateCache(path)
+    assert len(cache) == 0
+    
+    key = TemplateCache.key("qwen3-loganalyzer", "sys", "prompt")
+    cache.put(key, {"entities_found": []})
+    cache.save()
+    assert TemplateCache(path).get(key) == {"entities_found": []}
+
+
+def test_template_cache_save_merges_with_disk(tmp_path):
+    """Two caches saving to one file keep each other's entries."""
+    path = tmp_path / "llm.json"
+    first, second = TemplateCache(path), TemplateCache(path)
+    first.put("first", {"entities_found": ["CM1"]})
+    second.put("second", {"entities_found": ["CM2"]})
+    first.save()
+    second.save()
+    
+    reloaded = TemplateCache(path)
+    assert reloaded.get("first") == {"entities_found": ["CM1"]}
+    assert reloaded.get("second") == {"entities_found": ["CM2"]}
+    assert [p.name for p in tmp_path.iterdir()] == ["llm.json"]
+
+
+def test_template_cache_orders_by_hits(tmp_path):
+    """Entries load and save most-used first; keys differ per model."""
+    path = tmp_path / "llm.json"
+    path.write_text(json.dumps({
+        "one": {"response": 1, "hits": 1},
+        "five": {"response": 5, "hits": 5},
+        "three": {"response": 3, "hits": 3},
+    }), encoding="utf-8")
+    
+    cache = TemplateCache(path)
+    assert list(cache._entries) == ["five", "three", "one"]
+    
+    for _ in range(5):
+        cache.get("one")
+    cache.save()
+    assert list(TemplateCache(path)._entries) == ["one", "five", "three"]
+    
+    assert TemplateCache.key("model-a", "sys", "prompt") != TemplateCache.key("model-b", "sys", "prompt")
+
+
+def run_buffered(test_func, *args):
+    """
+    Run a test step with its console output captured and written in one go.
+    
+    Rich still renders each line, but the terminal gets a single write per
+    step instead of one per console.print call.
+    """
+    capture = console.capture()
+    try:
+        with capture:
+            return test_func(*args)
+    finally:
+        sys.stdout.write(capture.get())
+        sys.stdout.flush()
+
+
 def main():
     """Run all LLM integration tests."""
     console.print(Panel.fit(
@@ -247,16 +426,16 @@ def main():
     
     try:
         # Test Ollama connection
-        client = test_ollama_connection()
+        client = run_buffered(test_ollama_connection)
         
         # Test prompt builder
-        builder = test_prompt_builder()
+        builder = run_buffered(test_prompt_builder)
         
         # Test response parser
-        parser = test_response_parser()
+        parser = run_buffered(test_response_parser)
         
         # Test LLM generation (if available)
-        test_llm_generation(client, builder, parser)
+        run_buffered(test_llm_generation, client, builder, parser)
         
         console.print("\n[bold green]═══ All Phase 3 Tests Completed! ═══[/bold green]\n")
         
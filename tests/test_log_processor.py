@@ -12,6 +12,11 @@ from src.utils.exceptions import LogFileError
 SAMPLE_LOG = "tests/sample_logs/system.csv"
 
 
+def _rows_contain(logs: pd.DataFrame, text: str) -> pd.Series:
+    """Per row: does any column's value contain text?"""
+    return logs.astype(str).apply(lambda col: col.str.contains(text, regex=False)).any(axis=1)
+
+
 def test_log_processor_initialization():
     """Test LogProcessor initialization with valid file."""
     processor = LogProcessor(SAMPLE_LOG)
@@ -40,28 +45,49 @@ def test_read_all_logs():
 def test_read_csv_stream():
     """Test streaming log file in chunks."""
     processor = LogProcessor(SAMPLE_LOG)
-    chunks = list(processor.read_csv_stream(chunk_size=10))
     
-    assert len(chunks) > 0
-    assert all(isinstance(chunk, pd.DataFrame) for chunk in chunks)
+    # Check chunks as they stream in rather than holding them all
+    chunk_count = 0
+    for chunk in processor.read_csv_stream(chunk_size=10):
+        assert isinstance(chunk, pd.DataFrame)
+        chunk_count += 1
+    
+    assert chunk_count > 0
+
+
+def test_read_parquet_logs(tmp_path):
+    """Test reading a Parquet copy of the log file."""
+    pytest.importorskip("pyarrow")
+    
+    csv_logs = LogProcessor(SAMPLE_LOG).read_all_logs()
+    parquet_file = tmp_path / "system.parquet"
+    csv_logs.to_parquet(parquet_file, index=False)
+    
+    processor = LogProcessor(str(parquet_file))
+    logs = processor.read_all_logs()
+    streamed_rows = sum(len(chunk) for chunk in processor.read_csv_stream(chunk_size=10))
+    
+    assert len(logs) == len(csv_logs)
+    assert list(logs.columns) == list(csv_logs.columns)
+    assert streamed_rows == len(logs)
 
 
-def test_filter_by_entity():
+def test_filter_by_entity(sample_logs_session):
     """Test filtering logs by entity value."""
     processor = LogProcessor(SAMPLE_LOG)
-    logs = processor.read_all_logs()
+    logs = sample_logs_session
     
     # Filter for CM12345
     filtered = processor.filter_by_entity(logs, "entity_id", "CM12345")
     
     assert len(filtered) > 0
-    assert all("CM12345" in str(row) for _, row in filtered.iterrows())
+    assert _rows_contain(filtered, "CM12345").all()
 
 
-def test_filter_by_entity_substring():
+def test_filter_by_entity_substring(sample_logs_session):
     """Test substring matching in entity filter."""
     processor = LogProcessor(SAMPLE_LOG)
-    logs = processor.read_all_logs()
+    logs = sample_logs_session
     
     # Filter for any CM entity
     filtered = processor.filter_by_entity(logs, "message", "CM", exact_match=False)
@@ -69,10 +95,10 @@ def test_filter_by_entity_substring():
     assert len(filtered) > 0
 
 
-def test_filter_by_timerange():
+def test_filter_by_timerange(sample_logs):
     """Test filtering logs by time range."""
     processor = LogProcessor(SAMPLE_LOG)
-    logs = processor.read_all_logs()
+    logs = sample_logs
     
     # Filter for specific time range
     filtered = processor.filter_by_timerange(
@@ -86,10 +112,10 @@ def test_filter_by_timerange():
     assert len(filtered) < len(logs)
 
 
-def test_extract_entities():
+def test_extract_entities(sample_logs_session):
     """Test entity extraction from logs."""
     processor = LogProcessor(SAMPLE_LOG)
-    logs = processor.read_all_logs()
+    logs = sample_logs_session
     
     # Extract CM entities
     entities = processor.extract_entities(logs, "cm")
@@ -97,14 +123,14 @@ def test_extract_entities():
     assert isinstance(entities, dict)
     assert len(entities) > 0
     
-    # Check that CM12345 is found
-    assert any("12345" in entity for entity in entities.keys())
+    # Check that CM12345 is found (keys are the matched IDs themselves)
+    assert "CM12345" in entities
 
 
-def test_get_context_around_line():
+def test_get_context_around_line(sample_logs_session):
     """Test getting context lines around a specific entry."""
     processor = LogProcessor(SAMPLE_LOG)
-    logs = processor.read_all_logs()
+    logs = sample_logs_session
     
     # Get context around line 10
     context = processor.get_context_around_line(logs, 10, before_lines=5, after_lines=5)
@@ -113,25 +139,23 @@ def test_get_context_around_line():
     assert len(context) <= 11  # 5 before + 1 target + 5 after
 
 
-def test_search_text():
+def test_search_text(sample_logs_session):
     """Test text search across logs."""
     processor = LogProcessor(SAMPLE_LOG)
-    logs = processor.read_all_logs()
+    logs = sample_logs_session
     
     # Search for "error" in logs
     results = processor.search_text(logs, "error", case_sensitive=False)
     
     assert len(results) > 0
     # Verify each result contains "error" (case-insensitive)
-    for _, row in results.iterrows():
-        row_text = " ".join(str(val) for val in row.values).lower()
-        assert "error" in row_text
+    assert results.astype(str).agg(" ".join, axis=1).str.lower().str.contains("error", regex=False).all()
 
 
-def test_filter_by_severity():
+def test_filter_by_severity(sample_logs_session):
     """Test filtering logs by severity level."""
     processor = LogProcessor(SAMPLE_LOG)
-    logs = processor.read_all_logs()
+    logs = sample_logs_session
     
     # Filter for ERROR and above
     filtered = processor.filter_by_severity(logs, min_severity="ERROR")
@@ -140,15 +164,13 @@ def test_filter_by_severity():
     assert len(filtered) < len(logs)
     
     # All entries should be ERROR or CRITICAL
-    for _, row in filtered.iterrows():
-        severity = str(row.get("severity", "")).upper()
-        assert severity in ["ERROR", "CRITICAL", "FATAL"]
+    assert filtered["severity"].astype(str).str.upper().isin(["ERROR", "CRITICAL", "FATAL"]).all()
 
 
-def test_get_statistics():
+def test_get_statistics(sample_logs):
     """Test getting log statistics."""
     processor = LogProcessor(SAMPLE_LOG)
-    logs = processor.read_all_logs()
+    logs = sample_logs
     
     stats = processor.get_statistics(logs)
     
@@ -159,10 +181,10 @@ def test_get_statistics():
     assert "severity_counts" in stats
 
 
-def test_multiple_filters():
+def test_multiple_filters(sample_logs_session):
     """Test combining multiple filters."""
     processor = LogProcessor(SAMPLE_LOG)
-    logs = processor.read_all_logs()
+    logs = sample_logs_session
     
     # Filter by entity
     filtered = processor.filter_by_entity(logs, "entity_id", "CM12345")
@@ -172,10 +194,10 @@ def test_multiple_filters():
     
     assert len(filtered) >= 0
     # All entries should have CM12345 and severity >= WARN
-    for _, row in filtered.iterrows():
-        assert "CM12345" in str(row)
-        severity = str(row.get("severity", "")).upper()
-        assert severity in ["WARN", "WARNING", "ERROR", "CRITICAL", "FATAL"]
+    assert _rows_contain(filtered, "CM12345").all()
+    assert filtered["severity"].astype(str).str.upper().isin(
+        ["WARN", "WARNING", "ERROR", "CRITICAL", "FATAL"]
+    ).all()
 
 
 if __name__ == "__main__":
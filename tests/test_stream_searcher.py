@@ -2,14 +2,36 @@
 Independent Test Script for StreamSearcher
 
 Tests the streaming CSV search engine without any tool integration.
+main() runs the tests in worker processes (one per CPU) and prints each
+test's output in order once it finishes.
 """
 
+import importlib.util
+import io
+import mmap
+import os
+import statistics
 import sys
+import tempfile
 import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from itertools import islice
+from pathlib import Path
 sys.path.insert(0, '.')
 
 from src.core.stream_searcher import StreamSearcher
 
+# MAC address pattern; StreamSearcher compiles it once and caches it
+MAC_PATTERN = r"(?:[0-9a-f]{2}:){5}[0-9a-f]{2}"
+
+# Timed runs per method in performance_comparison (after one warm-up)
+BENCH_REPEATS = 5
+
+# One searcher shared by the tests below (cache-less tests build their own)
+SEARCHER = StreamSearcher("test.csv") if Path("test.csv").exists() else None
+
 
 def test_basic_search():
     """Test basic text search."""
@@ -17,15 +39,15 @@ def test_basic_search():
     print("TEST 1: Basic Search")
     print("="*70)
     
-    searcher = StreamSearcher("test.csv")
+    searcher = SEARCHER
     
     # Search for a MAC address
     search_term = "2c:ab:a4:47:1a:d2"
     print(f"\nSearching for: {search_term}")
     
-    start_time = time.time()
+    start_time = time.perf_counter()
     results = searcher.search(search_term)
-    elapsed = time.time() - start_time
+    elapsed = time.perf_counter() - start_time
     
     print(f"✓ Found {len(results)} matches")
     print(f"⏱ Time: {elapsed*1000:.2f}ms")
@@ -46,14 +68,14 @@ def test_count_only():
     print("TEST 2: Count Only (Fast)")
     print("="*70)
     
-    searcher = StreamSearcher("test.csv")
+    searcher = SEARCHER
     
     search_term = "ERROR"
     print(f"\nCounting: {search_term}")
     
-    start_time = time.time()
+    start_time = time.perf_counter()
     count = searcher.count_matches(search_term)
-    elapsed = time.time() - start_time
+    elapsed = time.perf_counter() - start_time
     
     print(f"✓ Found {count} matches")
     print(f"⏱ Time: {elapsed*1000:.2f}ms")
@@ -67,21 +89,21 @@ def test_case_sensitive():
     print("TEST 3: Case Sensitive vs Insensitive")
     print("="*70)
     
-    searcher = StreamSearcher("test.csv")
+    searcher = SEARCHER
     
     search_term = "error"
     
     print(f"\nSearching for: {search_term}")
     
     # Case insensitive
-    start_time = time.time()
+    start_time = time.perf_counter()
     results_insensitive = searcher.search(search_term, case_sensitive=False)
-    time_insensitive = time.time() - start_time
+    time_insensitive = time.perf_counter() - start_time
     
     # Case sensitive
-    start_time = time.time()
+    start_time = time.perf_counter()
     results_sensitive = searcher.search(search_term, case_sensitive=True)
-    time_sensitive = time.time() - start_time
+    time_sensitive = time.perf_counter() - start_time
     
     print(f"✓ Case insensitive: {len(results_insensitive)} matches ({time_insensitive*1000:.2f}ms)")
     print(f"✓ Case sensitive: {len(results_sensitive)} matches ({time_sensitive*1000:.2f}ms)")
@@ -95,16 +117,16 @@ def test_max_results():
     print("TEST 4: Limited Results")
     print("="*70)
     
-    searcher = StreamSearcher("test.csv")
+    searcher = SEARCHER
     
     search_term = "ulc-mulpi"
     max_results = 10
     
     print(f"\nSearching for: {search_term} (max {max_results} results)")
     
-    start_time = time.time()
+    start_time = time.perf_counter()
     results = searcher.search(search_term, max_results=max_results)
-    elapsed = time.time() - start_time
+    elapsed = time.perf_counter() - start_time
     
     print(f"✓ Found {len(results)} matches (stopped at limit)")
     print(f"⏱ Time: {elapsed*1000:.2f}ms (faster due to early stop)")
@@ -118,7 +140,7 @@ def test_column_specific():
     print("TEST 5: Column-Specific Search")
     print("="*70)
     
-    searcher = StreamSearcher("test.csv")
+    searcher = SEARCHER
     
     search_term = "Nov 5, 2025"
     columns = ["_source.date"]
@@ -126,9 +148,9 @@ def test_column_specific():
     print(f"\nSearching for: {search_term}")
     print(f"In columns: {columns}")
     
-    start_time = time.time()
+    start_time = time.perf_counter()
     results = searcher.search(search_term, columns=columns)
-    elapsed = time.time() - start_time
+    elapsed = time.perf_counter() - start_time
     
     print(f"✓ Found {len(results)} matches")
     print(f"⏱ Time: {elapsed*1000:.2f}ms")
@@ -142,16 +164,16 @@ def test_json_field_search():
     print("TEST 6: JSON Field Search")
     print("="*70)
     
-    searcher = StreamSearcher("test.csv")
+    searcher = SEARCHER
     
     # Search for MdId which is inside JSON
     search_term = '"MdId":"0x64030000"'
     
     print(f"\nSearching for JSON field: {search_term}")
     
-    start_time = time.time()
+    start_time = time.perf_counter()
     results = searcher.search(search_term)
-    elapsed = time.time() - start_time
+    elapsed = time.perf_counter() - start_time
     
     print(f"✓ Found {len(results)} matches")
     print(f"⏱ Time: {elapsed*1000:.2f}ms")
@@ -168,17 +190,14 @@ def test_regex_search():
     print("TEST 7: Regex Search")
     print("="*70)
     
-    searcher = StreamSearcher("test.csv")
+    searcher = SEARCHER
     
-    # MAC address pattern
-    pattern = r"[0-9a-f]{2}:[0-9a-f]{2}:[0-9a-f]{2}:[0-9a-f]{2}:[0-9a-f]{2}:[0-9a-f]{2}"
-    
-    print(f"\nSearching with regex: {pattern}")
+    print(f"\nSearching with regex: {MAC_PATTERN}")
     print("(Looking for MAC addresses)")
     
-    start_time = time.time()
-    results = searcher.search(pattern, regex=True, max_results=5)
-    elapsed = time.time() - start_time
+    start_time = time.perf_counter()
+    results = searcher.search(MAC_PATTERN, regex=True, max_results=5)
+    elapsed = time.perf_counter() - start_time
     
     print(f"✓ Found {len(results)} matches")
     print(f"⏱ Time: {elapsed*1000:.2f}ms")
@@ -186,55 +205,242 @@ def test_regex_search():
     return len(results) > 0
 
 
+def test_cached_search():
+    """Test that repeated searches are served from the result cache."""
+    print("\n" + "="*70)
+    print("TEST 8: Cached Search")
+    print("="*70)
+    
+    searcher = SEARCHER
+    search_term = "CmDsa"
+    
+    # Earlier tests may already have cached this term
+    searcher.clear_cache()
+    
+    start_time = time.perf_counter()
+    first = searcher.search(search_term)
+    first_elapsed = time.perf_counter() - start_time
+    
+    start_time = time.perf_counter()
+    second = searcher.search(search_term)
+    second_elapsed = time.perf_counter() - start_time
+    
+    print(f"✓ First search: {len(first)} matches in {first_elapsed*1000:.2f}ms")
+    print(f"✓ Cached search: {len(second)} matches in {second_elapsed*1000:.2f}ms")
+    
+    uncached = StreamSearcher("test.csv", cache_size=0).search(search_term)
+    assert not first.empty, f"no matches for {search_term}"
+    assert first.equals(uncached)
+    assert second.equals(uncached)
+    assert len(searcher._search_cache) == 1
+    
+    # Mutating a returned frame must not leak into the cache
+    second.drop(second.index, inplace=True)
+    third = searcher.search(search_term)
+    assert third.equals(uncached)
+
+
+def test_iter_search():
+    """Test lazily streaming matches without building a DataFrame."""
+    print("\n" + "="*70)
+    print("TEST 9: Iterator Search")
+    print("="*70)
+    
+    searcher = StreamSearcher("test.csv", cache_size=0)
+    search_term = "CmMacAddress"
+    
+    rows = list(searcher.iter_search(search_term))
+    results = searcher.search(search_term)
+    first_three = list(islice(searcher.iter_search(search_term), 3))
+    
+    print(f"✓ Streamed {len(rows)} rows (search(): {len(results)})")
+    print(f"✓ First 3 via islice: {len(first_three)} rows")
+    
+    assert rows, f"no matches for {search_term}"
+    assert rows == results.values.tolist()
+    assert first_three == rows[:3]
+
+
+def test_literal_regex_search():
+    """Test that a regex without metacharacters matches like a plain search."""
+    print("\n" + "="*70)
+    print("TEST 10: Literal Regex Search")
+    print("="*70)
+    
+    searcher = StreamSearcher("test.csv", cache_size=0)
+    search_term = "CmDsa"
+    
+    plain = searcher.search(search_term)
+    as_regex = searcher.search(search_term, regex=True)
+    as_regex_upper = searcher.search(search_term.upper(), regex=True)
+    
+    print(f"✓ Plain: {len(plain)} matches, regex: {len(as_regex)}, "
+          f"uppercased regex: {len(as_regex_upper)}")
+    
+    assert not plain.empty, f"no matches for {search_term}"
+    assert plain.equals(as_regex)
+    assert plain.equals(as_regex_upper)
+
+
+def test_multiline_quoted_field():
+    """Test that a quoted field spanning lines is searched as one record."""
+    print("\n" + "="*70)
+    print("TEST 12: Multi-line Quoted Field")
+    print("="*70)
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        csv_path = Path(tmp_dir) / "multiline.csv"
+        csv_path.write_text('a,b,c\n1,"hello\nworld foo",x\n2,bar,y\n3,baz,x\n')
+        searcher = StreamSearcher(str(csv_path), cache_size=0)
+        
+        expected = {
+            "foo": [["1", "hello\nworld foo", "x"]],
+            "world": [["1", "hello\nworld foo", "x"]],
+            "x": [["1", "hello\nworld foo", "x"], ["3", "baz", "x"]],
+        }
+        for search_term, rows in expected.items():
+            for case_sensitive in (True, False):
+                results = searcher.search(search_term, case_sensitive=case_sensitive)
+                assert results.values.tolist() == rows, (search_term, results.values.tolist())
+                assert searcher.count_matches(search_term, case_sensitive=case_sensitive) == len(rows)
+    
+    print("✓ Records with embedded newlines match whole")
+
+
+def test_arrow_backend():
+    """Test that the pyarrow engine finds the same rows as the streaming one."""
+    print("\n" + "="*70)
+    print("TEST 11: Arrow Backend")
+    print("="*70)
+    
+    if importlib.util.find_spec("pyarrow") is None:
+        print("⚠ pyarrow not installed, skipping")
+        return
+    
+    searcher = StreamSearcher("test.csv", cache_size=0, engine="pyarrow")
+    search_term = "CmDsa"
+    columns = ["_source.log"]
+    
+    start_time = time.perf_counter()
+    results = searcher.search(search_term, columns=columns)
+    elapsed = time.perf_counter() - start_time
+    expected = SEARCHER.search(search_term, columns=columns)
+    
+    print(f"✓ Found {len(results)} matches (streaming: {len(expected)})")
+    print(f"⏱ Time: {elapsed*1000:.2f}ms")
+    
+    assert not expected.empty, f"no matches for {search_term}"
+    assert results.values.tolist() == expected.values.tolist()
+
+
+def _bench(fn, repeats=None):
+    """
+    Time fn() with perf_counter_ns after one warm-up call.
+    
+    Args:
+        fn: Callable to time
+        repeats: Timed runs (default BENCH_REPEATS)
+        
+    Returns:
+        (result of the last run, median seconds, median absolute deviation)
+    """
+    result = fn()  # warm-up: page cache, lazy imports, compiled patterns
+    times = []
+    for _ in range(repeats or BENCH_REPEATS):
+        start = time.perf_counter_ns()
+        result = fn()
+        times.append(time.perf_counter_ns() - start)
+    median = statistics.median(times)
+    mad = statistics.median(abs(t - median) for t in times)
+    return result, median / 1e9, mad / 1e9
+
+
+def _format_bench(median, mad):
+    """Format a _bench() timing as 'median ± MAD' in milliseconds."""
+    return f"{median*1000:.2f}ms ± {mad*1000:.2f}ms"
+
+
 def performance_comparison():
     """Compare streaming vs full load."""
     print("\n" + "="*70)
     print("PERFORMANCE COMPARISON")
     print("="*70)
     
+    import numpy as np
     import pandas as pd
     
     search_term = "2c:ab:a4:47:1a:d2"
     
-    # Method 1: Full load (old way)
+    # Map the file once and ask the kernel to page it in, so neither method
+    # below pays (or is credited with) a cold disk read
+    with open("test.csv", "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if hasattr(mmap, "MADV_WILLNEED"):
+        mm.madvise(mmap.MADV_WILLNEED)
+    
+    # Method 1: Full load (old way), parsed straight from the mapped pages
     print("\nMethod 1: Load all + Search (OLD)")
-    start_time = time.time()
-    df = pd.read_csv("test.csv", encoding='utf-8', on_bad_lines='skip')
-    load_time = time.time() - start_time
-    
-    start_search = time.time()
-    mask = df.astype(str).apply(
-        lambda row: any(search_term in str(cell) for cell in row), axis=1
-    )
-    results_old = df[mask]
-    search_time = time.time() - start_search
+    
+    def load_all():
+        mm.seek(0)
+        return pd.read_csv(mm, encoding='utf-8', on_bad_lines='skip')
+    
+    df, load_time, load_mad = _bench(load_all)
+    mm.close()
+    
+    def search_loaded():
+        # Column-wise substring test, OR-ed across columns
+        mask = np.zeros(len(df), dtype=bool)
+        for col in df.columns:
+            mask |= df[col].astype(str).str.contains(search_term, regex=False, na=False).to_numpy()
+        return df[mask]
+    
+    results_old, search_time, search_mad = _bench(search_loaded)
     total_old = load_time + search_time
     
-    print(f"  Load time: {load_time*1000:.2f}ms")
-    print(f"  Search time: {search_time*1000:.2f}ms")
+    print(f"  Load time: {_format_bench(load_time, load_mad)}")
+    print(f"  Search time: {_format_bench(search_time, search_mad)}")
     print(f"  Total: {total_old*1000:.2f}ms")
     print(f"  Found: {len(results_old)} matches")
     print(f"  Memory: ~{df.memory_usage(deep=True).sum() / 1024 / 1024:.2f} MB")
     
-    # Method 2: Streaming (new way)
+    # Method 2: Streaming (new way); no result cache, so every run searches
     print("\nMethod 2: Stream + Search (NEW)")
-    searcher = StreamSearcher("test.csv")
+    searcher = StreamSearcher("test.csv", cache_size=0)
     
-    start_time = time.time()
-    results_new = searcher.search(search_term)
-    total_new = time.time() - start_time
+    results_new, total_new, total_mad = _bench(lambda: searcher.search(search_term))
     
-    print(f"  Total: {total_new*1000:.2f}ms")
+    print(f"  Total: {_format_bench(total_new, total_mad)}")
     print(f"  Found: {len(results_new)} matches")
     print(f"  Memory: Minimal (streaming)")
     
     # Comparison
-    print(f"\n📊 SPEEDUP: {total_old/total_new:.2f}x faster")
+    print(f"\n📊 SPEEDUP: {total_old/total_new:.2f}x faster (medians of {BENCH_REPEATS} runs)")
     print(f"💾 MEMORY SAVED: ~{df.memory_usage(deep=True).sum() / 1024 / 1024:.2f} MB")
     
     return total_new < total_old
 
 
+def _run_test(test):
+    """
+    Run one (name, func) test with its output captured.
+    
+    Returns:
+        (passed, output) so parallel runs can be printed in order
+    """
+    test_name, test_func = test
+    output = io.StringIO()
+    with redirect_stdout(output):
+        try:
+            # Asserting tests return None; the older ones still return a bool
+            passed = test_func() is not False
+        except Exception as e:
+            print(f"\n✗ {test_name} FAILED: {e}")
+            traceback.print_exc(file=output)
+            passed = False
+    return passed, output.getvalue()
+
+
 def main():
     """Run all tests."""
     print("="*70)
@@ -243,6 +449,10 @@ def main():
     print("\nTesting streaming CSV search without tool integration")
     print("Log file: test.csv")
     
+    if SEARCHER is None:
+        print("\n✗ test.csv not found - run from the repository root")
+        return
+    
     tests = [
         ("Basic Search", test_basic_search),
         ("Count Only", test_count_only),
@@ -251,19 +461,27 @@ def main():
         ("Column Specific", test_column_specific),
         ("JSON Field Search", test_json_field_search),
         ("Regex Search", test_regex_search),
+        ("Cached Search", test_cached_search),
+        ("Iterator Search", test_iter_search),
+        ("Literal Regex Search", test_literal_regex_search),
+        ("Arrow Backend", test_arrow_backend),
+        ("Multi-line Quoted Field", test_multiline_quoted_field),
     ]
     
     results = []
     
-    for test_name, test_func in tests:
-        try:
-            passed = test_func()
+    # The tests are independent; after the first scan the others read
+    # test.csv from the page cache, so they overlap well across processes
+    workers = min(len(tests), os.cpu_count() or 1)
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        runs = executor.map(_run_test, tests) if executor else map(_run_test, tests)
+        for (test_name, _), (passed, output) in zip(tests, runs):
+            print(output, end="")
             results.append((test_name, passed))
-        except Exception as e:
-            print(f"\n✗ {test_name} FAILED: {e}")
-            import traceback
-            traceback.print_exc()
-            results.append((test_name, False))
+    finally:
+        if executor:
+            executor.shutdown()
     
     # Performance comparison
     print("\n")
@@ -0,0 +1,58 @@
+"""
+Per-thread stdout capture for the test scripts that run tests on threads.
+
+contextlib.redirect_stdout swaps the process-wide sys.stdout, so it can't
+keep concurrent workers apart; ThreadLocalOutput is installed once and
+routes each thread's writes to that thread's own buffer instead.
+"""
+
+import io
+import sys
+import threading
+from contextlib import contextmanager
+
+
+class ThreadLocalOutput(io.TextIOBase):
+    """sys.stdout stand-in that sends each thread's writes to its own buffer."""
+
+    def __init__(self, default):
+        self.default = default
+        self._local = threading.local()
+
+    @contextmanager
+    def capturing(self):
+        """
+        Collect the current thread's writes for the duration of the block.
+
+        Yields:
+            StringIO holding everything the thread printed
+        """
+        buffer = io.StringIO()
+        self._local.buffer = buffer
+        try:
+            yield buffer
+        finally:
+            self._local.buffer = None
+
+    def write(self, text):
+        buffer = getattr(self._local, "buffer", None)
+        return (buffer or self.default).write(text)
+
+    def flush(self):
+        self.default.flush()
+
+
+@contextmanager
+def thread_local_stdout():
+    """
+    Install a ThreadLocalOutput as sys.stdout for the duration of the block.
+
+    Yields:
+        The installed ThreadLocalOutput
+    """
+    stdout = ThreadLocalOutput(sys.stdout)
+    sys.stdout = stdout
+    try:
+        yield stdout
+    finally:
+        sys.stdout = stdout.default